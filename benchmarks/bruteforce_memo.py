@@ -0,0 +1,157 @@
+# Copyright (C) 2026 TU Dresden
+# Licensed under the ISC license (see LICENSE.txt)
+
+"""Measure the state memory table of the bruteforce-memo scheduler.
+
+For an increasing number of jobs, this script schedules jobs of a synthetic
+two-process application on the odroid platform with
+:class:`~mocasin.tetris.scheduler.bruteforce_memo.BruteforceMemoScheduler`.
+All operations on its state memory table are recorded and replayed on the
+indexed table and on a linear scan over all states (the previous
+implementation). The columns report the scheduling time, the final number of
+states, the number of lookups and the total time of all lookups.
+
+Usage::
+
+    python benchmarks/bruteforce_memo.py [--max-jobs N]
+"""
+
+import argparse
+from time import perf_counter
+
+from mocasin.common.graph import DataflowGraph, DataflowProcess
+from mocasin.mapper.partial import ComFullMapper, ProcPartialMapper
+from mocasin.platforms.odroid import DesignerPlatformOdroid
+from mocasin.platforms.platformDesigner import genericProcessor
+from mocasin.tetris.job_request import JobRequestInfo
+from mocasin.tetris.job_state import Job
+from mocasin.tetris.schedule import ENERGY_EPS, TIME_EPS
+from mocasin.tetris.scheduler import bruteforce_memo
+
+IndexedTable = bruteforce_memo.StateMemoryTable
+
+# process mapping, execution time, energy
+MAPPINGS = [
+    ([0, 0], 10.2, 21.45),
+    ([0, 3], 5.2, 31.15),
+    ([0, 2], 9.7, 23.45),
+    ([1, 1], 6.0, 35.45),
+    ([1, 3], 4.32, 39.1),
+    ([4, 5], 2.1, 60.3),
+]
+
+
+class RecordingTable(IndexedTable):
+    """A state memory table recording all its operations."""
+
+    log = None
+
+    def find_min_energy_from_state(self, task_comp, time, exclude_list=[]):
+        RecordingTable.log.append(("find", list(task_comp), time))
+        return self.lookup(task_comp, time)
+
+    def lookup(self, task_comp, time):
+        return super().find_min_energy_from_state(task_comp, time)
+
+    def add_state(self, task_comp, time, min_energy):
+        RecordingTable.log.append(("add", list(task_comp), time, min_energy))
+        # do not record the lookup within add_state
+        self.find_min_energy_from_state = self.lookup
+        super().add_state(task_comp, time, min_energy)
+        del self.find_min_energy_from_state
+
+
+class LinearTable:
+    """The state memory table scanning all states on each lookup."""
+
+    def __init__(self):
+        self.states = []
+
+    def find_min_energy_from_state(self, task_comp, time):
+        max_energy = 0
+        found = False
+        for s_comp, s_time, s_energy in self.states:
+            if s_time > time + TIME_EPS:
+                continue
+            if any(msc + TIME_EPS < tc for msc, tc in zip(s_comp, task_comp)):
+                continue
+            found = True
+            max_energy = max(max_energy, s_energy)
+        return max_energy if found else None
+
+    def add_state(self, task_comp, time, min_energy):
+        current_e = self.find_min_energy_from_state(task_comp, time)
+        if current_e is not None and min_energy < current_e + ENERGY_EPS:
+            return
+        self.states.append((task_comp, time, min_energy))
+
+
+def replay(table, log):
+    start = perf_counter()
+    for op in log:
+        if op[0] == "find":
+            table.find_min_energy_from_state(op[1], op[2])
+        else:
+            table.add_state(op[1], op[2], op[3])
+    return perf_counter() - start
+
+
+def make_jobs(num_jobs):
+    platform = DesignerPlatformOdroid(
+        genericProcessor("proc_type_0"), genericProcessor("proc_type_1")
+    )
+    graph = DataflowGraph("graph")
+    graph.add_process(DataflowProcess("a"))
+    graph.add_process(DataflowProcess("b"))
+    mapper = ProcPartialMapper(graph, platform, ComFullMapper(platform))
+    mappings = []
+    for from_list, exec_time, energy in MAPPINGS:
+        mapping = mapper.generate_mapping(from_list)
+        mapping.metadata.exec_time = exec_time
+        mapping.metadata.energy = energy
+        mappings.append(mapping)
+    jobs = []
+    for i in range(num_jobs):
+        request = JobRequestInfo(
+            graph, mappings, arrival=0.0, deadline=8.0 + 4.0 * i
+        )
+        job = Job.from_request(request)
+        job.dispatch()
+        jobs.append(job)
+    return platform, jobs
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--max-jobs", type=int, default=5)
+    args = parser.parse_args()
+
+    bruteforce_memo.StateMemoryTable = RecordingTable
+    print(
+        f"{'jobs':>4}{'schedule [s]':>14}{'states':>8}{'lookups':>9}"
+        f"{'indexed [s]':>13}{'linear [s]':>12}{'speedup':>9}"
+    )
+    for num_jobs in range(1, args.max_jobs + 1):
+        platform, jobs = make_jobs(num_jobs)
+        scheduler = bruteforce_memo.BruteforceMemoScheduler(
+            platform, bf_dump_steps=1000000, dump_mem_table=False
+        )
+        RecordingTable.log = []
+        start = perf_counter()
+        scheduler.schedule(jobs)
+        elapsed = perf_counter() - start
+        log = RecordingTable.log
+
+        table = IndexedTable(num_jobs)
+        indexed = replay(table, log)
+        linear = replay(LinearTable(), log)
+        # each operation performs one lookup
+        lookups = len(log)
+        print(
+            f"{num_jobs:>4}{elapsed:>14.2f}{table.size():>8}{lookups:>9}"
+            f"{indexed:>13.3f}{linear:>12.3f}{linear / indexed:>9.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+# Copyright (C) 2026 TU Dresden
+# Licensed under the ISC license (see LICENSE.txt)
+
+"""Measure the calculation of canonical mappings under platform symmetries.
+
+For each symmetries JSON file of the bundled platforms, this script
+calculates the canonical representatives of random mapping vectors with the
+stabilizer chain used when mpsym is not available, with the previous python
+fallback (:meth:`PermutationGroup.tuple_normalize`), and with mpsym if it is
+installed. The stabilizer chain is measured twice: "cold" includes building
+the chain and calculating stabilizers on demand, "warm" repeats the same
+vectors afterwards. The column "not minimal" counts the vectors for which
+the previous fallback did not find the smallest representative.
+
+Usage::
+
+    python benchmarks/canonicalization.py [--vectors N] [--processes D]
+"""
+
+import argparse
+import glob
+import os
+import random
+from time import perf_counter
+
+from mocasin.representations.automorphisms import symmetries_from_json
+from mocasin.representations.permutations import (
+    Permutation,
+    PermutationGroup,
+    StabilizerChain,
+)
+
+try:
+    import mpsym
+except ImportError:
+    mpsym = None
+
+SYMMETRIES_DIR = os.path.join(
+    os.path.dirname(__file__), "..", "mocasin", "platforms", "symmetries"
+)
+
+
+def measure(function, vectors):
+    start = perf_counter()
+    results = [function(v) for v in vectors]
+    return (perf_counter() - start) / len(vectors), results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--vectors", type=int, default=1000)
+    parser.add_argument("--processes", type=int, default=16)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    print(
+        f"{'platform':<16}{'cores':>6}{'cold [ms]':>11}{'warm [ms]':>11}"
+        f"{'previous [ms]':>15}{'not minimal':>13}{'mpsym [ms]':>12}"
+    )
+    for path in sorted(glob.glob(os.path.join(SYMMETRIES_DIR, "*.json"))):
+        name = os.path.splitext(os.path.basename(path))[0]
+        n, generators = symmetries_from_json(path)
+        group = PermutationGroup([Permutation(g) for g in generators])
+        rng = random.Random(args.seed)
+        vectors = [
+            [rng.randrange(n) for _ in range(args.processes)]
+            for _ in range(args.vectors)
+        ]
+
+        start = perf_counter()
+        chain = StabilizerChain(group)
+        _, expected = measure(chain.representative, vectors)
+        cold = (perf_counter() - start) / len(vectors)
+        warm, _ = measure(chain.representative, vectors)
+        previous, results = measure(group.tuple_normalize, vectors)
+        not_minimal = sum(r != e for r, e in zip(results, expected))
+
+        line = (
+            f"{name:<16}{n:>6}{cold * 1000:>11.3f}{warm * 1000:>11.3f}"
+            f"{previous * 1000:>15.3f}{not_minimal:>13}"
+        )
+        if mpsym is not None:
+            ag = mpsym.ArchGraphSystem.from_json_file(path)
+            ag.automorphisms()
+            reference, _ = measure(ag.representative, vectors)
+            line += f"{reference * 1000:>12.3f}"
+        else:
+            line += f"{'n/a':>12}"
+        print(line)
+
+
+if __name__ == "__main__":
+    main()
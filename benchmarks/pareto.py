@@ -0,0 +1,116 @@
+# Copyright (C) 2026 TU Dresden
+# Licensed under the ISC license (see LICENSE.txt)
+
+"""Measure the Pareto filtering of mappings for different front sizes.
+
+This script generates random mappings of a graph with four processes on the
+odroid platform. The execution time and energy of each mapping are drawn
+around a trade-off curve. The smaller the noise, the more mappings lie on the
+front. The filtering is measured with :func:`filter_pareto_front`, with
+:class:`ParetoArchive` and with the previous implementation, which compares
+the 0-1 processor costs, the execution time and the energy of all mappings at
+once. The previous implementation is skipped for more than `--max-previous`
+mappings.
+
+Usage::
+
+    python benchmarks/pareto.py [--mappings N [N ...]] [--max-previous N]
+"""
+
+import argparse
+import random
+from time import perf_counter
+
+import numpy as np
+
+from mocasin.common.graph import DataflowGraph, DataflowProcess
+from mocasin.mapper.pareto import ParetoArchive, filter_pareto_front
+from mocasin.mapper.partial import ComFullMapper, ProcPartialMapper
+from mocasin.platforms.odroid import DesignerPlatformOdroid
+from mocasin.platforms.platformDesigner import genericProcessor
+
+NOISES = [1.0, 0.1, 0.01]
+
+
+def previous_filter(mappings):
+    processors = mappings[0].platform.processors()
+    costs = np.empty((0, len(processors) + 2), float)
+    for m in mappings:
+        procs = m.get_used_processors()
+        lm = [int(p in procs) for p in processors]
+        lm += [m.metadata.exec_time, m.metadata.energy]
+        costs = np.append(costs, [lm], axis=0)
+    is_efficient = np.ones(costs.shape[0], dtype=bool)
+    for i, c in enumerate(costs):
+        if is_efficient[i]:
+            is_efficient[is_efficient] = np.any(costs[is_efficient] < c, axis=1)
+            is_efficient[i] = True
+    return [m for m, f in zip(mappings, is_efficient) if f]
+
+
+def generate_mappings(mapper, num_mappings, noise, rng):
+    mappings = []
+    for _ in range(num_mappings):
+        mapping = mapper.generate_mapping([rng.randrange(8) for _ in range(4)])
+        x = rng.random()
+        mapping.metadata.exec_time = x + noise * rng.random()
+        mapping.metadata.energy = 1 / (x + 0.1) + noise * rng.random()
+        mappings.append(mapping)
+    return mappings
+
+
+def measure(function, mappings):
+    start = perf_counter()
+    result = function(mappings)
+    return perf_counter() - start, result
+
+
+def archive_filter(mappings):
+    archive = ParetoArchive()
+    archive.update(mappings)
+    return archive.mappings()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--mappings", type=int, nargs="+", default=[1000, 10000, 50000]
+    )
+    parser.add_argument("--max-previous", type=int, default=10000)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    platform = DesignerPlatformOdroid(
+        genericProcessor("ARM_CORTEX_A7"), genericProcessor("ARM_CORTEX_A15")
+    )
+    graph = DataflowGraph("graph")
+    for i in range(4):
+        graph.add_process(DataflowProcess(f"p{i}"))
+    mapper = ProcPartialMapper(graph, platform, ComFullMapper(platform))
+    rng = random.Random(args.seed)
+
+    print(
+        f"{'mappings':>9}{'noise':>7}{'front':>7}{'filter [ms]':>13}"
+        f"{'archive [ms]':>14}{'previous [ms]':>15}"
+    )
+    for num_mappings in args.mappings:
+        for noise in NOISES:
+            mappings = generate_mappings(mapper, num_mappings, noise, rng)
+            new, front = measure(filter_pareto_front, mappings)
+            archive, archived = measure(archive_filter, mappings)
+            assert archived == front
+            line = (
+                f"{num_mappings:>9}{noise:>7}{len(front):>7}"
+                f"{new * 1000:>13.1f}{archive * 1000:>14.1f}"
+            )
+            if num_mappings <= args.max_previous:
+                previous, expected = measure(previous_filter, mappings)
+                assert expected == front
+                line += f"{previous * 1000:>15.1f}"
+            else:
+                line += f"{'n/a':>15}"
+            print(line)
+
+
+if __name__ == "__main__":
+    main()
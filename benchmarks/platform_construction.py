@@ -0,0 +1,128 @@
+# Copyright (C) 2026 TU Dresden
+# Licensed under the ISC license (see LICENSE.txt)
+
+"""Measure the platform construction time against the number of cores.
+
+This script builds synthetic many-core platforms with the platform designer.
+Every core is attached to a router of a network on chip with a mesh (Y-X
+routing) or a torus (shortest-path routing) topology. For each platform, it
+measures the time to build the platform including the NoC primitives, and
+the time of :meth:`~mocasin.common.platform.Platform.generate_all_primitives`.
+Both are measured once with the precomputed routing tables and once with the
+previous behavior of searching a route for every pair of nodes.
+
+Usage::
+
+    python benchmarks/platform_construction.py [--sizes 4 8 12]
+"""
+
+import argparse
+from contextlib import contextmanager
+from time import process_time
+from unittest import mock
+
+from mocasin.common.platform import (
+    CommunicationResource,
+    CommunicationResourceType,
+    FrequencyDomain,
+    Platform,
+)
+from mocasin.platforms.platformDesigner import (
+    PlatformDesigner,
+    cluster,
+    genericProcessor,
+)
+from mocasin.platforms.topologies import meshTopology, torusTopology
+
+TOPOLOGIES = {"mesh": meshTopology, "torus": torusTopology}
+
+
+class NocPlatform(Platform):
+    def __init__(self, size, topology):
+        super().__init__(f"noc_{size}x{size}")
+        designer = PlatformDesigner(self)
+        designer.setSchedulingPolicy("FIFO", 1000)
+        chip = cluster("chip", designer)
+        processor = genericProcessor("proc_type_0")
+        routers = []
+        for i in range(size * size):
+            pe = chip.addPeToCluster(
+                f"pe_{i:04d}",
+                processor.type,
+                processor.frequency_domain,
+                processor.power_model,
+                processor.context_load_cycles,
+                processor.context_store_cycles,
+            )
+            router = chip.addRouter(
+                f"router_{i:04d}", 100, 150, 100, 60, 6000000.0
+            )
+            designer.connectComponents(pe, router)
+            routers.append(router)
+
+        fd = FrequencyDomain("fd_electric", 6000000.0)
+        pl = CommunicationResource(
+            "electric",
+            fd,
+            CommunicationResourceType.PhysicalLink,
+            100,
+            150,
+            100,
+            60,
+        )
+        noc = designer.createNetwork("electric", routers, topology, pl)
+        designer.generatePrimitivesForNoc(noc)
+
+
+class PerQueryRouting:
+    """Search every route on demand, as done before the routing tables."""
+
+    def __init__(self, adjacencyList, routingFunction):
+        self._adjacency_list = adjacencyList
+        self._routing_function = routingFunction
+
+    def route(self, source, target):
+        return self._routing_function(self._adjacency_list, source, target)
+
+
+@contextmanager
+def per_query_routing():
+    with mock.patch(
+        "mocasin.platforms.platformDesigner.RoutingTable", PerQueryRouting
+    ), mock.patch("mocasin.common.platform.RoutingTable", PerQueryRouting):
+        yield
+
+
+def measure(size, topology):
+    start = process_time()
+    platform = NocPlatform(size, topology)
+    build = process_time() - start
+
+    platform._primitives = {}
+    start = process_time()
+    platform.generate_all_primitives()
+    return build, process_time() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[4, 8])
+    args = parser.parse_args()
+
+    print(
+        f"{'topology':<10}{'cores':>7}{'build [s]':>11}{'per-query [s]':>15}"
+        f"{'all prims [s]':>15}{'per-query [s]':>15}"
+    )
+    for name, topology in TOPOLOGIES.items():
+        for size in args.sizes:
+            build, prims = measure(size, topology)
+            with per_query_routing():
+                ref_build, ref_prims = measure(size, topology)
+            print(
+                f"{name:<10}{size * size:>7}{build:>11.2f}{ref_build:>15.2f}"
+                f"{prims:>15.2f}{ref_prims:>15.2f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
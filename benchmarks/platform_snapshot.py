@@ -0,0 +1,74 @@
+# Copyright (C) 2026 TU Dresden
+# Licensed under the ISC license (see LICENSE.txt)
+
+"""Measure the platform startup time with and without snapshots.
+
+For each bundled platform, this script measures the time a task needs to
+obtain the platform and its adjacency dict, once by building the platform
+(the default) and once by loading a snapshot (``platform_cache=<dir>``). The
+column "first run" is the time of the run that builds the platform and stores
+the snapshot.
+
+Usage::
+
+    python benchmarks/platform_snapshot.py [--repeat N]
+"""
+
+import argparse
+import tempfile
+from time import perf_counter
+
+import hydra
+
+from mocasin.platforms.snapshot import instantiate_platform
+
+PLATFORMS = [
+    "exynos990",
+    "haec",
+    "mppa_coolidge",
+    "multi_cluster",
+    "odroid",
+]
+
+
+def startup(cfg):
+    start = perf_counter()
+    platform = instantiate_platform(cfg)
+    platform.to_adjacency_dict()
+    return perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    print(
+        f"{'platform':<16}{'build [ms]':>12}{'first run [ms]':>16}"
+        f"{'snapshot [ms]':>15}{'speedup':>9}"
+    )
+    with tempfile.TemporaryDirectory() as cache_dir:
+        with hydra.initialize_config_module("mocasin.conf", version_base="1.1"):
+            for name in PLATFORMS:
+                cfg = hydra.compose(
+                    "generate_mapping", overrides=[f"platform={name}"]
+                )
+                build = min(startup(cfg) for _ in range(args.repeat))
+
+                cfg = hydra.compose(
+                    "generate_mapping",
+                    overrides=[
+                        f"platform={name}",
+                        f"platform_cache={cache_dir}",
+                    ],
+                )
+                first = startup(cfg)
+                load = min(startup(cfg) for _ in range(args.repeat))
+                print(
+                    f"{name:<16}{build * 1000:>12.1f}{first * 1000:>16.1f}"
+                    f"{load * 1000:>15.1f}{build / load:>9.1f}"
+                )
+
+
+if __name__ == "__main__":
+    main()
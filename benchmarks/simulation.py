@@ -0,0 +1,152 @@
+# Copyright (C) 2026 TU Dresden
+# Licensed under the ISC license (see LICENSE.txt)
+
+"""Compare the fast simulator against the discrete-event simulator.
+
+For each bundled example, this script simulates a number of random mappings
+with both :class:`~mocasin.simulate.DataflowSimulation` and
+:class:`~mocasin.simulate.fast.FastDataflowSimulation`. It reports the average
+time per simulation, the speedup and the relative error of the fast simulator
+in execution time and energy. The column "batch" reports the average time per
+mapping when all mappings are evaluated by a single
+:class:`~mocasin.simulate.fast.FastSimulationBatch`.
+
+Usage::
+
+    python benchmarks/simulation.py [--mappings N] [--seed S]
+"""
+
+import argparse
+import os
+from time import process_time
+
+import hydra
+
+from mocasin.mapper.random import RandomPartialMapper
+from mocasin.simulate import DataflowSimulation
+from mocasin.simulate.fast import FastDataflowSimulation, FastSimulationBatch
+
+EXAMPLES = os.path.join(os.path.dirname(__file__), "..", "examples")
+
+CASES = [
+    (
+        "tgff/auto-indust-cords",
+        platform,
+        [
+            "graph=tgff_reader",
+            "trace=tgff_reader",
+            "tgff.file=auto-indust-cords.tgff",
+            f"tgff.directory={EXAMPLES}/tgff/e3s-0.9",
+        ],
+    )
+    for platform in ["exynos990", "generic_bus", "odroid"]
+] + [
+    (
+        f"sdf3/{name}",
+        "odroid",
+        [
+            "graph=sdf3_reader",
+            "trace=sdf3_reader",
+            f"sdf3.file={EXAMPLES}/sdf3/{name}.xml",
+            # the bundled examples only define the processor type proc_0
+        ]
+        + [
+            f"trace.processor_types.{t}.sdf3_type=proc_0"
+            for t in [
+                "ARM_CORTEX_A7",
+                "ARM_CORTEX_A15",
+                "proc_type_0",
+                "proc_type_1",
+            ]
+        ],
+    )
+    for name in ["small_cyclic", "medium_cyclic", "medium_acyclic"]
+]
+
+
+def load_case(platform, overrides):
+    cfg = hydra.compose(
+        "simulate", overrides=[f"platform={platform}"] + overrides
+    )
+    platform = hydra.utils.instantiate(cfg["platform"])
+    graph = hydra.utils.instantiate(cfg["graph"])
+    trace = hydra.utils.instantiate(cfg["trace"])
+    return platform, graph, trace
+
+
+def simulate(simulation_class, platform, graph, mappings, trace):
+    results = []
+    start = process_time()
+    for mapping in mappings:
+        simulation = simulation_class(platform, graph, mapping, trace)
+        with simulation:
+            simulation.run()
+        results.append(simulation.result)
+    return results, (process_time() - start) / len(mappings)
+
+
+def simulate_batch(platform, graph, mappings, trace):
+    start = process_time()
+    results = FastSimulationBatch(platform, graph, trace).simulate(mappings)
+    return results, (process_time() - start) / len(mappings)
+
+
+def relative_error(reference, value):
+    if not reference:
+        return 0.0
+    return abs(value - reference) / reference
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--mappings", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    print(
+        f"{'example':<26}{'platform':<13}{'simpy [ms]':>11}{'fast [ms]':>10}"
+        f"{'batch [ms]':>11}"
+        f"{'speedup':>9}{'time err':>10}{'max err':>9}{'energy err':>11}"
+    )
+    with hydra.initialize_config_module("mocasin.conf", version_base="1.1"):
+        for name, platform_name, overrides in CASES:
+            platform, graph, trace = load_case(platform_name, overrides)
+            mapper = RandomPartialMapper(platform, seed=args.seed)
+            mappings = [
+                mapper.generate_mapping(graph) for _ in range(args.mappings)
+            ]
+
+            reference, ref_time = simulate(
+                DataflowSimulation, platform, graph, mappings, trace
+            )
+            fast, fast_time = simulate(
+                FastDataflowSimulation, platform, graph, mappings, trace
+            )
+            batch, batch_time = simulate_batch(platform, graph, mappings, trace)
+            assert batch == fast
+
+            time_errors = [
+                relative_error(r.exec_time, f.exec_time)
+                for r, f in zip(reference, fast)
+            ]
+            energy_errors = [
+                relative_error(r.total_energy, f.total_energy)
+                for r, f in zip(reference, fast)
+                if r.total_energy is not None
+            ]
+            energy_error = (
+                f"{100 * sum(energy_errors) / len(energy_errors):>10.2f}%"
+                if energy_errors
+                else f"{'-':>11}"
+            )
+            print(
+                f"{name:<26}{platform_name:<13}{1000 * ref_time:>11.2f}"
+                f"{1000 * fast_time:>10.2f}{1000 * batch_time:>11.2f}"
+                f"{ref_time / batch_time:>9.1f}"
+                f"{100 * sum(time_errors) / len(time_errors):>9.2f}%"
+                f"{100 * max(time_errors):>8.2f}%{energy_error}"
+            )
+
+
+if __name__ == "__main__":
+    main()
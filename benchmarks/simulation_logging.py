@@ -0,0 +1,78 @@
+# Copyright (C) 2026 TU Dresden
+# Licensed under the ISC license (see LICENSE.txt)
+
+"""Measure the cost of debug logging in the discrete-event simulator.
+
+For each bundled example, this script simulates a number of random mappings
+with :class:`~mocasin.simulate.DataflowSimulation`, once in the default mode
+and once in production mode. Debug logging is disabled in both cases, so the
+difference is the overhead of the logging calls that are discarded anyway.
+The script reports the simulation throughput in trace segments per second.
+
+Usage::
+
+    python benchmarks/simulation_logging.py [--mappings N] [--seed S]
+"""
+
+import argparse
+from time import process_time
+
+import hydra
+
+from mocasin.mapper.random import RandomPartialMapper
+from mocasin.simulate import DataflowSimulation
+
+from simulation import CASES, load_case
+
+
+def count_segments(graph, trace):
+    return sum(
+        sum(1 for _ in trace.get_trace(p)) for p in graph.process_names()
+    )
+
+
+def throughput(platform, graph, mappings, trace, segments, production):
+    start = process_time()
+    for mapping in mappings:
+        simulation = DataflowSimulation(
+            platform, graph, mapping, trace, production=production
+        )
+        with simulation:
+            simulation.run()
+    return segments * len(mappings) / (process_time() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--mappings", type=int, default=10)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    print(
+        f"{'example':<26}{'platform':<13}{'segments':>9}"
+        f"{'default [seg/s]':>17}{'production [seg/s]':>20}{'gain':>7}"
+    )
+    with hydra.initialize_config_module("mocasin.conf", version_base="1.1"):
+        for name, platform_name, overrides in CASES:
+            platform, graph, trace = load_case(platform_name, overrides)
+            mapper = RandomPartialMapper(platform, seed=args.seed)
+            mappings = [
+                mapper.generate_mapping(graph) for _ in range(args.mappings)
+            ]
+            segments = count_segments(graph, trace)
+
+            default = throughput(
+                platform, graph, mappings, trace, segments, production=False
+            )
+            production = throughput(
+                platform, graph, mappings, trace, segments, production=True
+            )
+            print(
+                f"{name:<26}{platform_name:<13}{segments:>9}"
+                f"{default:>17.0f}{production:>20.0f}"
+                f"{production / default:>7.2f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
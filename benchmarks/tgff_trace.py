@@ -0,0 +1,113 @@
+# Copyright (C) 2026 TU Dresden
+# Licensed under the ISC license (see LICENSE.txt)
+
+"""Measure the trace generation of TGFF graphs of increasing size.
+
+For each size, this script generates a random task graph, in which every task
+has on average two output channels, and a processor with an operation for each
+task type. It measures the time to generate the traces of all tasks with
+:class:`~mocasin.tgff.trace.TgffTrace` and with the previous implementation,
+which scanned all channels of the graph for each task. The traces are
+generated twice, since later calls reuse the segments of each task. The
+throughput is given in million segments per second.
+
+Usage::
+
+    python benchmarks/tgff_trace.py [--tasks N [N ...]] [--repetitions R]
+"""
+
+import argparse
+import random
+from time import perf_counter
+
+from mocasin.common.trace import (
+    ComputeSegment,
+    ReadTokenSegment,
+    TraceLoop,
+    WriteTokenSegment,
+)
+from mocasin.tgff.tgffParser.dataStructures import TgffGraph, TgffProcessor
+from mocasin.tgff.trace import TgffTrace
+
+TASK_TYPES = 10
+
+
+class PreviousTgffTrace(TgffTrace):
+    def get_trace_loop(self, process):
+        task_name = process
+        if task_name not in self._tgff_graph.tasks:
+            raise RuntimeError(f"Unknown task! ({process})")
+        processor_cycles = {}
+        for processor in self._processor_list.values():
+            processor_cycles[processor.type] = processor.get_operation(
+                self._tgff_graph.tasks[task_name]
+            )
+        body = []
+        for channel_name, properties in self._tgff_graph.channels.items():
+            if task_name == properties[1]:
+                body.append(
+                    ReadTokenSegment(channel=channel_name, num_tokens=1)
+                )
+        body.append(ComputeSegment(processor_cycles))
+        for channel_name, properties in self._tgff_graph.channels.items():
+            if task_name == properties[0]:
+                body.append(
+                    WriteTokenSegment(channel=channel_name, num_tokens=1)
+                )
+        return TraceLoop(body=body, repetitions=self._repetitions)
+
+
+def generate_graph(num_tasks, rng):
+    tasks = {f"t{i}": rng.randrange(TASK_TYPES) for i in range(num_tasks)}
+    channels = {}
+    for i in range(1, num_tasks):
+        # connect each task to an earlier one and add further random edges
+        for _ in range(1 + (rng.random() < 0.5) + (rng.random() < 0.5)):
+            source = rng.randrange(i)
+            channels[f"a{len(channels)}"] = [f"t{source}", f"t{i}", "0"]
+    return TgffGraph("benchmark", tasks, channels, [{0: 8}])
+
+
+def measure(trace, tasks):
+    start = perf_counter()
+    num = 0
+    for task in tasks:
+        for _ in trace.get_trace(task):
+            num += 1
+    return perf_counter() - start, num
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--tasks", type=int, nargs="+", default=[100, 1000, 5000]
+    )
+    parser.add_argument("--repetitions", type=int, default=100)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    operations = {t: [t, 0, 1e-6 * (t + 1)] for t in range(TASK_TYPES)}
+    processors = {"proc": TgffProcessor("proc", operations, "proc")}
+
+    print(
+        f"{'tasks':>7}{'channels':>10}{'segments':>11}{'first [s]':>11}"
+        f"{'again [s]':>11}{'previous [s]':>14}{'Mseg/s':>9}{'speedup':>9}"
+    )
+    for num_tasks in args.tasks:
+        graph = generate_graph(num_tasks, random.Random(args.seed))
+        tasks = list(graph.tasks)
+        trace = TgffTrace(processors, graph, args.repetitions)
+        first, num = measure(trace, tasks)
+        again, _ = measure(trace, tasks)
+        previous, _ = measure(
+            PreviousTgffTrace(processors, graph, args.repetitions), tasks
+        )
+        print(
+            f"{num_tasks:>7}{len(graph.channels):>10}{num:>11}{first:>11.3f}"
+            f"{again:>11.3f}{previous:>14.3f}{num / again / 1e6:>9.2f}"
+            f"{previous / first:>9.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,167 @@
+# Copyright (C) 2026 TU Dresden
+# Licensed under the ISC license (see LICENSE.txt)
+
+"""Compare the static throughput analysis against the fast simulator.
+
+For each bundled example, this script evaluates a number of random mappings
+with :class:`~mocasin.simulate.fast.FastSimulationBatch` and with
+:class:`~mocasin.simulate.throughput.ThroughputAnalysis`. It reports the
+average time per mapping, the speedup, the mean and the maximum relative
+error of the estimated execution time, the mean relative error of the
+estimated energy consumption, and the Spearman rank correlation
+between the estimated and the simulated execution times. The column "top"
+reports the share of the best 10% mappings (by simulation) that are among the
+best 25% mappings by estimate, i.e., that would pass a pre-filter with
+``prefilter=0.25``.
+
+The cost of the analysis does not depend on the number of iterations of the
+application, while the simulation has to execute all iterations unless it
+detects a periodic steady state. Use ``--repetitions`` to change the number of
+iterations of all examples.
+
+Usage::
+
+    python benchmarks/throughput.py [--mappings N] [--repetitions R] [--seed S]
+"""
+
+import argparse
+import os
+from time import process_time
+
+import hydra
+import numpy as np
+
+from mocasin.mapper.random import RandomPartialMapper
+from mocasin.simulate.fast import FastSimulationBatch
+from mocasin.simulate.throughput import ThroughputAnalysis
+
+EXAMPLES = os.path.join(os.path.dirname(__file__), "..", "examples")
+
+CASES = [
+    (
+        "tgff/auto-indust-cords",
+        platform,
+        [
+            "graph=tgff_reader",
+            "trace=tgff_reader",
+            "tgff.file=auto-indust-cords.tgff",
+            "trace.repetition={repetitions}",
+            f"tgff.directory={EXAMPLES}/tgff/e3s-0.9",
+        ],
+    )
+    for platform in ["exynos990", "generic_bus", "odroid"]
+] + [
+    (
+        f"sdf3/{name}",
+        "odroid",
+        [
+            "graph=sdf3_reader",
+            "trace=sdf3_reader",
+            f"sdf3.file={EXAMPLES}/sdf3/{name}.xml",
+            "trace.repetitions={repetitions}",
+            # the bundled examples only define the processor type proc_0
+        ]
+        + [
+            f"trace.processor_types.{t}.sdf3_type=proc_0"
+            for t in [
+                "ARM_CORTEX_A7",
+                "ARM_CORTEX_A15",
+                "proc_type_0",
+                "proc_type_1",
+            ]
+        ],
+    )
+    for name in [
+        "small_cyclic",
+        "medium_cyclic",
+        "large_cyclic",
+        "small_acyclic",
+        "medium_acyclic",
+    ]
+]
+
+
+def load_case(platform, overrides, repetitions=None):
+    # keep the default number of iterations if none is given
+    overrides = [
+        o.format(repetitions=repetitions)
+        for o in overrides
+        if repetitions is not None or "{" not in o
+    ]
+    cfg = hydra.compose(
+        "simulate", overrides=[f"platform={platform}"] + overrides
+    )
+    platform = hydra.utils.instantiate(cfg["platform"])
+    graph = hydra.utils.instantiate(cfg["graph"])
+    trace = hydra.utils.instantiate(cfg["trace"])
+    return platform, graph, trace
+
+
+def evaluate(batch_class, platform, graph, mappings, trace):
+    start = process_time()
+    results = batch_class(platform, graph, trace).simulate(mappings)
+    return results, (process_time() - start) / len(mappings)
+
+
+def ranks(values):
+    return np.argsort(np.argsort(values, kind="stable"), kind="stable")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--mappings", type=int, default=100)
+    parser.add_argument("--repetitions", type=int)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    print(
+        f"{'example':<26}{'platform':<13}{'fast [ms]':>10}"
+        f"{'static [ms]':>12}{'speedup':>9}{'mean err':>10}{'max err':>9}"
+        f"{'energy err':>11}"
+        f"{'rank corr':>11}{'top':>6}"
+    )
+    with hydra.initialize_config_module("mocasin.conf", version_base="1.1"):
+        for name, platform_name, overrides in CASES:
+            platform, graph, trace = load_case(
+                platform_name, overrides, args.repetitions
+            )
+            mapper = RandomPartialMapper(platform, seed=args.seed)
+            mappings = [
+                mapper.generate_mapping(graph) for _ in range(args.mappings)
+            ]
+
+            simulated, fast_time = evaluate(
+                FastSimulationBatch, platform, graph, mappings, trace
+            )
+            estimated, static_time = evaluate(
+                ThroughputAnalysis, platform, graph, mappings, trace
+            )
+
+            reference = np.array([r.exec_time for r in simulated], dtype=float)
+            estimate = np.array([r.exec_time for r in estimated], dtype=float)
+            errors = np.abs(estimate - reference) / reference
+            energy_errors = [
+                abs(e.total_energy - r.total_energy) / r.total_energy
+                for r, e in zip(simulated, estimated)
+                if r.total_energy
+            ]
+            energy_error = (
+                f"{100 * np.mean(energy_errors):>10.2f}%"
+                if energy_errors
+                else f"{'-':>11}"
+            )
+            correlation = np.corrcoef(ranks(reference), ranks(estimate))[0, 1]
+            best = set(np.argsort(reference)[: max(1, len(mappings) // 10)])
+            selected = set(np.argsort(estimate)[: max(1, len(mappings) // 4)])
+            top = len(best & selected) / len(best)
+            print(
+                f"{name:<26}{platform_name:<13}{1000 * fast_time:>10.2f}"
+                f"{1000 * static_time:>12.2f}{fast_time / static_time:>9.1f}"
+                f"{100 * errors.mean():>9.2f}%{100 * errors.max():>8.2f}%"
+                f"{energy_error}"
+                f"{correlation:>11.3f}{100 * top:>5.0f}%"
+            )
+
+
+if __name__ == "__main__":
+    main()
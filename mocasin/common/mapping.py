@@ -43,11 +43,14 @@ class MappingMetadata:
 
     :ivar float exec_time: the execution time of the mapping
     :ivar float energy: the energy consumption of the mapping
+    :ivar bool estimated: whether the values were estimated instead of
+        simulated
     """
 
-    def __init__(self, exec_time=None, energy=None):
+    def __init__(self, exec_time=None, energy=None, estimated=False):
         self.exec_time = exec_time
         self.energy = energy
+        self.estimated = estimated
 
 
 class Mapping:
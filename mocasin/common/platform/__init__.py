@@ -10,7 +10,7 @@ import math
 from collections import Counter
 from enum import Enum
 from hydra.utils import to_absolute_path
-from mocasin.platforms.utils import simpleDijkstra, yxRouting
+from mocasin.platforms.utils import RoutingTable, simpleDijkstra, yxRouting
 from mocasin.platforms.topologies import meshTopology
 
 log = logging.getLogger(__name__)
@@ -25,9 +25,13 @@ class CommunicationResourceType(Enum):
 
 
 class FrequencyDomain:
+    # Incremented whenever the frequency of any domain changes. This allows
+    # cached communication costs to detect that they became stale.
+    _generation = 0
+
     def __init__(self, name, frequency):
         self.name = name
-        self.frequency = frequency
+        self._frequency = frequency
         self.base_frequency = frequency
         # Christian and I agreed that the  easiest way to adapt performance at runtime
         # is to dynamically change the frequency of the process as this feature was
@@ -37,8 +41,17 @@ class FrequencyDomain:
         # model and never changed. The actual running frequency, i.e. "frequency", is
         # modified at runtime according to the number of running threads in the processor.
 
+    @property
+    def frequency(self):
+        return self._frequency
+
+    @frequency.setter
+    def frequency(self, frequency):
+        self._frequency = frequency
+        FrequencyDomain._generation += 1
+
     def cycles_to_ticks(self, cycles):
-        tmp = float(cycles) * 1000000000000 / float(self.frequency)
+        tmp = float(cycles) * 1000000000000 / float(self._frequency)
         return int(round(tmp))
 
 
@@ -213,8 +226,34 @@ class CommunicationPhase:
         self.direction = direction
         self.ignore_latency = ignore_latency
         self.size = size
+        # memoized costs per transfer size
+        self._costs = {}
+        self._costs_generation = FrequencyDomain._generation
 
     def get_costs(self, size):
+        """Get the costs of transferring `size` bytes in this phase.
+
+        The costs are memoized per size. The memo is dropped once the
+        frequency of any frequency domain changes.
+
+        Returns:
+            int: the costs in ticks
+        """
+        if self._costs_generation != FrequencyDomain._generation:
+            self._costs = {}
+            self._costs_generation = FrequencyDomain._generation
+        costs = self._costs.get(size)
+        if costs is None:
+            costs = self._costs[size] = self._calculate_costs(size)
+        return costs
+
+    def __getstate__(self):
+        # the memoized costs are only valid within this process
+        state = self.__dict__.copy()
+        state["_costs"] = {}
+        return state
+
+    def _calculate_costs(self, size):
         latency = 0
         min_throughput = float("inf")
         if self.direction == "read":
@@ -428,6 +467,9 @@ class Platform(object):
         self._schedulers = {}  #: dict of schedulers
         self.network = {}
         self.nocs = {}
+        # memoized adjacency dicts (see to_adjacency_dict)
+        self._adjacency_dicts = {}
+        self._adjacency_generation = FrequencyDomain._generation
         if symmetries_json is not None:
             self.ag_json = to_absolute_path(symmetries_json)
         if embedding_json is not None:
@@ -436,6 +478,13 @@ class Platform(object):
         # The static power not included to the processors' power
         self.peripheral_static_power = peripheral_static_power
 
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        # the frequency generation is local to the process that built the
+        # platform, adjacency dicts of snapshots are valid by construction
+        self.__dict__.setdefault("_adjacency_dicts", {})
+        self._adjacency_generation = FrequencyDomain._generation
+
     def processors(self):
         return self._processors.values()
 
@@ -497,6 +546,7 @@ class Platform(object):
         return self._primitives[name]
 
     def add_scheduler(self, x):
+        self._adjacency_dicts = {}
         if x.name in self._schedulers:
             raise RuntimeError(
                 "Scheduler %s was already added to the platform" % (x.name)
@@ -504,6 +554,7 @@ class Platform(object):
         self._schedulers[x.name] = x
 
     def add_processor(self, x):
+        self._adjacency_dicts = {}
         if x.name in self._processors:
             raise RuntimeError(
                 "Processor %s was already added to the platform" % (x.name)
@@ -511,6 +562,7 @@ class Platform(object):
         self._processors[x.name] = x
 
     def add_communication_resource(self, x):
+        self._adjacency_dicts = {}
         if x.name in self._communication_resources:
             raise RuntimeError(
                 "Communication_Resource %s was already added to the platform"
@@ -519,6 +571,7 @@ class Platform(object):
         self._communication_resources[x.name] = x
 
     def add_primitive(self, x):
+        self._adjacency_dicts = {}
         if x.name in self._primitives:
             raise RuntimeError(
                 "Primitive %s was already added to the platform" % (x.name)
@@ -595,7 +648,22 @@ class Platform(object):
 
         include_proc_type_labels: adds a flag that also includes labels
         for the processor types.
+
+        The result is memoized. It is recalculated if components are added to
+        the platform or if a frequency changes.
         """
+        if self._adjacency_generation != FrequencyDomain._generation:
+            self._adjacency_dicts = {}
+            self._adjacency_generation = FrequencyDomain._generation
+        key = (precision, include_proc_type_labels)
+        if key not in self._adjacency_dicts:
+            self._adjacency_dicts[key] = self._calculate_adjacency_dict(
+                precision, include_proc_type_labels
+            )
+        # copy the lists, such that callers cannot modify the memoized dict
+        return {k: list(v) for k, v in self._adjacency_dicts[key].items()}
+
+    def _calculate_adjacency_dict(self, precision, include_proc_type_labels):
         num_vertices = 0
         vertices = {}
         adjacency_dict = {}
@@ -680,21 +748,49 @@ class Platform(object):
         return latency_dict
 
     def generate_all_primitives(self):
+        routing = self.create_routing()
         for pe1 in self.processors():
             for pe2 in self.processors():
-                prim = self.generate_primitive(pe1, pe2)
+                prim = self.generate_primitive(pe1, pe2, routing)
                 self.add_primitive(prim[0])
 
-    def generate_primitive(self, src, sink):
+    def create_routing(self):
+        """Compute the routes of the network and of all NoCs.
+
+        The routes between all pairs of nodes are calculated once per network,
+        such that generating the primitives for many pairs of processors does
+        not repeat the route search. The result is only valid as long as the
+        network and the NoCs do not change.
+
+        Returns:
+            tuple: the routing table of the network, a dict of routing tables
+            for all NoCs, and a dict mapping each router to the names of the
+            NoCs it belongs to
+        """
+        network = RoutingTable(self.network, simpleDijkstra)
+        noc_tables = {}
+        router_nocs = {}
+        for name, (adjacency, topology) in self.nocs.items():
+            if topology == meshTopology:
+                noc_tables[name] = RoutingTable(adjacency, yxRouting)
+            else:
+                noc_tables[name] = RoutingTable(adjacency, simpleDijkstra)
+            for router in adjacency:
+                router_nocs.setdefault(router, []).append(name)
+        return network, noc_tables, router_nocs
+
+    def generate_primitive(self, src, sink, routing=None):
         platform = self
+        if routing is None:
+            routing = self.create_routing()
 
         # check if nodes are in the same noc
-        nocResources = self.find_resources_for_Noc(src, sink)
+        nocResources = self.find_resources_for_Noc(src, sink, routing)
         resources = nocResources
 
         # if not in the same noc, apply simpleDijkstra routing algorithm
         if not nocResources:
-            resources = simpleDijkstra(platform.network, src, sink)
+            resources = routing[0].route(src, sink)
             # fill with physical links
             resources = self.find_physical_links(resources)
 
@@ -746,8 +842,11 @@ class Platform(object):
 
     # checks if nodes are in a same Noc and returns communication
     # resources
-    def find_resources_for_Noc(self, src, sink):
+    def find_resources_for_Noc(self, src, sink, routing=None):
         platform = self
+        if routing is None:
+            routing = self.create_routing()
+        _, noc_tables, router_nocs = routing
 
         # get all routers the src is connected to
         src_routers = list()
@@ -765,8 +864,8 @@ class Platform(object):
         sameNoc = False
         for src in src_routers:
             for sink in sink_routers:
-                for k, v in platform.nocs.items():
-                    if src in v[0].keys() and sink in v[0].keys():
+                for k in router_nocs.get(src, []):
+                    if k in router_nocs.get(sink, []):
                         sameNoc = True
                         src_router = src
                         sink_router = sink
@@ -781,10 +880,7 @@ class Platform(object):
         # get routing according to the noc topology
         resources = list()
         if sameNoc:
-            if v[1] == meshTopology:
-                resources = yxRouting(v[0], src_router, sink_router)
-            else:
-                resources = simpleDijkstra(v[0], src_router, sink_router)
+            resources = noc_tables[k].route(src_router, sink_router)
             resources.insert(0, src)
             resources.append(sink)
             # fill with physical links
@@ -0,0 +1,55 @@
+# Copyright (C) 2026 TU Dresden
+# Licensed under the ISC license (see LICENSE.txt)
+
+import pickle
+
+from mocasin.common.platform import (
+    CommunicationPhase,
+    CommunicationResource,
+    CommunicationResourceType,
+    FrequencyDomain,
+)
+from mocasin.platforms.odroid import DesignerPlatformOdroid
+from mocasin.platforms.platformDesigner import genericProcessor
+
+
+def test_communication_phase_costs():
+    fd = FrequencyDomain("fd", 1000000000)
+    resource = CommunicationResource(
+        "bus", fd, CommunicationResourceType.PhysicalLink, 10, 10, 8, 8
+    )
+    phase = CommunicationPhase("read", [resource], "read")
+
+    # 10 cycles latency + 64 bytes / 8 bytes per cycle, 1000 ticks per cycle
+    assert phase.get_costs(64) == 18000
+    assert phase._costs == {64: 18000}
+    assert phase.get_costs(64) == 18000
+
+    # changing a frequency invalidates the memoized costs
+    fd.frequency = 500000000
+    assert phase.get_costs(64) == 36000
+    assert phase._costs == {64: 36000}
+
+    # the memoized costs are not pickled
+    assert pickle.loads(pickle.dumps(phase))._costs == {}
+
+
+def test_adjacency_dict_memoized():
+    platform = DesignerPlatformOdroid(
+        genericProcessor("proc_type_0"), genericProcessor("proc_type_1")
+    )
+    adjacency = platform.to_adjacency_dict()
+    assert platform._adjacency_dicts
+    # the returned dict is a copy
+    first = next(iter(adjacency))
+    adjacency[first].clear()
+    assert platform.to_adjacency_dict()[first]
+    adjacency = platform.to_adjacency_dict()
+
+    # changing a frequency invalidates the memoized dict
+    for resource in platform.communication_resources():
+        resource._frequency_domain.frequency /= 2
+    assert platform.to_adjacency_dict() != adjacency
+    assert platform.to_adjacency_dict() == (
+        platform._calculate_adjacency_dict(5, False)
+    )
@@ -3,11 +3,17 @@
 #
 # Authors: Christian Menard
 
+import pickle
+
+import pytest
+
 from mocasin.common.trace import (
+    CachedTrace,
     DataflowTrace,
     EmptyTrace,
     ComputeSegment,
     ReadTokenSegment,
+    TraceLoop,
     WriteTokenSegment,
 )
 
@@ -49,3 +55,57 @@ def test_accumulate_processor_cycles():
     assert trace.accumulate_processor_cycles("empty") is None
     assert trace.accumulate_processor_cycles("baz") == {"A": 100, "B": 1000}
     assert trace.accumulate_processor_cycles("bar") == {"A": 200, "B": 2000}
+
+
+class CountingTrace(TestTrace):
+    def __init__(self):
+        self.calls = 0
+
+    def get_trace(self, process):
+        self.calls += 1
+        return super().get_trace(process)
+
+
+def test_cached_trace():
+    trace = CountingTrace()
+    cached = CachedTrace(trace)
+
+    first = list(cached.get_trace("bar"))
+    second = list(cached.get_trace("bar"))
+    assert len(first) == 8
+    # the segment objects are shared
+    assert all(a is b for a, b in zip(first, second))
+    assert cached.accumulate_processor_cycles("bar") == {"A": 200, "B": 2000}
+    assert cached.accumulate_processor_cycles("foo") is None
+    # the wrapped trace is only read once per process
+    assert trace.calls == 2
+
+    copy = pickle.loads(pickle.dumps(cached))
+    assert copy._segments == {}
+    assert copy.accumulate_processor_cycles("bar") == {"A": 200, "B": 2000}
+
+
+def test_segments_are_slotted():
+    segment = ComputeSegment({"A": 100})
+    with pytest.raises(AttributeError):
+        segment.foo = 1
+
+
+def test_trace_loop():
+    read = ReadTokenSegment("c", 1)
+    compute = ComputeSegment({"A": 100})
+    write = WriteTokenSegment("c", 2)
+    loop = TraceLoop([write], [read, compute], 3)
+    assert len(loop) == 7
+    assert list(loop) == [write] + [read, compute] * 3
+
+    # the default loop contains the whole trace in the prologue
+    loop = TestTrace().get_trace_loop("bar")
+    assert len(loop.prologue) == 8
+    assert loop.repetitions == 0
+
+    trace = CountingTrace()
+    cached = CachedTrace(trace)
+    assert cached.get_trace_loop("bar") is cached.get_trace_loop("bar")
+    assert trace.calls == 1
+    assert pickle.loads(pickle.dumps(cached))._loops == {}
@@ -0,0 +1,20 @@
+# Copyright (C) 2026 TU Dresden
+# Licensed under the ISC license (see LICENSE.txt)
+
+
+def segments_as_tuples(segments):
+    """Convert trace segments to tuples that can be compared by value.
+
+    Each segment becomes a tuple of its type, channel, number of tokens and
+    processor cycles, where the attributes a segment does not have are
+    ``None``.
+    """
+    return [
+        (
+            s.segment_type,
+            getattr(s, "channel", None),
+            getattr(s, "num_tokens", None),
+            getattr(s, "processor_cycles", None),
+        )
+        for s in segments
+    ]
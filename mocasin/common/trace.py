@@ -5,6 +5,7 @@
 
 import copy
 import enum
+import itertools
 import logging
 
 log = logging.getLogger(__name__)
@@ -28,6 +29,8 @@ class _BaseSegment:
        segment_type (SegmentType): The type of the segment to be created
     """
 
+    __slots__ = ("_segment_type",)
+
     def __init__(self, segment_type):
         self._segment_type = segment_type = segment_type
 
@@ -49,6 +52,8 @@ class ComputeSegment(_BaseSegment):
             respective number of computation cycles for this segment.
     """
 
+    __slots__ = ("_processor_cycles",)
+
     def __init__(self, processor_cycles):
         super().__init__(SegmentType.COMPUTE)
         self._processor_cycles = processor_cycles
@@ -72,6 +77,8 @@ class ReadTokenSegment(_BaseSegment):
         num_tokens (int): The number of data tokens to read
     """
 
+    __slots__ = ("_channel", "_num_tokens")
+
     def __init__(self, channel, num_tokens):
         super().__init__(SegmentType.READ_TOKEN)
         self._channel = channel
@@ -104,6 +111,8 @@ class WriteTokenSegment(_BaseSegment):
         num_tokens (int): The number of data tokens to write
     """
 
+    __slots__ = ("_channel", "_num_tokens")
+
     def __init__(self, channel, num_tokens):
         super().__init__(SegmentType.WRITE_TOKEN)
         self._channel = channel
@@ -128,6 +137,38 @@ class WriteTokenSegment(_BaseSegment):
         return self._num_tokens
 
 
+class TraceLoop:
+    """The trace of a process compressed as a loop
+
+    The trace consists of the segments in `prologue`, followed by
+    `repetitions` times the segments in `body`. Iterating a `TraceLoop`
+    yields all segments of the trace.
+
+    Args:
+        prologue (tuple): segments at the beginning of the trace
+        body (tuple): segments of a single loop iteration
+        repetitions (int): number of loop iterations
+    """
+
+    __slots__ = ("prologue", "body", "repetitions")
+
+    def __init__(self, prologue=(), body=(), repetitions=0):
+        self.prologue = tuple(prologue)
+        self.body = tuple(body)
+        self.repetitions = repetitions
+
+    def __len__(self):
+        return len(self.prologue) + len(self.body) * self.repetitions
+
+    def __iter__(self):
+        return itertools.chain(
+            self.prologue,
+            itertools.chain.from_iterable(
+                itertools.repeat(self.body, self.repetitions)
+            ),
+        )
+
+
 class DataflowTrace:
     """Represents one possible behavior of a dataflow application
 
@@ -158,6 +199,22 @@ class DataflowTrace:
         )
         yield
 
+    def get_trace_loop(self, process):
+        """Get the trace for a specific process compressed as a loop
+
+        Traces of periodic applications should override this method, so that
+        simulators can exploit the periodic structure. The default
+        implementation returns the whole trace as the prologue of a loop
+        without iterations.
+
+        Args:
+            process (str): Name of the process to get a trace for
+
+        Returns:
+            TraceLoop: the compressed trace
+        """
+        return TraceLoop(prologue=self.get_trace(process))
+
     def accumulate_processor_cycles(self, process):
         """Calculate the total (accumulated) cycles of all compute segments
 
@@ -210,3 +267,102 @@ class EmptyTrace(DataflowTrace):
         )
         return
         yield
+
+
+class CachedTrace(DataflowTrace):
+    """A trace that materializes the segments of another trace
+
+    On first access, the segments of a process are read from the wrapped trace
+    and stored in a tuple. Any later call of :meth:`get_trace` for the same
+    process iterates over the stored segments, and thus, all simulations
+    using the same `CachedTrace` object share the same segment objects.
+    Since segments are immutable, this is safe as long as no one modifies the
+    ``processor_cycles`` dicts of compute segments. Further, the accumulated
+    processor cycles are computed along with the segments, so that
+    :meth:`accumulate_processor_cycles` does not need to scan the trace again.
+
+    Note that the cached segments are not pickled. A copy of a
+    `CachedTrace`, e.g., in a worker process, materializes the segments again
+    on first access.
+
+    Args:
+        trace (DataflowTrace): the trace to be cached
+    """
+
+    def __init__(self, trace):
+        self._trace = trace
+        self._segments = {}
+        self._loops = {}
+        self._accumulated_cycles = {}
+
+    @property
+    def trace(self):
+        """Get the wrapped trace"""
+        return self._trace
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state["_segments"] = {}
+        state["_loops"] = {}
+        state["_accumulated_cycles"] = {}
+        return state
+
+    def _materialize(self, process):
+        segments = self._segments.get(process)
+        if segments is None:
+            segments = tuple(self._trace.get_trace(process))
+            self._segments[process] = segments
+            self._accumulated_cycles[process] = _accumulate_cycles(segments)
+        return segments
+
+    def get_trace(self, process):
+        """Get the trace for a specific process/actor in the dataflow app
+
+        Args:
+            process (str): Name of the process to get a trace for
+
+        Returns:
+            iterator: an iterator over the cached segments
+        """
+        return iter(self._materialize(process))
+
+    def get_trace_loop(self, process):
+        """Get the trace for a specific process compressed as a loop
+
+        The loop is read from the wrapped trace on first access and stored
+        independently of the segments returned by :meth:`get_trace`.
+
+        Args:
+            process (str): Name of the process to get a trace for
+
+        Returns:
+            TraceLoop: the compressed trace
+        """
+        loop = self._loops.get(process)
+        if loop is None:
+            loop = self._loops[process] = self._trace.get_trace_loop(process)
+        return loop
+
+    def accumulate_processor_cycles(self, process):
+        """Get the total (accumulated) cycles of all compute segments
+
+        See :meth:`DataflowTrace.accumulate_processor_cycles`.
+        """
+        self._materialize(process)
+        acc_cycles = self._accumulated_cycles[process]
+        if acc_cycles is None:
+            return None
+        return dict(acc_cycles)
+
+
+def _accumulate_cycles(segments):
+    acc_cycles = None
+    for s in segments:
+        if s.segment_type != SegmentType.COMPUTE:
+            continue
+        if acc_cycles is None:
+            acc_cycles = dict(s.processor_cycles)
+        else:
+            for k, v in s.processor_cycles.items():
+                acc_cycles[k] += v
+    return acc_cycles
@@ -3,6 +3,7 @@
 #
 # Authors: Gerald Hempel, Andres Goens
 
+import functools
 import sys
 import traceback
 
@@ -10,13 +11,32 @@ import pint
 
 from mocasin.mapper.partial import ProcPartialMapper, ComPartialMapper
 from mocasin.mapper.random import RandomPartialMapper
-from mocasin.mapper.utils import run_simulation
+from mocasin.mapper.utils import SimulationWorkerPool, run_simulation
 from mocasin.simulate import DataflowSimulation
 from mocasin.util import logging
 
 log = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=None)
+def _unit_registry():
+    # creating a registry is expensive, so all thresholds share one
+    return pint.UnitRegistry()
+
+
+def threshold_to_ps(threshold):
+    """Convert a timing threshold to picoseconds.
+
+    Args:
+        threshold (str): the threshold with a unit, e.g., ``"5 ms"``
+
+    Returns:
+        float: the threshold in ps
+    """
+    ureg = _unit_registry()
+    return ureg(threshold).to(ureg.ps).magnitude
+
+
 class Oracle(object):
     def __init__(
         self,
@@ -52,12 +72,6 @@ class Oracle(object):
         res = []
         self.prepare_sim_contexts_for_samples(samples)
 
-        for s in samples:
-            mapping = tuple(s.getMapping().to_list())
-            if mapping in self.cache:
-                log.debug(f"skipping simulation for mapping {mapping}: cached.")
-                s.sim_context.result = self.cache[mapping]
-
         if self.oracle_type != "simulation":
             for s in samples:
                 res.append(self.is_feasible(s.sample2simpleTuple))
@@ -68,7 +82,13 @@ class Oracle(object):
 
 
 class Simulation(Oracle):
-    """simulation code"""
+    """simulation code
+
+    Simulation results are cached by mapping, such that each mapping is
+    simulated only once. If more than one thread is used, the simulations run
+    in a pool of worker processes, which is kept alive until :meth:`close` is
+    called.
+    """
 
     def __init__(self, graph, platform, trace, threshold, threads=1):
         self.graph = graph
@@ -81,9 +101,24 @@ class Simulation(Oracle):
         )
         self.threads = threads
         self.threshold = threshold
+        self.threshold_ps = threshold_to_ps(threshold)
         self.cache = {}
         self.total_cached = 0
         self.oracle_type = "simulation"
+        self._pool = None
+
+    def close(self):
+        """Shut down the worker pool, if it was started."""
+        if self._pool is not None:
+            self._pool.close()
+            self._pool = None
+
+    def _get_pool(self):
+        if self._pool is None:
+            self._pool = SimulationWorkerPool(
+                self.platform, self.graph, self.trace, jobs=self.threads
+            )
+        return self._pool
 
     def prepare_sim_contexts_for_samples(self, samples):
         """Prepare simualtion/application context and mapping for a each element
@@ -110,41 +145,59 @@ class Simulation(Oracle):
         """Checks if a set of samples is feasible in context of a given timing
         threshold.
 
-        Trigger the simulation on 4 for parallel jobs and process the resulting
-        array of simulation results according to the given threshold.
+        Samples whose mapping was simulated before take the result from the
+        cache, and samples with the same mapping are simulated only once. The
+        remaining simulations run in parallel if more than one thread is
+        used. The resulting simulation results are then compared to the
+        threshold.
         """
-        results = []
-        # run simulations and search for the best mapping
-        if len(samples) > 1 and self.threads > 1:
-            # run parallel simulation for more than one sample in samples list
-            from multiprocessing import Pool
+        # group the samples that still need a simulation by their mapping
+        pending = {}
+        for s in samples:
+            if s.sim_context.result is not None:
+                self.total_cached += 1
+                continue
+            mapping = tuple(s.getMapping().to_list())
+            if mapping in self.cache:
+                log.debug(f"skipping simulation for mapping {mapping}: cached.")
+                s.sim_context.result = self.cache[mapping]
+                self.total_cached += 1
+            elif mapping in pending:
+                pending[mapping].append(s)
+                self.total_cached += 1
+            else:
+                pending[mapping] = [s]
 
+        # run simulations and search for the best mapping
+        if len(pending) > 1 and self.threads > 1:
+            # run parallel simulation for more than one mapping
             log.debug(
                 "Running parallel simulation for {} samples".format(
-                    len(samples)
+                    len(pending)
                 )
             )
-            pool = Pool(processes=self.threads, maxtasksperchild=100)
-            results = list(
-                pool.map(self.run_simulation, samples, chunksize=self.threads)
-            )
+            mappings = [group[0].getMapping() for group in pending.values()]
+            results = self._get_pool().imap(mappings)
+            for (mapping, group), (result, _) in zip(pending.items(), results):
+                self.cache[mapping] = result
+                for s in group:
+                    s.sim_context.result = result
         else:
-            # results list of simulation contexts
             log.debug("Running single simulation")
-            results = list(map(self.run_simulation, samples))
+            for group in pending.values():
+                self.run_simulation(group[0])
+                for s in group[1:]:
+                    s.sim_context.result = group[0].sim_context.result
 
         # find runtime from results
         exec_times = []  # in ps
-        for r in results:
+        for r in samples:
             exec_times.append(float(r.sim_context.result.exec_time))
 
         feasible = []
-        for r in results:
+        for r in samples:
             assert r.sim_context.result and r.sim_context.result.exec_time
-            ureg = pint.UnitRegistry()
-            threshold = ureg(self.threshold).to(ureg.ps).magnitude
-
-            if r.sim_context.result.exec_time > threshold:
+            if r.sim_context.result.exec_time > self.threshold_ps:
                 r.setFeasibility(False)
                 feasible.append(False)
             else:
@@ -153,18 +206,22 @@ class Simulation(Oracle):
 
         log.debug("Exec.-Times: {} Feasible: {}".format(exec_times, feasible))
         # return samples with the according sim context
-        return results
+        return samples
 
     def run_simulation(self, sample):
         # do simulation requires sim_context
         if sample.sim_context.result is not None:
             self.total_cached += 1
             return sample
+        mapping = tuple(sample.getMapping().to_list())
+        if mapping in self.cache:
+            sample.sim_context.result = self.cache[mapping]
+            self.total_cached += 1
+            return sample
         try:
             run_simulation(sample.sim_context)
 
             # add to cache
-            mapping = tuple(sample.getMapping().to_list())
             self.cache[mapping] = sample.sim_context.result
 
         except Exception as e:
@@ -7,7 +7,6 @@ import random as rand
 import sys
 
 import numpy as np
-import pint
 
 from mocasin.design_centering import sample as dc_sample
 from mocasin.design_centering import oracle
@@ -53,6 +52,10 @@ class PerturbationManager(object):
         # self.representation = (reps.RepresentationType['SimpleVector'].
         #    getClassType())(self.graph, self.platform)
 
+    def close(self):
+        """Shut down the worker pool of the simulation oracle."""
+        self.sim.close()
+
     def create_randomMappings(self):
         """Creates a defined number of unique random mappings"""
         mapping_set = set([])
@@ -190,14 +193,7 @@ class PerturbationManager(object):
         for r in results:
             exec_times.append(float(r.sim_context.result.exec_time))
 
-        feasible = []
-        for e in exec_times:
-            ureg = pint.UnitRegistry()
-            threshold = ureg(self.threshold).to(ureg.ps).magnitude
-            if e > threshold:
-                feasible.append(False)
-            else:
-                feasible.append(True)
+        feasible = [e <= self.sim.threshold_ps for e in exec_times]
 
         log.debug(
             "exec. Times: {} Feasible: {} History: {}".format(
@@ -0,0 +1,56 @@
+# Copyright (C) 2026 TU Dresden
+# Licensed under the ISC license (see LICENSE.txt)
+
+from types import SimpleNamespace
+
+import pytest
+
+from mocasin.design_centering import oracle
+from mocasin.design_centering.sample import Sample
+from mocasin.simulate import SimulationResult
+
+
+def test_threshold_to_ps():
+    assert oracle.threshold_to_ps("5 ms") == pytest.approx(5e9)
+    assert oracle.threshold_to_ps("3 ns") == pytest.approx(3e3)
+
+
+def _sample(mapping, mocker):
+    sim_context = SimpleNamespace(
+        mapping=mocker.Mock(to_list=lambda: mapping), result=None
+    )
+    return Sample(sample=mapping, sim_context=sim_context)
+
+
+def test_simulation_oracle_cache(graph, platform, mocker):
+    def simulate(sim_context):
+        exec_time = sum(sim_context.mapping.to_list()) * 1e9
+        sim_context.result = SimulationResult(exec_time, 0.0, 0.0)
+        return sim_context, 0.0
+
+    run_simulation = mocker.patch(
+        "mocasin.design_centering.oracle.run_simulation", side_effect=simulate
+    )
+    sim = oracle.Simulation(graph, platform, None, "2 ms")
+    assert sim.threshold_ps == pytest.approx(2e9)
+
+    samples = [
+        _sample([0, 1], mocker),
+        _sample([1, 2], mocker),
+        _sample([0, 1], mocker),
+    ]
+    results = sim.is_feasible(samples)
+    assert results == samples
+    assert [s.getFeasibility() for s in samples] == [True, False, True]
+    # the duplicated mapping is simulated once
+    assert run_simulation.call_count == 2
+    assert sim.total_cached == 1
+
+    # previously simulated mappings are not simulated again
+    samples = [_sample([1, 2], mocker), _sample([1, 1], mocker)]
+    sim.is_feasible(samples)
+    assert [s.getFeasibility() for s in samples] == [False, True]
+    assert run_simulation.call_count == 3
+    assert sim.total_cached == 2
+    assert set(sim.cache) == {(0, 1), (1, 2), (1, 1)}
+    sim.close()
@@ -0,0 +1,336 @@
+# Copyright (C) 2026 TU Dresden
+# Licensed under the ISC license (see LICENSE.txt)
+
+"""Caching and persistent storage of simulation results.
+
+**Classes:**
+    * :class:`MappingCache`: a bounded in-memory cache of simulation results
+    * :class:`SimulationResultStore`: an on-disk store of simulation results
+
+**Functions:**
+    * :func:`fingerprint_simulation_context`: a stable content hash of a
+      platform, graph, trace, representation and simulation type
+"""
+
+import hashlib
+import sqlite3
+
+from hydra.utils import to_absolute_path
+import numpy as np
+
+from mocasin.common.trace import SegmentType
+from mocasin.simulate import SimulationResult
+from mocasin.util import logging
+from mocasin.util.lru import LRUCache
+
+log = logging.getLogger(__name__)
+
+
+def _describe_platform(platform):
+    """Generate a sequence of items describing a platform."""
+    yield ("platform", platform.name, platform.peripheral_static_power)
+    for p in sorted(platform.processors(), key=lambda x: x.name):
+        yield (
+            "processor",
+            p.name,
+            p.type,
+            p.frequency,
+            p.context_load_cycles,
+            p.context_store_cycles,
+            p.n_threads,
+            p.static_power(),
+            p.dynamic_power(),
+        )
+    for s in sorted(platform.schedulers(), key=lambda x: x.name):
+        yield (
+            "scheduler",
+            s.name,
+            tuple(p.name for p in s.processors),
+            s.policy.name,
+            s.policy.scheduling_cycles,
+            s.policy.time_slice,
+        )
+    for r in sorted(platform.communication_resources(), key=lambda x: x.name):
+        yield (
+            "resource",
+            r.name,
+            r.read_latency(),
+            r.write_latency(),
+            r.read_throughput(),
+            r.write_throughput(),
+            r.exclusive,
+        )
+    for prim in sorted(platform.primitives(), key=lambda x: x.name):
+        yield ("primitive", prim.name)
+        for phases_dict in (prim.produce_phases, prim.consume_phases):
+            for proc, phases in sorted(phases_dict.items()):
+                for ph in phases:
+                    yield (
+                        "phase",
+                        proc,
+                        ph.name,
+                        ph.direction,
+                        ph.ignore_latency,
+                        ph.size,
+                        tuple(r.name for r in ph.resources),
+                    )
+
+
+def _describe_graph(graph):
+    """Generate a sequence of items describing a dataflow graph."""
+    yield ("graph", graph.name)
+    for p in sorted(graph.processes(), key=lambda x: x.name):
+        yield ("process", p.name)
+    for c in sorted(graph.channels(), key=lambda x: x.name):
+        yield (
+            "channel",
+            c.name,
+            c.token_size,
+            c.source.name if c.source else None,
+            tuple(sorted(s.name for s in c.sinks)),
+        )
+
+
+def _describe_trace(graph, trace):
+    """Generate a sequence of items describing the traces of all processes."""
+    for p in sorted(graph.process_names()):
+        yield ("trace", p)
+        for segment in trace.get_trace(p):
+            if segment.segment_type == SegmentType.COMPUTE:
+                yield (
+                    segment.segment_type.value,
+                    tuple(sorted(segment.processor_cycles.items())),
+                )
+            else:
+                yield (
+                    segment.segment_type.value,
+                    segment.channel,
+                    segment.num_tokens,
+                )
+
+
+def _describe_representation(representation):
+    """Generate a sequence of items describing a mapping representation."""
+    yield (
+        "representation",
+        type(representation).__qualname__,
+        getattr(representation, "channels", None),
+        getattr(representation, "canonical_operations", None),
+    )
+
+
+def fingerprint_simulation_context(
+    platform, graph, trace, representation, simulation_type="dataflow"
+):
+    """Compute a stable content hash of a simulation context.
+
+    The hash only depends on the content of the platform, the graph, the trace,
+    the type of the representation and the simulation type, but not on the
+    identity of the Python objects. Thus, it is identical across runs that
+    simulate the same application on the same platform. Since the simulation
+    types differ in their accuracy, the results of one simulation type are
+    never returned for another one.
+
+    Note that calculating the fingerprint requires a full pass over the trace
+    of each process.
+
+    Args:
+        platform (Platform): the platform
+        graph (DataflowGraph): the dataflow graph
+        trace (DataflowTrace): the trace of the graph
+        representation (MappingRepresentation): the mapping representation
+        simulation_type (str, optional): the simulation type, see
+            :data:`mocasin.mapper.utils.SIMULATION_TYPES`. Defaults to
+            "dataflow".
+
+    Returns:
+        str: a hex digest
+    """
+    h = hashlib.sha256()
+    descriptions = (
+        _describe_platform(platform),
+        _describe_graph(graph),
+        _describe_trace(graph, trace),
+        _describe_representation(representation),
+        [("simulation", simulation_type)],
+    )
+    for description in descriptions:
+        for item in description:
+            h.update(repr(item).encode())
+    return h.hexdigest()
+
+
+def _compact_key(mapping):
+    """Pack a mapping tuple into a compact bytes object."""
+    array = np.asarray(mapping)
+    return array.dtype.char.encode() + array.tobytes()
+
+
+def _unpack_key(key):
+    """Restore a mapping tuple packed by :func:`_compact_key`."""
+    return tuple(np.frombuffer(key[1:], dtype=chr(key[0])).tolist())
+
+
+class MappingCache:
+    """A bounded in-memory cache of simulation results.
+
+    Results are cached per graph and mapping tuple. Internally, the mapping
+    tuples are packed into compact bytes keys. If a capacity is given, the
+    least recently used entry is evicted once the cache grows beyond the
+    capacity.
+
+    Args:
+        capacity (int, optional): maximum number of cached results. If
+            ``None``, the cache is unbounded. Defaults to ``None``.
+    """
+
+    def __init__(self, capacity=None):
+        self._entries = LRUCache(capacity)
+
+    @property
+    def capacity(self):
+        """int: the maximum number of cached results"""
+        return self._entries.capacity
+
+    def lookup(self, graph, mapping):
+        """Look up a simulation result.
+
+        Marks the entry as recently used.
+
+        Args:
+            graph (DataflowGraph): the dataflow graph
+            mapping (tuple): the mapping tuple
+
+        Returns:
+            SimulationResult: the cached result or ``None`` if `mapping` is
+                not cached
+        """
+        return self._entries.get((graph, _compact_key(mapping)))
+
+    def add(self, graph, mapping, sim_res):
+        """Add a simulation result.
+
+        Args:
+            graph (DataflowGraph): the dataflow graph
+            mapping (tuple): the mapping tuple
+            sim_res (SimulationResult): the simulation result
+
+        Returns:
+            int: the number of entries evicted to make space for the result
+        """
+        return self._entries.put((graph, _compact_key(mapping)), sim_res)
+
+    def items(self):
+        """Iterate over all entries as (graph, mapping, result) tuples."""
+        for (graph, key), sim_res in self._entries.items():
+            yield graph, _unpack_key(key), sim_res
+
+    def __len__(self):
+        return len(self._entries)
+
+
+def _mapping_key(mapping):
+    """Convert a mapping tuple into a string key."""
+    return ",".join(str(x) for x in mapping)
+
+
+class SimulationResultStore:
+    """A persistent on-disk store of simulation results.
+
+    The results are kept in an SQLite database and are keyed by a simulation
+    context (see :func:`fingerprint_simulation_context`) and a mapping tuple
+    of the corresponding representation. SQLite serializes concurrent writes,
+    so a single store may be shared by multiple processes, e.g., by the jobs
+    of a hydra multirun.
+
+    The database connection is opened lazily on first use.
+
+    Args:
+        path (str): path to the database file. Relative paths are resolved
+            against the original working directory of the hydra application.
+        timeout (float, optional): how many seconds to wait for a lock held by
+            a concurrent writer. Defaults to 60.
+    """
+
+    def __init__(self, path, timeout=60.0):
+        self.path = to_absolute_path(path)
+        self.timeout = timeout
+        self._connection = None
+
+    def _connect(self):
+        if self._connection is None:
+            log.debug(f"open simulation result store {self.path}")
+            self._connection = sqlite3.connect(self.path, timeout=self.timeout)
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS results ("
+                "context TEXT NOT NULL, "
+                "mapping TEXT NOT NULL, "
+                "exec_time REAL, "
+                "static_energy REAL, "
+                "dynamic_energy REAL, "
+                "PRIMARY KEY (context, mapping))"
+            )
+            self._connection.commit()
+        return self._connection
+
+    def lookup(self, context, mapping):
+        """Look up a simulation result.
+
+        Args:
+            context (str): the simulation context
+            mapping (tuple): the mapping tuple
+
+        Returns:
+            SimulationResult: the stored result or ``None`` if there is no
+                result stored for `mapping`
+        """
+        row = (
+            self._connect()
+            .execute(
+                "SELECT exec_time, static_energy, dynamic_energy FROM results "
+                "WHERE context = ? AND mapping = ?",
+                (context, _mapping_key(mapping)),
+            )
+            .fetchone()
+        )
+        if row is None:
+            return None
+        return SimulationResult(*row)
+
+    def add_results(self, context, results):
+        """Store multiple simulation results in a single transaction.
+
+        Args:
+            context (str): the simulation context
+            results (list of tuple): a list of tuples of a mapping tuple and
+                the corresponding simulation result
+        """
+        if not results:
+            return
+        connection = self._connect()
+        with connection:
+            connection.executemany(
+                "INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?, ?)",
+                [
+                    (
+                        context,
+                        _mapping_key(m),
+                        r.exec_time,
+                        r.static_energy,
+                        r.dynamic_energy,
+                    )
+                    for m, r in results
+                ],
+            )
+
+    def __len__(self):
+        return (
+            self._connect().execute("SELECT COUNT(*) FROM results").fetchone()
+        )[0]
+
+    def close(self):
+        """Close the database connection."""
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
@@ -7,6 +7,7 @@ from dataclasses import dataclass
 import enum
 import pickle
 import random
+from time import perf_counter
 
 import deap
 from deap import algorithms, base, creator, tools  # noqa
@@ -129,6 +130,7 @@ class _GeneticMapperEngine:
         toolbox.register("mate", self._mapping_crossover)
         toolbox.register("mutate", self._mapping_mutation)
         toolbox.register("evaluate", self._evaluate_mapping)
+        toolbox.register("map", self._map)
         toolbox.register(
             "select", deap.tools.selTournament, tournsize=self.config.tournsize
         )
@@ -142,7 +144,9 @@ class _GeneticMapperEngine:
         stats.register("std", np.std)
         stats.register("min", np.min)
         stats.register("max", np.max)
+        stats.register("time", self._generation_time)
         self.evolutionary_stats = stats
+        self._generation_start = None
 
         if self.config.initials == "random":
             self.population = toolbox.population(n=self.config.pop_size)
@@ -153,14 +157,58 @@ class _GeneticMapperEngine:
         pass
 
     def _evaluate_mapping(self, mapping):
+        return self._evaluate_mappings([mapping])[0]
+
+    def _evaluate_mappings(self, mappings):
+        """Evaluate a batch of mappings with a single simulation call.
+
+        Simulating all mappings of a generation at once lets the simulation
+        manager distribute them over its worker pool. Equal mappings are
+        simulated only once.
+        """
+        unique = list(dict.fromkeys(tuple(m) for m in mappings))
+        simulated = self.simulation_manager.simulate(
+            self.graph, self.trace, self.representation, list(map(list, unique))
+        )
+        simres = dict(zip(unique, simulated))
+
+        # Results estimated by the pre-filter of the simulation manager are
+        # fine for the selection, but must not enter the Pareto front. Thus,
+        # the estimated mappings that are not dominated by the front are
+        # simulated.
+        confirm = [
+            m
+            for m in unique
+            if simres[m].estimated
+            and not self._dominated(self._fitness(m, simres[m]))
+        ]
+        if confirm:
+            confirmed = self.simulation_manager.simulate(
+                self.graph,
+                self.trace,
+                self.representation,
+                list(map(list, confirm)),
+                prefilter=False,
+            )
+            simres.update(zip(confirm, confirmed))
+        return [self._fitness(m, simres[tuple(m)]) for m in mappings]
+
+    def _dominated(self, fitness):
+        """Check whether a member of the Pareto front dominates `fitness`."""
+        for ind in self.hof:
+            values = ind.fitness.values
+            if all(v <= f for v, f in zip(values, fitness)) and any(
+                v < f for v, f in zip(values, fitness)
+            ):
+                return True
+        return False
+
+    def _fitness(self, mapping, simres):
         result = []
-        simres = self.simulation_manager.simulate(
-            self.graph, self.trace, self.representation, [list(mapping)]
-        )[0]
         if Objectives.EXEC_TIME in self.config.objectives:
             result.append(simres.exec_time)
         if Objectives.ENERGY in self.config.objectives:
-            result.append(simres.dynamic_energy+simres.static_energy)
+            result.append(simres.dynamic_energy + simres.static_energy)
         if Objectives.RESOURCES in self.config.objectives:
             mapping_obj = self.representation.fromRepresentation(list(mapping))
             resource_dict = mapping_obj.to_resourceDict()
@@ -168,6 +216,27 @@ class _GeneticMapperEngine:
                 result.append(resource_dict[core_type])
         return tuple(result)
 
+    def _map(self, function, individuals):
+        """Map `function` over individuals.
+
+        The DEAP algorithms evaluate the invalid individuals of a generation
+        with ``toolbox.map``, which is evaluated here as one batch.
+        """
+        if function is self.evolutionary_toolbox.evaluate:
+            return self._evaluate_mappings(list(individuals))
+        return list(map(function, individuals))
+
+    def _generation_time(self, _):
+        """Return the wall-clock time since the previous generation.
+
+        The statistics are compiled once per generation, so that this records
+        the time of each generation in the logbook.
+        """
+        now = perf_counter()
+        elapsed = now - self._generation_start
+        self._generation_start = now
+        return elapsed
+
     def _random_mapping(self):
         mapping = self.random_mapper.generate_mapping(
             self.graph, trace=self.trace, representation=self.representation
@@ -223,6 +292,7 @@ class _GeneticMapperEngine:
         else:
             ea_algo = deap.algorithms.eaMuCommaLambda
 
+        self._generation_start = perf_counter()
         population, logbook = ea_algo(
             self.population,
             toolbox,
@@ -249,6 +319,7 @@ class _GeneticMapperEngine:
         toolbox.unregister("mate")
         toolbox.unregister("mutate")
         toolbox.unregister("evaluate")
+        toolbox.unregister("map")
         toolbox.unregister("select")
         stats = self.evolutionary_stats
         self.evolutionary_stats = None
@@ -290,6 +361,18 @@ class GeneticMapper(BaseMapper):
             Defaults to True.
         jobs (int, optional): Number of jobs for parallel simulation.
             Defaults to 4.
+        result_store (str, optional): Path to a persistent store of
+            simulation results that is shared across runs. Defaults to None.
+        cache_size (int, optional): Maximum number of simulation results
+            kept in memory. If None, the cache is unbounded. Defaults to None.
+        simulation_type (str, optional): The simulator used to evaluate
+            mappings, one of "dataflow", "fast" or "throughput". Defaults to
+            "dataflow".
+        prefilter (float, optional): If set, only this share of the
+            mappings of a batch with the shortest estimated execution times
+            is simulated. The results of the other mappings are estimated by a
+            static throughput analysis. Estimated mappings that could enter the
+            Pareto front are simulated. Defaults to None.
     """
 
     def __init__(
@@ -312,6 +395,10 @@ class GeneticMapper(BaseMapper):
         progress=False,
         parallel=True,
         jobs=4,
+        result_store=None,
+        cache_size=None,
+        simulation_type="dataflow",
+        prefilter=None,
     ):
         super().__init__(platform, full_mapper=True)
         random.seed(random_seed)
@@ -352,6 +439,10 @@ class GeneticMapper(BaseMapper):
             parallel=parallel,
             progress=progress,
             chunk_size=chunk_size,
+            result_store=result_store,
+            cache_size=cache_size,
+            simulation_type=simulation_type,
+            prefilter=prefilter,
         )
         self._simulation_manager = SimulationManager(
             self.platform, simulation_config
@@ -403,6 +494,7 @@ class GeneticMapper(BaseMapper):
             self._simulation_manager.statistics.to_file()
         if self._dump_cache:
             self._simulation_manager.dump("mapping_cache.csv")
+        self._simulation_manager.close()
         engine.cleanup()
         return result
 
@@ -451,5 +543,6 @@ class GeneticMapper(BaseMapper):
             self._simulation_manager.statistics.to_file()
         if self._dump_cache:
             self._simulation_manager.dump("mapping_cache.csv")
+        self._simulation_manager.close()
         engine.cleanup()
         return pareto
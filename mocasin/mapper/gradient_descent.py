@@ -79,6 +79,13 @@ class GradientDescentMapper(BaseMapper):
             Defaults to 2.
         momentum_decay (float, optional): To be described. Defaults to 0.5.
         parallel_points (int, optional): To be described. Defaults to 5.
+        result_store (str, optional): Path to a persistent store of
+            simulation results that is shared across runs. Defaults to None.
+        cache_size (int, optional): Maximum number of simulation results
+            kept in memory. If None, the cache is unbounded. Defaults to None.
+        simulation_type (str, optional): The simulator used to evaluate
+            mappings, one of "dataflow", "fast" or "throughput". Defaults to
+            "dataflow".
     """
 
     def __init__(
@@ -95,6 +102,9 @@ class GradientDescentMapper(BaseMapper):
         jobs=2,
         momentum_decay=0.5,
         parallel_points=5,
+        result_store=None,
+        cache_size=None,
+        simulation_type="dataflow",
     ):
         super().__init__(platform, full_mapper=True)
         random.seed(random_seed)
@@ -114,6 +124,9 @@ class GradientDescentMapper(BaseMapper):
             parallel=parallel,
             progress=progress,
             chunk_size=chunk_size,
+            result_store=result_store,
+            cache_size=cache_size,
+            simulation_type=simulation_type,
         )
         self._simulation_manager = SimulationManager(
             self.platform, config=simulation_config
@@ -264,6 +277,7 @@ class GradientDescentMapper(BaseMapper):
             self._simulation_manager.statistics.to_file()
         if self.dump_cache:
             self._simulation_manager.dump("mapping_cache.csv")
+        self._simulation_manager.close()
 
         return representation.fromRepresentation(self.best_mapping)
 
@@ -3,12 +3,23 @@
 #
 # Authors: Robert Khasanov
 
+from bisect import bisect_left, bisect_right
+
 import numpy as np
 
 
 def _is_pareto_efficient(costs):
     """Find the Pareto-efficient points.
 
+    A point is efficient if no other point has lower or equal costs in every
+    dimension and a lower cost in at least one. Of several points with equal
+    costs, only the first one is efficient.
+
+    The points are swept in lexicographic order, in which no point is
+    dominated by a later one. With up to three costs, this takes O(n log n)
+    time. With more costs, each point is compared to the efficient points
+    found before.
+
     Args:
         costs: An (n_points, n_costs) array
 
@@ -16,18 +27,105 @@ def _is_pareto_efficient(costs):
         A (n_points, ) boolean array, indicating whether each point is Pareto
             efficient
     """
-    # Taken from
-    # https://stackoverflow.com/questions/32791911/fast-calculation-of-pareto-front-in-python # noqa
-    is_efficient = np.ones(costs.shape[0], dtype=bool)
-    for i, c in enumerate(costs):
-        if is_efficient[i]:
-            # Keep any point with a lower cost
-            is_efficient[is_efficient] = np.any(costs[is_efficient] < c, axis=1)
-            # And keep self
+    costs = np.asarray(costs, dtype=float)
+    num_points, num_costs = costs.shape
+    is_efficient = np.zeros(num_points, dtype=bool)
+    if num_points == 0:
+        return is_efficient
+
+    # np.lexsort is stable and sorts by the last key first
+    order = np.lexsort(costs.T[::-1])
+    if num_costs == 1:
+        is_efficient[order[0]] = True
+    elif num_costs == 2:
+        # Keep any point with a lower second cost than all previous points
+        y = costs[order, 1]
+        keep = np.ones(num_points, dtype=bool)
+        keep[1:] = y[1:] < np.minimum.accumulate(y)[:-1]
+        is_efficient[order[keep]] = True
+    elif num_costs == 3:
+        _sweep_3d(costs, order, is_efficient)
+    else:
+        front = np.empty_like(costs)
+        size = 0
+        for i in order:
+            c = costs[i]
+            if size and np.any(np.all(front[:size] <= c, axis=1)):
+                continue
+            front[size] = c
+            size += 1
             is_efficient[i] = True
     return is_efficient
 
 
+def _sweep_3d(costs, order, is_efficient):
+    """Mark the efficient points with three costs.
+
+    The last two costs of the efficient points are kept in a staircase, in
+    which the second cost ascends and the third one strictly descends. A point
+    is dominated if the staircase has a step below it.
+    """
+    ys = []
+    zs = []
+    for i in order:
+        _, y, z = costs[i]
+        k = bisect_right(ys, y)
+        if k and zs[k - 1] <= z:
+            continue
+        is_efficient[i] = True
+        # replace the steps above the point
+        start = bisect_left(ys, y)
+        end = start
+        while end < len(ys) and zs[end] >= z:
+            end += 1
+        ys[start:end] = [y]
+        zs[start:end] = [z]
+
+
+def _is_weakly_dominated(points, front):
+    """Check whether the points are weakly dominated by the front.
+
+    Args:
+        points: An (n_points, n_costs) array
+        front: An (n_front, n_costs) array
+
+    Returns:
+        A (n_points, ) boolean array, indicating whether the costs of any point
+            in `front` are lower or equal to the costs of each point
+    """
+    if front.shape[1] == 1:
+        return points[:, 0] >= front[:, 0].min()
+    if front.shape[1] == 2:
+        order = np.argsort(front[:, 0], kind="stable")
+        xs = front[order, 0]
+        min_ys = np.minimum.accumulate(front[order, 1])
+        k = np.searchsorted(xs, points[:, 0], side="right") - 1
+        return (k >= 0) & (min_ys[np.maximum(k, 0)] <= points[:, 1])
+    return np.array(
+        [np.any(np.all(front <= p, axis=1)) for p in points], dtype=bool
+    )
+
+
+def _mapping_costs(mappings):
+    """Collect the costs of mappings.
+
+    Returns:
+        A tuple of an (n_mappings, n_costs) array of the execution times and,
+            if the mappings have energy values, the energy consumptions, and a
+            list of the sets of indices of the used processors.
+    """
+    processors = mappings[0].platform.processors()
+    index = {p: i for i, p in enumerate(processors)}
+    if mappings[0].metadata.energy:
+        costs = [(m.metadata.exec_time, m.metadata.energy) for m in mappings]
+    else:
+        costs = [(m.metadata.exec_time,) for m in mappings]
+    supports = [
+        frozenset(index[p] for p in m.get_used_processors()) for m in mappings
+    ]
+    return np.array(costs, dtype=float), supports
+
+
 def mark_pareto_front(mappings):
     """Find Pareto-efficient mappings.
 
@@ -36,6 +134,13 @@ def mark_pareto_front(mappings):
     * execution time - a float value
     * energy consumotion - a float value
 
+    Instead of comparing all costs at once, the mappings are grouped by the
+    set of used processors. The front of each group is found with the fast
+    sweep over the execution time and energy (see
+    :func:`_is_pareto_efficient`). Then, the groups are visited by ascending
+    number of processors, and a mapping is dropped if a mapping of a group
+    with a strict subset of its processors is at least as good.
+
     Note that this function does not transform mappings into canonical form.
 
     Args:
@@ -47,22 +152,24 @@ def mark_pareto_front(mappings):
     if not mappings:
         return []
 
-    processors = mappings[0].platform.processors()
-    num_costs = len(processors) + 1
-    if mappings[0].metadata.energy:
-        num_costs += 1
-    costs = np.empty((0, num_costs), float)
-    for m in mappings:
-        lm = [0] * len(processors)
-        procs = m.get_used_processors()
-        for i, p in enumerate(processors):
-            if p in procs:
-                lm[i] = 1
-        lm.append(m.metadata.exec_time)
-        if m.metadata.energy:
-            lm.append(m.metadata.energy)
-        costs = np.append(costs, [lm], axis=0)
-    flags = _is_pareto_efficient(costs)
+    costs, supports = _mapping_costs(mappings)
+    groups = {}
+    for i, support in enumerate(supports):
+        groups.setdefault(support, []).append(i)
+
+    flags = np.zeros(len(mappings), dtype=bool)
+    fronts = []
+    for support in sorted(groups, key=len):
+        indices = np.array(groups[support])
+        indices = indices[_is_pareto_efficient(costs[indices])]
+        dominating = [front for s, front in fronts if s < support]
+        if dominating:
+            dominated = _is_weakly_dominated(
+                costs[indices], np.concatenate(dominating)
+            )
+            indices = indices[~dominated]
+        flags[indices] = True
+        fronts.append((support, costs[indices]))
     return list(flags)
 
 
@@ -85,3 +192,100 @@ def filter_pareto_front(mappings):
     flags = mark_pareto_front(mappings)
     res = [m for m, f in zip(mappings, flags) if f]
     return res
+
+
+class ParetoArchive:
+    """An incrementally updated Pareto front of mappings.
+
+    The mappings are compared by the same costs as in
+    :func:`mark_pareto_front`. A mapping is accepted unless a mapping in the
+    archive is at least as good, and accepting a mapping removes the mappings
+    it dominates. Adding mappings one by one thus leads to the same front as
+    :func:`filter_pareto_front`, without keeping all evaluated mappings.
+
+    The archive keeps a staircase of the execution times and energy
+    consumptions per set of used processors. Adding a mapping takes
+    O(log n) time per set of processors in the archive.
+
+    Note that this class does not transform mappings into canonical form.
+    """
+
+    def __init__(self):
+        self._processors = None
+        self._energy = None
+        # bitmask of used processors -> (times, energies, (id, mapping)s)
+        self._groups = {}
+        self._count = 0
+
+    def __len__(self):
+        return sum(len(group[0]) for group in self._groups.values())
+
+    def __iter__(self):
+        return iter(self.mappings())
+
+    def _costs(self, mapping):
+        if self._processors is None:
+            processors = mapping.platform.processors()
+            self._processors = {p: i for i, p in enumerate(processors)}
+            self._energy = bool(mapping.metadata.energy)
+        mask = 0
+        for p in mapping.get_used_processors():
+            mask |= 1 << self._processors[p]
+        energy = mapping.metadata.energy if self._energy else 0.0
+        return mask, mapping.metadata.exec_time, energy
+
+    def add(self, mapping):
+        """Add a mapping to the archive.
+
+        Args:
+            mapping (Mapping): an evaluated mapping
+
+        Returns:
+            bool: whether the mapping was accepted
+        """
+        mask, time, energy = self._costs(mapping)
+        for other, (times, energies, _) in self._groups.items():
+            if other & ~mask == 0:
+                k = bisect_right(times, time)
+                if k and energies[k - 1] <= energy:
+                    return False
+
+        for other in list(self._groups):
+            if mask & ~other:
+                continue
+            times, energies, entries = self._groups[other]
+            start = bisect_left(times, time)
+            end = start
+            while end < len(times) and energies[end] >= energy:
+                end += 1
+            del times[start:end], energies[start:end], entries[start:end]
+            if not times and other != mask:
+                del self._groups[other]
+
+        times, energies, entries = self._groups.setdefault(mask, ([], [], []))
+        k = bisect_left(times, time)
+        times.insert(k, time)
+        energies.insert(k, energy)
+        entries.insert(k, (self._count, mapping))
+        self._count += 1
+        return True
+
+    def update(self, mappings):
+        """Add several mappings to the archive.
+
+        Args:
+            mappings: an iterable of evaluated mappings
+
+        Returns:
+            int: the number of accepted mappings
+        """
+        return sum(self.add(m) for m in mappings)
+
+    def mappings(self):
+        """Return the mappings in the archive in the order they were added.
+
+        Returns:
+            A list of mappings forming the Pareto front.
+        """
+        entries = [e for group in self._groups.values() for e in group[2]]
+        return [m for _, m in sorted(entries, key=lambda e: e[0])]
@@ -3,6 +3,7 @@
 #
 # Authors: Christian Menard, Andres Goens, Robert Khasanov
 
+from collections import deque
 import random
 import timeit
 
@@ -13,6 +14,7 @@ from mocasin.mapper import BaseMapper
 from mocasin.mapper.random import RandomMapper
 from mocasin.mapper.utils import SimulationManager, SimulationManagerConfig
 from mocasin.util import logging
+from mocasin.util.lru import LRUCache
 
 
 log = logging.getLogger(__name__)
@@ -46,6 +48,32 @@ class RandomWalkMapper(BaseMapper):
             Defaults to 10.
         jobs (int, optional): Number of jobs for parallel simulation.
             Defaults to 1.
+        result_store (str, optional): Path to a persistent store of
+            simulation results that is shared across runs. Defaults to None.
+        cache_size (int, optional): Maximum number of simulation results
+            kept in memory. If None, the cache is unbounded. Defaults to
+            100000.
+        simulation_type (str, optional): The simulator used to evaluate
+            mappings, one of "dataflow", "fast" or "throughput". Defaults to
+            "dataflow".
+        prefilter (float, optional): If set, only this share of the
+            mappings of a batch with the shortest estimated execution times
+            is simulated. The results of the other mappings are estimated by a
+            static throughput analysis. Estimated mappings never become the best
+            mapping. Defaults to None.
+        time_budget (float, optional): Stop generating mappings after this
+            many seconds. Defaults to None.
+        plateau (int, optional): Stop generating mappings after this many
+            consecutive simulated mappings without improvement. Defaults to
+            None.
+        max_pending (int, optional): Maximum number of mappings submitted
+            for simulation, whose results were not processed yet. Defaults to
+            twice the number of mappings simulated in parallel.
+        seen_size (int, optional): Maximum number of generated mappings
+            remembered to skip duplicates. A mapping generated again after
+            it was forgotten is looked up in the cache of the simulation
+            manager. Defaults to `cache_size`, or to 100 times `max_pending`
+            if the cache is unbounded.
     """
 
     def __init__(
@@ -60,6 +88,14 @@ class RandomWalkMapper(BaseMapper):
         dump_cache=False,
         chunk_size=10,
         jobs=1,
+        result_store=None,
+        cache_size=100000,
+        simulation_type="dataflow",
+        prefilter=None,
+        time_budget=None,
+        plateau=None,
+        max_pending=None,
+        seen_size=None,
     ):
         super().__init__(platform, full_mapper=True)
         self.random_mapper = RandomMapper(
@@ -70,6 +106,16 @@ class RandomWalkMapper(BaseMapper):
         self.dump_cache = dump_cache
         self.seed = random_seed
         self.progress = progress
+        self.time_budget = time_budget
+        self.plateau = plateau
+        if max_pending is None:
+            max_pending = 2 * chunk_size * (jobs if parallel else 1)
+        self.max_pending = max(max_pending, chunk_size)
+        # the canonical mappings generated before are kept as long as their
+        # simulation results may be cached, but never without bound
+        if seen_size is None:
+            seen_size = cache_size or 100 * self.max_pending
+        self._seen_size = seen_size
         if self.seed == "None":
             self.seed = None
         if self.seed is not None:
@@ -82,6 +128,10 @@ class RandomWalkMapper(BaseMapper):
             parallel=parallel,
             progress=progress,
             chunk_size=chunk_size,
+            result_store=result_store,
+            cache_size=cache_size,
+            simulation_type=simulation_type,
+            prefilter=prefilter,
         )
         self._simulation_manager = SimulationManager(
             self.platform, config=simulation_config
@@ -113,42 +163,132 @@ class RandomWalkMapper(BaseMapper):
         """
         self._simulation_manager.reset_statistics()
         start = timeit.default_timer()
-        # Create a list of 'simulations'. These are later executed by multiple
-        # worker processes.
-        mappings = []
+        if (
+            hasattr(representation, "canonical_operations")
+            and not representation.canonical_operations
+        ):
+            to_repr_func = representation.toRepresentationNoncanonical
+        else:
+            to_repr_func = representation.toRepresentation
+
+        # Generate the random mappings and submit them for simulation in
+        # chunks, so that the worker processes simulate one chunk while the
+        # next one is generated. At most max_pending mappings are in flight,
+        # and their results are processed in the order of generation, such
+        # that the best mapping and the stopping criteria do not depend on
+        # the order in which the simulations finish.
+        chunk_size = self._simulation_manager.config.chunk_size
+        self._seen = LRUCache(self._seen_size)
+        self._pending = deque()
+        self._best = None
+        self._num_simulated = 0
+        self._num_estimated = 0
+        self._since_improvement = 0
 
         iterations_range = range(self.num_iterations)
         if self.progress:
             iterations_range = tqdm.tqdm(iterations_range)
 
+        chunk = []
+        num_samples = 0
+        stop_reason = "all iterations done"
         for i in iterations_range:
+            reason = self._stop_reason(start)
+            if reason:
+                stop_reason = reason
+                break
             mapping = self.random_mapper.generate_mapping(
                 graph, trace=trace, representation=representation
             )
-            mappings.append(mapping)
+            num_samples += 1
+            rep = to_repr_func(mapping)
+            if self._is_duplicate(tuple(rep)):
+                continue
+            chunk.append((i, mapping, rep))
+            if len(chunk) == chunk_size:
+                self._submit(graph, trace, representation, chunk)
+                chunk = []
+        self._submit(graph, trace, representation, chunk)
+        while self._pending:
+            self._process(self._pending.popleft())
 
-        if (
-            hasattr(representation, "canonical_operations")
-            and not representation.canonical_operations
-        ):
-            to_repr_func = representation.toRepresentationNoncanonical
-        else:
-            to_repr_func = representation.toRepresentation
-        tup = list(map(to_repr_func, mappings))
-
-        sim_results = self._simulation_manager.simulate(
-            graph, trace, representation, tup
-        )
-        exec_times = [x.exec_time for x in sim_results]
-        best_result_idx = exec_times.index(min(exec_times))
-        best_result = mappings[best_result_idx]
+        _, _, best_result = self._best
+        self._seen = None
         stop = timeit.default_timer()
         log.info(
-            f"Tried {len(exec_times)} random mappings in {stop-start:.1f}s"
+            f"Tried {num_samples} random mappings ({self._num_simulated} "
+            f"unique simulated, {self._num_estimated} estimated) in "
+            f"{stop-start:.1f}s, stopped: {stop_reason}"
         )
         if self._record_statistics:
             self._simulation_manager.statistics.to_file()
         if self.dump_cache:
             self._simulation_manager.dump("mapping_cache.csv")
+        self._simulation_manager.close()
 
         return best_result
+
+    def _stop_reason(self, start):
+        """Check whether the random walk should stop early.
+
+        No early stop happens before the first mapping was simulated.
+
+        Returns:
+            str: the reason to stop or ``None``
+        """
+        if self._best is None:
+            return None
+        if (
+            self.time_budget is not None
+            and timeit.default_timer() - start >= self.time_budget
+        ):
+            return "time budget exceeded"
+        if self.plateau is not None and self._since_improvement >= self.plateau:
+            return f"no improvement in {self.plateau} mappings"
+        return None
+
+    def _is_duplicate(self, key):
+        """Check whether a canonical mapping was generated before."""
+        if self._seen.get(key):
+            return True
+        self._seen.put(key, True)
+        return False
+
+    def _submit(self, graph, trace, representation, chunk):
+        """Submit a chunk of mappings and process finished results.
+
+        Blocks until at most `max_pending` mappings are in flight.
+        """
+        if not chunk:
+            return
+        futures = self._simulation_manager.submit(
+            graph, trace, representation, [rep for _, _, rep in chunk]
+        )
+        for (i, mapping, _), future in zip(chunk, futures):
+            self._pending.append((i, mapping, future))
+        while self._pending and (
+            len(self._pending) > self.max_pending or self._pending[0][2].done()
+        ):
+            self._process(self._pending.popleft())
+
+    def _process(self, entry):
+        """Record the simulation result of a pending mapping.
+
+        Results estimated by the pre-filter of the simulation manager are
+        skipped, so that only simulated mappings become the best mapping.
+        """
+        i, mapping, future = entry
+        for _ in self._simulation_manager.as_completed([future]):
+            pass
+        sim_res = future.result()
+        if sim_res.estimated:
+            self._num_estimated += 1
+            return
+        exec_time = sim_res.exec_time
+        self._num_simulated += 1
+        if self._best is None or (exec_time, i) < self._best[:2]:
+            self._best = (exec_time, i, mapping)
+            self._since_improvement = 0
+            log.debug(f"New best mapping #{i}: {exec_time}")
+        else:
+            self._since_improvement += 1
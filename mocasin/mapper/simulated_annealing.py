@@ -45,6 +45,13 @@ class SimulatedAnnealingMapper(BaseMapper):
             Defaults to False.
         jobs (int, optional): Number of jobs for parallel simulation.
             Defaults to 1.
+        result_store (str, optional): Path to a persistent store of
+            simulation results that is shared across runs. Defaults to None.
+        cache_size (int, optional): Maximum number of simulation results
+            kept in memory. If None, the cache is unbounded. Defaults to None.
+        simulation_type (str, optional): The simulator used to evaluate
+            mappings, one of "dataflow", "fast" or "throughput". Defaults to
+            "dataflow".
     """
 
     def __init__(
@@ -61,6 +68,9 @@ class SimulatedAnnealingMapper(BaseMapper):
         progress=False,
         parallel=False,
         jobs=1,
+        result_store=None,
+        cache_size=None,
+        simulation_type="dataflow",
     ):
         super().__init__(platform, full_mapper=True)
         random.seed(random_seed)
@@ -86,6 +96,9 @@ class SimulatedAnnealingMapper(BaseMapper):
             parallel=parallel,
             progress=progress,
             chunk_size=chunk_size,
+            result_store=result_store,
+            cache_size=cache_size,
+            simulation_type=simulation_type,
         )
         self._simulation_manager = SimulationManager(
             self.platform, config=simulation_config
@@ -219,5 +232,6 @@ class SimulatedAnnealingMapper(BaseMapper):
             self._simulation_manager.statistics.to_file()
         if self.dump_cache:
             self._simulation_manager.dump("mapping_cache.csv")
+        self._simulation_manager.close()
 
         return representation.fromRepresentation(best_mapping)
@@ -44,6 +44,18 @@ class TabuSearchMapper(BaseMapper):
             Defaults to False.
         jobs (int, optional): Number of jobs for parallel simulation.
             Defaults to 1.
+        result_store (str, optional): Path to a persistent store of
+            simulation results that is shared across runs. Defaults to None.
+        cache_size (int, optional): Maximum number of simulation results
+            kept in memory. If None, the cache is unbounded. Defaults to None.
+        simulation_type (str, optional): The simulator used to evaluate
+            mappings, one of "dataflow", "fast" or "throughput". Defaults to
+            "dataflow".
+        prefilter (float, optional): If set, only this share of the
+            mappings of a batch with the shortest estimated execution times
+            is simulated. The results of the other mappings are estimated by a
+            static throughput analysis. A move that improves on the best mapping
+            is simulated before it is accepted. Defaults to None.
     """
 
     def __init__(
@@ -61,6 +73,10 @@ class TabuSearchMapper(BaseMapper):
         progress=False,
         parallel=False,
         jobs=1,
+        result_store=None,
+        cache_size=None,
+        simulation_type="dataflow",
+        prefilter=None,
     ):
         super().__init__(platform, full_mapper=True)
         random.seed(random_seed)
@@ -81,6 +97,10 @@ class TabuSearchMapper(BaseMapper):
             parallel=parallel,
             progress=progress,
             chunk_size=chunk_size,
+            result_store=result_store,
+            cache_size=cache_size,
+            simulation_type=simulation_type,
+            prefilter=prefilter,
         )
         self._simulation_manager = SimulationManager(
             self.platform, config=simulation_config
@@ -249,6 +269,19 @@ class TabuSearchMapper(BaseMapper):
                 )  # updates tabu set
                 cur_mapping = cur_mapping + np.array(move)
                 since_last_improvement += 1
+                if (
+                    cur_exec_time < best_exec_time
+                    and self._simulation_manager.config.prefilter is not None
+                ):
+                    # the move may be ranked by an estimate of the pre-filter,
+                    # so the improvement is confirmed by a simulation
+                    cur_exec_time = self._simulation_manager.simulate(
+                        graph,
+                        trace,
+                        representation,
+                        [cur_mapping],
+                        prefilter=False,
+                    )[0].exec_time
                 if cur_exec_time < best_exec_time:
                     since_last_improvement = 0
                     best_exec_time = cur_exec_time
@@ -265,5 +298,6 @@ class TabuSearchMapper(BaseMapper):
             self._simulation_manager.statistics.to_file()
         if self.dump_cache:
             self._simulation_manager.dump("mapping_cache.csv")
+        self._simulation_manager.close()
 
         return representation.fromRepresentation(np.array(best_mapping))
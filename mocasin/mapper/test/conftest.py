@@ -83,3 +83,14 @@ def evaluation_function():
 @pytest.fixture
 def simres_evaluation_function(evaluation_function):
     return lambda m: SimulationResult(evaluation_function(m), None, None)
+
+
+@pytest.fixture
+def estimated_mappings(num_procs):
+    """Mappings that are estimated by a mocked pre-filter."""
+    return {
+        (x, y)
+        for x in range(num_procs)
+        for y in range(num_procs)
+        if (x + y) % 2 == 0
+    }
@@ -3,7 +3,10 @@
 #
 # Authors: Andres Goens
 
-from mocasin.mapper.utils import Statistics
+import concurrent.futures
+
+from mocasin.mapper.utils import SimulationManagerConfig, Statistics
+from mocasin.simulate import SimulationResult
 
 
 class MockMappingCache:
@@ -12,6 +15,51 @@ class MockMappingCache:
             map(simres_evaluation_function, x)
         )
         self.statistics = Statistics(mocker.Mock())
+        self.config = SimulationManagerConfig()
+
+    def submit(self, graph, trace, representation, mappings):
+        futures = []
+        for sim_res in self.simulate(graph, trace, representation, mappings):
+            future = concurrent.futures.Future()
+            future.set_result(sim_res)
+            futures.append(future)
+        return futures
+
+    def as_completed(self, futures):
+        return concurrent.futures.as_completed(futures)
 
     def reset_statistics(self):
         pass
+
+    def close(self):
+        pass
+
+
+class MockPrefilterMappingCache(MockMappingCache):
+    """A mock of a simulation manager with a pre-filter.
+
+    In a batch of multiple mappings, the mappings in `estimated` get an
+    estimated result, which undercuts all simulated results.
+    """
+
+    def __init__(self, simres_evaluation_function, mocker, estimated):
+        super().__init__(simres_evaluation_function, mocker)
+        self.config = SimulationManagerConfig(prefilter=0.5)
+        self.estimated = set(estimated)
+        self.simulated = []
+        self.num_estimated = 0
+        self._evaluate = simres_evaluation_function
+        self.simulate = self._simulate
+
+    def _simulate(self, graph, trace, representation, mappings, prefilter=True):
+        results = []
+        for m in mappings:
+            if prefilter and len(mappings) > 1 and tuple(m) in self.estimated:
+                self.num_estimated += 1
+                results.append(
+                    SimulationResult(-1.0, None, None, estimated=True)
+                )
+            else:
+                self.simulated.append(tuple(m))
+                results.append(self._evaluate(m))
+        return results
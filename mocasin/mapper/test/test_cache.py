@@ -0,0 +1,162 @@
+# Copyright (C) 2026 TU Dresden
+# Licensed under the ISC license (see LICENSE.txt)
+
+import pytest
+
+from mocasin.mapper.cache import (
+    MappingCache,
+    SimulationResultStore,
+    fingerprint_simulation_context,
+)
+from mocasin.mapper.partial import ComFullMapper, ProcPartialMapper
+from mocasin.mapper.test.test_fair import MockTrace
+from mocasin.mapper.test.test_utils import MockLoopTrace
+from mocasin.mapper.utils import SimulationManager, SimulationManagerConfig
+from mocasin.simulate import SimulationResult
+
+
+@pytest.fixture
+def mapper(graph, platform_odroid):
+    com_mapper = ComFullMapper(platform_odroid)
+    return ProcPartialMapper(graph, platform_odroid, com_mapper)
+
+
+@pytest.fixture
+def make_trace(graph, platform_odroid):
+    proc_names = [proc.name for proc in graph.processes()]
+    core_types = [core.type for core in platform_odroid.processors()]
+
+    def _make_trace(cycles):
+        return MockTrace(
+            proc_names, core_types, lambda _: cycles, max_length=10
+        )
+
+    return _make_trace
+
+
+def test_mapping_cache_lru():
+    cache = MappingCache(capacity=2)
+    res = [SimulationResult(i, None, None) for i in range(3)]
+    assert cache.add("g", (0, 1), res[0]) == 0
+    assert cache.add("g", (1, 1), res[1]) == 0
+    # touch (0, 1), so that (1, 1) becomes the least recently used entry
+    assert cache.lookup("g", (0, 1)) == res[0]
+    assert cache.add("g", (2, 1), res[2]) == 1
+    assert len(cache) == 2
+    assert cache.lookup("g", (1, 1)) is None
+    assert cache.lookup("g", (0, 1)) == res[0]
+    assert cache.lookup("other", (0, 1)) is None
+    assert sorted(m for _, m, _ in cache.items()) == [(0, 1), (2, 1)]
+
+
+def test_simulation_manager_bounded_cache(
+    graph, platform_odroid, representation_odroid, mapper, make_trace
+):
+    config = SimulationManagerConfig(cache_size=2)
+    simulation_manager = SimulationManager(platform_odroid, config)
+    trace = make_trace(5)
+    mappings = [mapper.generate_mapping([i, 4]) for i in range(3)]
+    simulation_manager.simulate(graph, trace, representation_odroid, mappings)
+    simulation_manager.simulate(
+        graph, trace, representation_odroid, mappings[2:]
+    )
+    stats = simulation_manager.statistics
+    assert len(simulation_manager._cache) == 2
+    assert stats._cache_misses == 3
+    assert stats._cache_hits == 1
+    assert stats._cache_evictions == 1
+
+
+def test_result_store(tmpdir):
+    path = str(tmpdir.join("results.db"))
+    store = SimulationResultStore(path)
+    assert store.lookup("ctx", (0, 1)) is None
+    store.add_results("ctx", [((0, 1), SimulationResult(10, None, None))])
+    store.close()
+
+    # a new store object reads the same database
+    store = SimulationResultStore(path)
+    assert store.lookup("ctx", (0, 1)) == SimulationResult(10, None, None)
+    assert store.lookup("other", (0, 1)) is None
+    assert len(store) == 1
+    store.close()
+
+
+def test_fingerprint(graph, platform_odroid, representation_odroid, make_trace):
+    fp1 = fingerprint_simulation_context(
+        platform_odroid, graph, make_trace(5), representation_odroid
+    )
+    fp2 = fingerprint_simulation_context(
+        platform_odroid, graph, make_trace(5), representation_odroid
+    )
+    fp3 = fingerprint_simulation_context(
+        platform_odroid, graph, make_trace(6), representation_odroid
+    )
+    fp4 = fingerprint_simulation_context(
+        platform_odroid, graph, make_trace(5), representation_odroid, "fast"
+    )
+    assert fp1 == fp2
+    assert fp1 != fp3
+    assert fp1 != fp4
+
+
+def test_simulation_manager_result_store(
+    tmpdir, graph, platform_odroid, representation_odroid, mapper, make_trace
+):
+    path = str(tmpdir.join("results.db"))
+    config = SimulationManagerConfig(result_store=path)
+    mapping = mapper.generate_mapping([0, 4])
+
+    with SimulationManager(platform_odroid, config) as simulation_manager:
+        expected = simulation_manager.simulate(
+            graph, make_trace(5), representation_odroid, [mapping]
+        )
+        assert simulation_manager.statistics._mappings_evaluated == 1
+
+    # a second manager (e.g., in another run) reads the stored result
+    with SimulationManager(platform_odroid, config) as simulation_manager:
+        result = simulation_manager.simulate(
+            graph, make_trace(5), representation_odroid, [mapping]
+        )
+        assert simulation_manager.statistics._mappings_evaluated == 0
+        assert simulation_manager.statistics._mappings_cached == 1
+        assert result == expected
+
+    # a different trace must not hit the stored result
+    with SimulationManager(platform_odroid, config) as simulation_manager:
+        simulation_manager.simulate(
+            graph, make_trace(6), representation_odroid, [mapping]
+        )
+        assert simulation_manager.statistics._mappings_evaluated == 1
+
+
+@pytest.mark.parametrize("simulation_type", ["fast", "throughput"])
+def test_simulation_manager_result_store_simulation_type(
+    tmpdir,
+    graph,
+    platform_odroid,
+    representation_odroid,
+    mapper,
+    simulation_type,
+):
+    proc_names = [proc.name for proc in graph.processes()]
+    core_types = [core.type for core in platform_odroid.processors()]
+    trace = MockLoopTrace(proc_names, core_types, lambda _: 5, max_length=10)
+    path = str(tmpdir.join("results.db"))
+    mappings = [mapper.generate_mapping([i, 4]) for i in range(4)]
+    for sim_type in [simulation_type, "dataflow"]:
+        config = SimulationManagerConfig(
+            result_store=path, simulation_type=sim_type
+        )
+        with SimulationManager(platform_odroid, config) as simulation_manager:
+            results = simulation_manager.simulate(
+                graph, trace, representation_odroid, mappings
+            )
+            # the results of the other simulation type are not reused
+            assert simulation_manager.statistics._mappings_evaluated == 4
+    assert len(SimulationResultStore(path)) == 8
+
+    expected = SimulationManager(platform_odroid).simulate(
+        graph, trace, representation_odroid, mappings
+    )
+    assert results == expected
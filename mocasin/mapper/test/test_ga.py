@@ -6,7 +6,10 @@
 import pytest
 
 from mocasin.mapper.genetic import GeneticMapper, Objectives
-from mocasin.mapper.test.mock_cache import MockMappingCache
+from mocasin.mapper.test.mock_cache import (
+    MockMappingCache,
+    MockPrefilterMappingCache,
+)
 
 
 @pytest.fixture
@@ -18,7 +21,8 @@ def mapper(
     return m
 
 
-def test_ga(mapper, graph, trace, representation):
+def test_ga(mapper, graph, trace, representation, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
     result = mapper.generate_mapping(
         graph, trace=trace, representation=representation
     )
@@ -27,6 +31,53 @@ def test_ga(mapper, graph, trace, representation):
     assert result.to_list() == [6, 6]
 
 
+def test_ga_batch_evaluation(
+    mapper, graph, trace, representation, tmp_path, monkeypatch
+):
+    monkeypatch.chdir(tmp_path)
+    simulate = mapper._simulation_manager.simulate
+    batches = []
+
+    def record_simulate(g, t, r, mappings):
+        batches.append(len(mappings))
+        return simulate(g, t, r, mappings)
+
+    mapper._simulation_manager.simulate = record_simulate
+    mapper.generate_mapping(graph, trace=trace, representation=representation)
+
+    # the initial population and each generation are simulated in one call
+    assert len(batches) == mapper._mapper_config.num_gens + 1
+    assert 1 < batches[0] <= mapper._mapper_config.pop_size
+
+    logbook = (tmp_path / "evolutionary_logbook.txt").read_text()
+    assert logbook.splitlines()[0].split()[-1] == "time"
+
+
+def test_ga_prefilter(
+    mapper,
+    graph,
+    trace,
+    representation,
+    simres_evaluation_function,
+    mocker,
+    estimated_mappings,
+    tmp_path,
+    monkeypatch,
+):
+    monkeypatch.chdir(tmp_path)
+    simulation_manager = MockPrefilterMappingCache(
+        simres_evaluation_function, mocker, estimated_mappings
+    )
+    mapper._simulation_manager = simulation_manager
+    result = mapper.generate_mapping(
+        graph, trace=trace, representation=representation
+    )
+
+    # estimated mappings are simulated before they enter the Pareto front
+    assert simulation_manager.num_estimated > 0
+    assert tuple(result.to_list()) in simulation_manager.simulated
+
+
 def test_objectives():
     flags = Objectives.from_string_list(["exec_time", "energy"])
 
@@ -3,7 +3,17 @@
 #
 # Author: Robert Khasanov
 
-from mocasin.mapper.pareto import mark_pareto_front, filter_pareto_front
+import random
+
+import numpy as np
+import pytest
+
+from mocasin.mapper.pareto import (
+    ParetoArchive,
+    _is_pareto_efficient,
+    filter_pareto_front,
+    mark_pareto_front,
+)
 from mocasin.mapper.partial import ComFullMapper, ProcPartialMapper
 
 
@@ -45,3 +55,55 @@ def test_filter_pareto_front(graph, platform_odroid):
             continue
         pm = next(pareto_iter)
         assert pm is m
+
+
+def _reference_pareto_efficient(costs):
+    is_efficient = np.ones(costs.shape[0], dtype=bool)
+    for i, c in enumerate(costs):
+        if is_efficient[i]:
+            is_efficient[is_efficient] = np.any(costs[is_efficient] < c, axis=1)
+            is_efficient[i] = True
+    return is_efficient
+
+
+@pytest.mark.parametrize("num_costs", [1, 2, 3, 5])
+def test_is_pareto_efficient(num_costs):
+    rng = np.random.default_rng(42)
+    for _ in range(20):
+        # small integer costs lead to ties and duplicates
+        costs = rng.integers(0, 8, size=(200, num_costs)).astype(float)
+        expected = _reference_pareto_efficient(costs)
+        assert list(_is_pareto_efficient(costs)) == list(expected)
+    assert len(_is_pareto_efficient(np.empty((0, num_costs)))) == 0
+
+
+@pytest.mark.parametrize("energy", [True, False])
+def test_pareto_front_random(graph, platform_odroid, energy):
+    com_mapper = ComFullMapper(platform_odroid)
+    mapper = ProcPartialMapper(graph, platform_odroid, com_mapper)
+    processors = platform_odroid.processors()
+    rng = random.Random(42)
+
+    mappings = []
+    for _ in range(300):
+        mapping = mapper.generate_mapping([rng.randrange(8), rng.randrange(8)])
+        mapping.metadata.exec_time = rng.randrange(20)
+        mapping.metadata.energy = rng.randrange(1, 20) if energy else None
+        mappings.append(mapping)
+
+    costs = []
+    for m in mappings:
+        procs = m.get_used_processors()
+        c = [int(p in procs) for p in processors] + [m.metadata.exec_time]
+        if energy:
+            c.append(m.metadata.energy)
+        costs.append(c)
+    expected = list(_reference_pareto_efficient(np.array(costs, dtype=float)))
+    assert mark_pareto_front(mappings) == expected
+
+    archive = ParetoArchive()
+    accepted = archive.update(mappings)
+    front = filter_pareto_front(mappings)
+    assert accepted >= len(front)
+    assert len(archive) == len(front)
+    assert all(a is b for a, b in zip(archive.mappings(), front))
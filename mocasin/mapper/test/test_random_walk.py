@@ -0,0 +1,131 @@
+# Copyright (C) 2026 TU Dresden
+# Licensed under the ISC license (see LICENSE.txt)
+
+import pytest
+
+from mocasin.mapper.random_walk import RandomWalkMapper
+from mocasin.mapper.test.mock_cache import (
+    MockMappingCache,
+    MockPrefilterMappingCache,
+)
+
+
+@pytest.fixture
+def mapper(platform, simres_evaluation_function, mocker):
+    m = RandomWalkMapper(platform, num_iterations=200, random_seed=42)
+    m._simulation_manager = MockMappingCache(simres_evaluation_function, mocker)
+    return m
+
+
+@pytest.fixture
+def simulated(mapper):
+    simulate = mapper._simulation_manager.simulate
+    mappings = []
+
+    def record_simulate(g, t, r, x):
+        mappings.extend(tuple(m) for m in x)
+        return simulate(g, t, r, x)
+
+    mapper._simulation_manager.simulate = record_simulate
+    return mappings
+
+
+def test_random_walk(
+    mapper, simulated, graph, trace, representation, evaluation_function
+):
+    result = mapper.generate_mapping(
+        graph, trace=trace, representation=representation
+    )
+
+    # each mapping is simulated once
+    assert len(simulated) == len(set(simulated))
+    assert len(simulated) == mapper._num_simulated
+    best = min(evaluation_function(m) for m in simulated)
+    assert evaluation_function(result.to_list()) == best
+
+
+def test_random_walk_plateau(
+    mapper, simulated, graph, trace, representation, evaluation_function
+):
+    mapper.plateau = 5
+    result = mapper.generate_mapping(
+        graph, trace=trace, representation=representation
+    )
+
+    # 49 different mappings exist
+    assert len(simulated) < 49
+    assert mapper._since_improvement >= 5
+    best = min(evaluation_function(m) for m in simulated)
+    assert evaluation_function(result.to_list()) == best
+
+
+def test_random_walk_time_budget(
+    mapper, simulated, graph, trace, representation
+):
+    mapper.time_budget = 0
+    result = mapper.generate_mapping(
+        graph, trace=trace, representation=representation
+    )
+
+    # the first chunk is simulated before the budget is checked
+    assert result is not None
+    assert len(simulated) == mapper._simulation_manager.config.chunk_size
+
+
+def test_random_walk_seen_size(
+    platform, simres_evaluation_function, mocker, graph, trace, representation
+):
+    mapper = RandomWalkMapper(
+        platform, num_iterations=1000, random_seed=42, seen_size=10
+    )
+    mapper._simulation_manager = MockMappingCache(
+        simres_evaluation_function, mocker
+    )
+    is_duplicate = mapper._is_duplicate
+    seen_sizes = []
+
+    def record_is_duplicate(key):
+        duplicate = is_duplicate(key)
+        seen_sizes.append(len(mapper._seen))
+        return duplicate
+
+    mapper._is_duplicate = record_is_duplicate
+    mapper.generate_mapping(graph, trace=trace, representation=representation)
+
+    # the remembered mappings are bounded, no matter how many are generated
+    assert len(seen_sizes) == 1000
+    assert max(seen_sizes) == 10
+
+
+def test_random_walk_default_seen_size(platform):
+    mapper = RandomWalkMapper(platform)
+    assert mapper._seen_size == 100000
+    mapper = RandomWalkMapper(platform, cache_size=None)
+    assert mapper._seen_size == 100 * mapper.max_pending
+
+
+def test_random_walk_prefilter(
+    platform,
+    simres_evaluation_function,
+    mocker,
+    graph,
+    trace,
+    representation,
+    evaluation_function,
+    estimated_mappings,
+):
+    mapper = RandomWalkMapper(platform, num_iterations=200, random_seed=42)
+    simulation_manager = MockPrefilterMappingCache(
+        simres_evaluation_function, mocker, estimated_mappings
+    )
+    mapper._simulation_manager = simulation_manager
+    result = mapper.generate_mapping(
+        graph, trace=trace, representation=representation
+    )
+
+    # the estimates undercut all simulated results, but are never the best
+    assert mapper._num_estimated == simulation_manager.num_estimated > 0
+    simulated = simulation_manager.simulated
+    assert tuple(result.to_list()) in simulated
+    best = min(evaluation_function(m) for m in simulated)
+    assert evaluation_function(result.to_list()) == best
@@ -8,7 +8,10 @@ from itertools import product
 import pytest
 
 from mocasin.mapper.tabu_search import TabuSearchMapper
-from mocasin.mapper.test.mock_cache import MockMappingCache
+from mocasin.mapper.test.mock_cache import (
+    MockMappingCache,
+    MockPrefilterMappingCache,
+)
 
 
 @pytest.fixture
@@ -34,6 +37,28 @@ def test_ts(mapper, graph, trace, representation, evaluation_function):
     assert tuple(result_mapper.to_list()) in expected
 
 
+def test_ts_prefilter(
+    mapper,
+    graph,
+    trace,
+    representation,
+    simres_evaluation_function,
+    mocker,
+    estimated_mappings,
+):
+    simulation_manager = MockPrefilterMappingCache(
+        simres_evaluation_function, mocker, estimated_mappings
+    )
+    mapper._simulation_manager = simulation_manager
+    result_mapper = mapper.generate_mapping(
+        graph, trace=trace, representation=representation
+    )
+
+    # moves ranked by an estimate are simulated before they become the best
+    assert simulation_manager.num_estimated > 0
+    assert tuple(result_mapper.to_list()) in simulation_manager.simulated
+
+
 def test_update_candidate_moves(mapper, graph, trace, representation):
     mapper.update_candidate_moves(graph, trace, representation, [3, 3])
     moves = [move for (move, _) in mapper.moves]
@@ -3,12 +3,29 @@
 #
 # Author: Robert Khasanov
 
+import itertools
+
 import pytest
 
+from mocasin.common.platform import SchedulingPolicy
+from mocasin.common.trace import TraceLoop
 from mocasin.mapper.partial import ComFullMapper, ProcPartialMapper
 from mocasin.mapper.test.test_fair import MockTrace
-from mocasin.mapper.utils import SimulationManager, SimulationManagerConfig
+from mocasin.mapper.utils import (
+    SimulationManager,
+    SimulationManagerConfig,
+    decode_mapping,
+    encode_mapping,
+)
+from mocasin.representations import SymmetryRepresentation
 from mocasin.simulate import SimulationResult
+from mocasin.simulate.throughput import ThroughputAnalysis
+
+
+class MockLoopTrace(MockTrace):
+    def get_trace_loop(self, proc_name):
+        body = itertools.islice(self.get_trace(proc_name), 1)
+        return TraceLoop((), body, self.max_length)
 
 
 @pytest.fixture
@@ -38,3 +55,287 @@ def test_simulation_manager_cache(
     lookup_result = simulation_manager.lookup(graph, tuple([0, 4]))
     assert isinstance(lookup_result, SimulationResult)
     assert simulation_result[0] == lookup_result
+
+
+def test_encode_decode_mapping(graph, platform_odroid, mapper):
+    mapping = mapper.generate_mapping([0, 4])
+    encoded = encode_mapping(mapping)
+    decoded = decode_mapping(encoded, graph, platform_odroid)
+    assert decoded.to_list() == mapping.to_list()
+    for p in graph.processes():
+        info = mapping.process_info(p)
+        decoded_info = decoded.process_info(p)
+        assert decoded_info.scheduler is info.scheduler
+        assert decoded_info.affinity is info.affinity
+        assert decoded_info.priority == info.priority
+    for c in graph.channels():
+        info = mapping.channel_info(c)
+        decoded_info = decoded.channel_info(c)
+        assert decoded_info.primitive is info.primitive
+        assert decoded_info.capacity == info.capacity
+
+
+def test_simulation_manager_persistent_pool(
+    graph, platform_odroid, representation_odroid, mapper
+):
+    proc_names = [proc.name for proc in graph.processes()]
+    core_types = [core.type for core in platform_odroid.processors()]
+    trace = MockTrace(proc_names, core_types, lambda _: 5, max_length=10)
+    mappings = [mapper.generate_mapping([i, j]) for i in range(4) for j in [4]]
+    config = SimulationManagerConfig(jobs=2, parallel=True, chunk_size=1)
+    with SimulationManager(platform_odroid, config) as simulation_manager:
+        results = simulation_manager.simulate(
+            graph, trace, representation_odroid, mappings[:2]
+        )
+        pool = simulation_manager._pool
+        assert pool is not None
+        results += simulation_manager.simulate(
+            graph, trace, representation_odroid, mappings[2:]
+        )
+        # the pool is reused across simulate() calls
+        assert simulation_manager._pool is pool
+    assert simulation_manager._pool is None
+
+    sequential = SimulationManager(platform_odroid)
+    expected = sequential.simulate(
+        graph, trace, representation_odroid, mappings
+    )
+    assert results == expected
+
+
+def test_simulation_manager_pool_context_switch(
+    graph, platform_odroid, representation_odroid, mapper, mocker, tmpdir
+):
+    proc_names = [proc.name for proc in graph.processes()]
+    core_types = [core.type for core in platform_odroid.processors()]
+    traces = [
+        MockTrace(proc_names, core_types, lambda _, n=n: n, max_length=10)
+        for n in [5, 7]
+    ]
+    mappings = [mapper.generate_mapping([i, 4]) for i in range(4)]
+    # simulate different mappings per trace, since the in-memory cache does
+    # not distinguish traces
+    mappings = [mappings[:2], mappings[2:]]
+    config = SimulationManagerConfig(
+        jobs=2,
+        parallel=True,
+        chunk_size=1,
+        result_store=str(tmpdir.join("results.db")),
+    )
+    with SimulationManager(platform_odroid, config) as simulation_manager:
+        futures = simulation_manager.submit(
+            graph, traces[0], representation_odroid, mappings[0]
+        )
+        pool = simulation_manager._pool
+        close = mocker.spy(simulation_manager, "close")
+        store_close = mocker.spy(simulation_manager._store, "close")
+        simulation_manager.simulate(
+            graph, traces[1], representation_odroid, mappings[1]
+        )
+        # switching the trace only replaces the worker pool
+        assert simulation_manager._pool is not pool
+        assert close.call_count == 0
+        assert store_close.call_count == 0
+        assert all(f.done() for f in futures)
+
+    # the results are stored under the trace they were submitted with
+    for trace, trace_mappings in zip(traces, mappings):
+        expected = SimulationManager(platform_odroid).simulate(
+            graph, trace, representation_odroid, trace_mappings
+        )
+        with SimulationManager(platform_odroid, config) as simulation_manager:
+            results = simulation_manager.simulate(
+                graph, trace, representation_odroid, trace_mappings
+            )
+            assert simulation_manager.statistics._mappings_evaluated == 0
+        assert results == expected
+
+
+def test_simulation_manager_cached_trace(
+    graph, platform_odroid, representation_odroid, mapper
+):
+    proc_names = [proc.name for proc in graph.processes()]
+    core_types = [core.type for core in platform_odroid.processors()]
+    traces = [
+        MockTrace(proc_names, core_types, lambda _, n=n: n, max_length=10)
+        for n in [5, 7]
+    ]
+    config = SimulationManagerConfig(simulation_type="fast")
+    simulation_manager = SimulationManager(platform_odroid, config)
+    for i, trace in enumerate(traces):
+        mapping = mapper.generate_mapping([i, 4])
+        simulation_manager.simulate(
+            graph, trace, representation_odroid, [mapping]
+        )
+        # only the wrapper of the current trace and its batch are kept
+        assert simulation_manager._cached_trace.trace is trace
+        assert len(simulation_manager._batches) == 1
+    simulation_manager.close()
+    assert simulation_manager._cached_trace is None
+    assert not simulation_manager._batches
+
+
+@pytest.mark.parametrize("parallel", [False, True])
+def test_simulation_manager_fast_simulation(
+    graph, platform_odroid, representation_odroid, mapper, parallel
+):
+    proc_names = [proc.name for proc in graph.processes()]
+    core_types = [core.type for core in platform_odroid.processors()]
+    trace = MockTrace(proc_names, core_types, lambda _: 5, max_length=10)
+    mappings = [mapper.generate_mapping([i, 4]) for i in range(4)]
+    config = SimulationManagerConfig(
+        jobs=2, parallel=parallel, chunk_size=1, simulation_type="fast"
+    )
+    with SimulationManager(platform_odroid, config) as simulation_manager:
+        results = simulation_manager.simulate(
+            graph, trace, representation_odroid, mappings
+        )
+
+    expected = SimulationManager(platform_odroid).simulate(
+        graph, trace, representation_odroid, mappings
+    )
+    assert results == expected
+
+
+@pytest.mark.parametrize("parallel", [False, True])
+def test_simulation_manager_throughput_analysis(
+    graph, platform_odroid, representation_odroid, mapper, parallel
+):
+    proc_names = [proc.name for proc in graph.processes()]
+    core_types = [core.type for core in platform_odroid.processors()]
+    trace = MockLoopTrace(proc_names, core_types, lambda _: 5, max_length=10)
+    mappings = [mapper.generate_mapping([i, 4]) for i in range(4)]
+    config = SimulationManagerConfig(
+        jobs=2, parallel=parallel, chunk_size=1, simulation_type="throughput"
+    )
+    with SimulationManager(platform_odroid, config) as simulation_manager:
+        results = simulation_manager.simulate(
+            graph, trace, representation_odroid, mappings
+        )
+
+    analysis = ThroughputAnalysis(platform_odroid, graph, trace)
+    assert results == analysis.simulate(mappings)
+
+
+def test_simulation_manager_unknown_simulation_type(platform_odroid):
+    with pytest.raises(ValueError):
+        SimulationManager(
+            platform_odroid, SimulationManagerConfig(simulation_type="foo")
+        )
+
+
+def test_simulation_manager_fast_simulation_policy(platform_odroid):
+    scheduler = next(iter(platform_odroid.schedulers()))
+    scheduler.policy = SchedulingPolicy("Multithread", 100)
+    with pytest.raises(ValueError, match="Multithread"):
+        SimulationManager(
+            platform_odroid, SimulationManagerConfig(simulation_type="fast")
+        )
+    # other simulation types support all policies
+    SimulationManager(platform_odroid, SimulationManagerConfig())
+
+
+@pytest.mark.parametrize("parallel", [False, True])
+def test_simulation_manager_submit(
+    graph, platform_odroid, representation_odroid, mapper, parallel
+):
+    proc_names = [proc.name for proc in graph.processes()]
+    core_types = [core.type for core in platform_odroid.processors()]
+    trace = MockTrace(proc_names, core_types, lambda _: 5, max_length=10)
+    mappings = [mapper.generate_mapping([i, 4]) for i in range(4)]
+    config = SimulationManagerConfig(jobs=2, parallel=parallel, chunk_size=1)
+    with SimulationManager(platform_odroid, config) as simulation_manager:
+        futures = simulation_manager.submit(
+            graph, trace, representation_odroid, mappings[:3]
+        )
+        # a mapping that is submitted twice is simulated only once
+        futures += simulation_manager.submit(
+            graph, trace, representation_odroid, mappings[2:]
+        )
+        assert len(futures) == 5
+        completed = list(simulation_manager.as_completed(futures))
+        assert set(completed) == set(futures)
+        assert len(simulation_manager._cache) == 4
+        assert not simulation_manager._inflight
+        assert simulation_manager.statistics._mappings_evaluated == 4
+        results = [f.result() for f in futures]
+
+    expected = SimulationManager(platform_odroid).simulate(
+        graph, trace, representation_odroid, mappings[:3] + mappings[2:]
+    )
+    assert results == expected
+
+
+def test_simulation_manager_canonical_cache(
+    graph, platform_odroid, mapper, tmpdir
+):
+    proc_names = [proc.name for proc in graph.processes()]
+    core_types = [core.type for core in platform_odroid.processors()]
+    trace = MockTrace(proc_names, core_types, lambda _: 5, max_length=10)
+    representation = SymmetryRepresentation(
+        graph, platform_odroid, disable_mpsym=True
+    )
+    simulation_manager = SimulationManager(
+        platform_odroid, SimulationManagerConfig(jobs=1)
+    )
+    mappings = [mapper.generate_mapping(m) for m in [[0, 4], [1, 4], [0, 4]]]
+    simulation_manager.simulate(graph, trace, representation, mappings)
+    simulation_manager.close()
+
+    with tmpdir.as_cwd():
+        simulation_manager.statistics.to_file()
+        lines = tmpdir.join("statistics.txt").readlines()
+    assert lines[-3:] == [
+        "Canonical form cache hits: 1\n",
+        "Canonical form cache misses: 2\n",
+        f"Canonical form cache hit rate: {1 / 3}\n",
+    ]
+
+
+@pytest.mark.parametrize("submit", [False, True])
+def test_simulation_manager_prefilter(
+    graph, platform_odroid, representation_odroid, mapper, submit
+):
+    proc_names = [proc.name for proc in graph.processes()]
+    core_types = [core.type for core in platform_odroid.processors()]
+    trace = MockLoopTrace(
+        proc_names,
+        core_types,
+        lambda k: 10 if k[0] == "ARM_CORTEX_A7" else 3,
+        max_length=10,
+    )
+    vectors = [(0, 4), (4, 4), (0, 0), (4, 5)]
+    mappings = [mapper.generate_mapping(list(v)) for v in vectors]
+    expected = SimulationManager(platform_odroid).simulate(
+        graph, trace, representation_odroid, mappings
+    )
+
+    config = SimulationManagerConfig(prefilter=0.5)
+    with SimulationManager(platform_odroid, config) as simulation_manager:
+        if submit:
+            futures = simulation_manager.submit(
+                graph, trace, representation_odroid, mappings
+            )
+            results = [f.result() for f in futures]
+        else:
+            results = simulation_manager.simulate(
+                graph, trace, representation_odroid, mappings
+            )
+        # only the two mappings with the shortest estimated execution times
+        # are simulated, the estimates are not cached
+        assert simulation_manager.statistics._mappings_estimated == 2
+        assert len(simulation_manager._cache) == 2
+        for v, m, result, reference in zip(
+            vectors, mappings, results, expected
+        ):
+            if simulation_manager.lookup(graph, v):
+                assert result == reference
+                assert not m.metadata.estimated
+            else:
+                assert result.estimated
+                assert m.metadata.estimated
+                assert result.exec_time == pytest.approx(
+                    reference.exec_time, rel=0.1
+                )
+        assert simulation_manager.lookup(graph, (4, 5))
+        assert not simulation_manager.lookup(graph, (0, 0))
@@ -3,8 +3,12 @@
 #
 # Authors: Andrés Goens, Felix Teweleit, Robert Khasanov
 
+from collections import deque
+import concurrent.futures
 import csv
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
+import functools
+import math
 import multiprocessing as mp
 import os
 import pickle
@@ -17,8 +21,24 @@ from hydra.core.hydra_config import HydraConfig
 import numpy as np
 import tqdm
 
-from mocasin.common.mapping import Mapping
+from mocasin.common.mapping import (
+    ChannelMappingInfo,
+    Mapping,
+    ProcessMappingInfo,
+)
+from mocasin.common.trace import CachedTrace
+from mocasin.mapper.cache import (
+    MappingCache,
+    SimulationResultStore,
+    fingerprint_simulation_context,
+)
 from mocasin.simulate import DataflowSimulation
+from mocasin.simulate.fast import (
+    FastDataflowSimulation,
+    FastSimulationBatch,
+    unsupported_policies,
+)
+from mocasin.simulate.throughput import ThroughputAnalysis, ThroughputSimulation
 from mocasin.util.logging import getLogger
 
 log = getLogger(__name__)
@@ -38,17 +58,34 @@ class Statistics(object):
     def reset(self):
         self._mappings_cached = 0
         self._mappings_evaluated = 0
+        self._mappings_estimated = 0
         self._simulation_time = 0
         self._representation_time = 0
         self._representation_init_time = 0
+        self._cache_hits = 0
+        self._cache_misses = 0
+        self._cache_evictions = 0
+        self._canonical_cache = None
 
     def mappings_cached(self, num=1):
         self._mappings_cached += num
 
+    def cache_hit(self):
+        self._cache_hits += 1
+
+    def cache_miss(self):
+        self._cache_misses += 1
+
+    def cache_evictions(self, num=1):
+        self._cache_evictions += num
+
     def mapping_evaluated(self, simulation_time):
         self._mappings_evaluated += 1
         self._simulation_time += simulation_time
 
+    def mappings_estimated(self, num=1):
+        self._mappings_estimated += num
+
     def add_offset(self, time):
         self._simulation_time += time
 
@@ -58,21 +95,50 @@ class Statistics(object):
     def set_rep_init_time(self, time):
         self._representation_init_time = time
 
+    def set_canonical_cache(self, cache):
+        """Report the hit rate of a canonical form cache.
+
+        Args:
+            cache (CanonicalFormCache): the cache of the representation, or
+                ``None`` if the representation has none
+        """
+        self._canonical_cache = cache
+
     def log_statistics(self):
         self._log.info(f"Mappings cached: {self._mappings_cached}")
         self._log.info(f"Mappings evaluated: {self._mappings_evaluated}")
+        self._log.info(f"Mappings estimated: {self._mappings_estimated}")
         self._log.info(f"Time spent simulating: {self._simulation_time}")
+        self._log.info(
+            f"Cache hits/misses/evictions: {self._cache_hits}/"
+            f"{self._cache_misses}/{self._cache_evictions}"
+        )
+        if self._canonical_cache is not None:
+            cache = self._canonical_cache
+            self._log.info(
+                f"Canonical form cache hits/misses: {cache.hits}/"
+                f"{cache.misses} (hit rate {cache.hit_rate:.3f})"
+            )
 
     def to_file(self):
         with open("statistics.txt", "x") as file:
             file.write(f"Mappings cached: {self._mappings_cached}\n")
             file.write(f"Mappings evaluated: {self._mappings_evaluated}\n")
+            file.write(f"Mappings estimated: {self._mappings_estimated}\n")
             file.write(f"Time spent simulating: {self._simulation_time}\n")
             file.write(f"Representation time: {self._representation_time}\n")
             file.write(
                 "Representation initialization time:"
                 f" {self._representation_init_time}\n"
             )
+            file.write(f"Cache hits: {self._cache_hits}\n")
+            file.write(f"Cache misses: {self._cache_misses}\n")
+            file.write(f"Cache evictions: {self._cache_evictions}\n")
+            if self._canonical_cache is not None:
+                cache = self._canonical_cache
+                file.write(f"Canonical form cache hits: {cache.hits}\n")
+                file.write(f"Canonical form cache misses: {cache.misses}\n")
+                file.write(f"Canonical form cache hit rate: {cache.hit_rate}\n")
 
 
 @dataclass
@@ -83,32 +149,482 @@ class SimulationManagerConfig:
     parallel: bool = False
     progress: bool = False
     chunk_size: int = 10
+    result_store: str = None
+    cache_size: int = None
+    cache_traces: bool = True
+    simulation_type: str = "dataflow"
+    prefilter: float = None
+
+
+# Simulation classes selectable by SimulationManagerConfig.simulation_type
+SIMULATION_TYPES = {
+    "dataflow": DataflowSimulation,
+    "fast": FastDataflowSimulation,
+    "throughput": ThroughputSimulation,
+}
+
+# Simulation classes that evaluate many mappings with a shared batch
+BATCH_TYPES = {
+    FastDataflowSimulation: FastSimulationBatch,
+    ThroughputSimulation: ThroughputAnalysis,
+}
+
+
+def encode_mapping(mapping):
+    """Encode a mapping into a compact, platform-independent tuple.
+
+    The encoded mapping only refers to processes, channels, schedulers,
+    processors and primitives by their names. Thus, it is cheap to pickle and
+    can be decoded with :func:`decode_mapping` in any process that holds its
+    own copy of the graph and the platform.
+
+    Args:
+        mapping (Mapping): a complete mapping
+
+    Returns:
+        tuple: a tuple ``(processes, channels)``, where ``processes`` is a
+            tuple of ``(process, scheduler, processor, priority)`` tuples and
+            ``channels`` is a tuple of ``(channel, primitive, capacity)``
+            tuples.
+    """
+    processes = []
+    for p in mapping.graph.processes():
+        info = mapping.process_info(p)
+        processes.append(
+            (p.name, info.scheduler.name, info.affinity.name, info.priority)
+        )
+    channels = []
+    for c in mapping.graph.channels():
+        info = mapping.channel_info(c)
+        channels.append((c.name, info.primitive.name, info.capacity))
+    return tuple(processes), tuple(channels)
+
+
+def decode_mapping(encoded, graph, platform):
+    """Reconstruct a mapping encoded by :func:`encode_mapping`.
+
+    Args:
+        encoded (tuple): an encoded mapping
+        graph (DataflowGraph): the dataflow graph of the mapping
+        platform (Platform): the platform of the mapping
+
+    Returns:
+        Mapping: the decoded mapping
+    """
+    processes, channels = encoded
+    mapping = Mapping(graph, platform)
+    for name, scheduler, processor, priority in processes:
+        info = ProcessMappingInfo(
+            platform.find_scheduler(scheduler),
+            platform.find_processor(processor),
+            priority,
+        )
+        mapping.add_process_info(graph.find_process(name), info)
+    for name, primitive, capacity in channels:
+        info = ChannelMappingInfo(platform.find_primitive(primitive), capacity)
+        mapping.add_channel_info(graph.find_channel(name), info)
+    return mapping
+
+
+# The simulation context (platform, graph, trace, simulation class, batch) of a
+# pool worker. It is set once by the pool initializer and then reused by all
+# simulations executed by the worker.
+_worker_context = None
+
+
+def _init_simulation_worker(
+    platform, graph, trace, simulation_class, cfg_pickled
+):
+    """Initialize a worker process of :class:`SimulationWorkerPool`.
+
+    Logging is not configured in the spawned processes on mac OS.
+    As a workaround, suggested in
+    https://github.com/facebookresearch/hydra/issues/1005
+    we pass the hydra configuration from the main process.
+    """
+    global _worker_context
+    if cfg_pickled:
+        config = pickle.loads(cfg_pickled)
+        hydra.core.utils.configure_log(config.job_logging, config.verbose)
+    batch = None
+    if simulation_class in BATCH_TYPES:
+        batch = BATCH_TYPES[simulation_class](platform, graph, trace)
+    _worker_context = (platform, graph, trace, simulation_class, batch)
+
+
+def _simulate_encoded_mapping(encoded):
+    """Simulate an encoded mapping within a pool worker.
+
+    Returns:
+        tuple: the simulation result and the time spent simulating
+    """
+    platform, graph, trace, simulation_class, batch = _worker_context
+    mapping = decode_mapping(encoded, graph, platform)
+    if batch is not None:
+        return run_batch_simulation(batch, mapping)
+    simulation = simulation_class(
+        platform, graph, mapping, trace, production=True
+    )
+    simulation, time = run_simulation(simulation)
+    return simulation.result, time
+
+
+def _simulate_encoded_mappings(encoded_mappings):
+    """Simulate a chunk of encoded mappings within a pool worker.
+
+    Returns:
+        list of tuple: the simulation result and the time spent simulating
+            for each mapping
+    """
+    return [_simulate_encoded_mapping(e) for e in encoded_mappings]
+
+
+class SimulationWorkerPool:
+    """A pool of long-lived worker processes for running simulations.
+
+    The platform, the graph and the trace are transferred to each worker only
+    once, when the worker starts. Afterwards, only encoded mappings (see
+    :func:`encode_mapping`) and simulation results cross the process boundary.
+
+    Args:
+        platform (Platform): the simulated platform
+        graph (DataflowGraph): the simulated dataflow graph
+        trace (DataflowTrace): the trace of the graph
+        jobs (int, optional): the number of worker processes. If ``None``,
+            the number of CPUs is used.
+        simulation_class (type, optional): the simulation class used by the
+            workers. Defaults to :class:`~mocasin.simulate.DataflowSimulation`.
+    """
+
+    def __init__(
+        self,
+        platform,
+        graph,
+        trace,
+        jobs=None,
+        simulation_class=DataflowSimulation,
+    ):
+        self.platform = platform
+        self.graph = graph
+        self.trace = trace
+
+        # Logging are not configured in the spawned processes on mac OS.
+        # As a workaround, suggested in
+        # https://github.com/facebookresearch/hydra/issues/1005
+        # we pass the hydra configuration to the child processes
+        cfg_pickled = None
+        if HydraConfig.initialized():
+            config = HydraConfig.get()
+            cfg_pickled = cloudpickle.dumps(config)
+
+        log.debug(f"start a simulation worker pool (jobs: {jobs})")
+        self._pool = mp.Pool(
+            processes=jobs,
+            initializer=_init_simulation_worker,
+            initargs=(platform, graph, trace, simulation_class, cfg_pickled),
+        )
+
+    def serves(self, platform, graph, trace):
+        """Check whether the workers hold the given simulation context."""
+        return (
+            self.platform is platform
+            and self.graph is graph
+            and self.trace is trace
+        )
+
+    def imap(self, mappings, chunksize=1):
+        """Simulate mappings in the worker processes.
+
+        Args:
+            mappings (list of Mapping): mappings to be simulated
+            chunksize (int): number of mappings sent to a worker at once
+
+        Returns:
+            iterator: an iterator over tuples of the simulation result and
+                the time spent simulating, in the order of `mappings`.
+        """
+        encoded = [encode_mapping(m) for m in mappings]
+        return self._pool.imap(
+            _simulate_encoded_mapping, encoded, chunksize=chunksize
+        )
+
+    def apply_async(self, mappings, callback, error_callback):
+        """Simulate a chunk of mappings in a worker process without waiting.
+
+        The callbacks are called from a helper thread of the pool.
+
+        Args:
+            mappings (list of Mapping): mappings to be simulated
+            callback (callable): called with a list of tuples of the
+                simulation result and the time spent simulating, in the order
+                of `mappings`
+            error_callback (callable): called with the exception if the
+                simulation fails
+        """
+        encoded = [encode_mapping(m) for m in mappings]
+        self._pool.apply_async(
+            _simulate_encoded_mappings,
+            (encoded,),
+            callback=callback,
+            error_callback=error_callback,
+        )
+
+    def close(self):
+        """Shut down the worker processes."""
+        log.debug("shut down the simulation worker pool")
+        self._pool.close()
+        self._pool.join()
 
 
 class SimulationManager:
+    """Manages the simulation of mappings.
+
+    The simulation manager caches the simulation results in a
+    :class:`~mocasin.mapper.cache.MappingCache`, which is bounded by
+    ``config.cache_size``, and runs the simulations either sequentially or in
+    parallel. The simulator is selected by ``config.simulation_type`` (see
+    :data:`SIMULATION_TYPES`). If ``config.result_store`` is set, the results
+    are also persisted in a
+    :class:`~mocasin.mapper.cache.SimulationResultStore`, which is consulted
+    on a cache miss before simulating. If ``config.prefilter`` is set, only
+    this share of the uncached mappings is simulated, namely the mappings
+    with the shortest execution times estimated by a
+    :class:`~mocasin.simulate.throughput.ThroughputAnalysis`. The other
+    mappings get the estimated results, which are not cached and are marked
+    as ``estimated``. Unless
+    ``config.cache_traces`` is disabled, the simulated traces are wrapped in
+    a :class:`~mocasin.common.trace.CachedTrace`, so that the segments of
+    each process are generated only once and are shared by all simulations.
+    Only the wrapper of the most recently simulated trace is kept.
+    For parallel simulation, the manager keeps a :class:`SimulationWorkerPool`
+    alive across calls of :meth:`simulate`. The pool is shut down by
+    :meth:`close`, which should be called once the mapper does not need to
+    simulate anymore. The manager may also be used in a with statement to
+    ensure this.
+
+    Args:
+        platform (Platform): the platform
+        config (SimulationManagerConfig, optional): the configuration
+    """
+
     def __init__(self, platform, config=None):
         if not config:
             config = SimulationManagerConfig()
         self.config = config
         self.platform = platform
         self.statistics = Statistics(log)
-        self._cache = {}
+        self._cache = MappingCache(capacity=config.cache_size)
+        self._pool = None
+        self._cached_trace = None
+        self._batches = {}
+        self._analyses = {}
+        # simulations started by submit() that did not finish yet, and
+        # finished chunks whose results are not recorded yet
+        self._inflight = {}
+        self._finished = deque()
+        try:
+            self._simulation_class = SIMULATION_TYPES[config.simulation_type]
+        except KeyError:
+            raise ValueError(
+                f"Unknown simulation type: {config.simulation_type}"
+            ) from None
+        if self._simulation_class is FastDataflowSimulation:
+            unsupported = unsupported_policies(platform)
+            if unsupported:
+                raise ValueError(
+                    "The fast simulation does not support the scheduling "
+                    f"policies {sorted(unsupported)} of the platform. Use "
+                    "simulation_type=dataflow instead."
+                )
+
+        self._store = None
+        if config.result_store:
+            self._store = SimulationResultStore(config.result_store)
+        # simulation context fingerprints used as keys in the result store
+        self._fingerprints = {}
+        self._store_contexts = {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, type, value, traceback):
+        self.close()
+
+    def close(self):
+        """Shut down the worker pool and close the result store.
+
+        Waits for all simulations started by :meth:`submit`, and persists the
+        canonical form cache of the representation (if enabled).
+        """
+        self._close_pool()
+        self._record_finished()
+        self._release_cached_trace()
+        if self._store is not None:
+            self._store.close()
+        if self.statistics._canonical_cache is not None:
+            self.statistics._canonical_cache.save()
+
+    def _close_pool(self):
+        """Shut down the worker pool (if running).
+
+        The pool finishes the simulations started before. Their results are
+        recorded by the next call of :meth:`_record_finished`.
+        """
+        if self._pool is not None:
+            self._pool.close()
+            self._pool = None
+
+    def _update_store_context(self, graph, trace, representation):
+        """Select the result store context used for the given graph."""
+        key = (graph, trace, representation)
+        if key not in self._fingerprints:
+            self._fingerprints[key] = fingerprint_simulation_context(
+                self.platform,
+                graph,
+                self._get_cached_trace(trace),
+                representation,
+                self.config.simulation_type,
+            )
+        self._store_contexts[graph] = self._fingerprints[key]
+
+    def _get_cached_trace(self, trace):
+        """Get the trace whose segments are shared by all simulations.
+
+        Like the worker pool, the wrapper is replaced if another trace is
+        simulated, so that the materialized segments of only one trace are
+        kept in memory.
+        """
+        if not self.config.cache_traces or isinstance(trace, CachedTrace):
+            return trace
+        if self._cached_trace is None or self._cached_trace.trace is not trace:
+            self._release_cached_trace()
+            self._cached_trace = CachedTrace(trace)
+        return self._cached_trace
+
+    def _release_cached_trace(self):
+        """Drop the trace wrapper and the batches and analyses built on it."""
+        if self._cached_trace is None:
+            return
+        for cache in (self._batches, self._analyses):
+            for key in [k for k in cache if k[1] is self._cached_trace]:
+                del cache[key]
+        self._cached_trace = None
+
+    def _get_batch(self, graph, trace):
+        """Get the batch that evaluates mappings of a graph at once.
+
+        Returns:
+            FastSimulationBatch or ThroughputAnalysis: the batch shared by all
+                sequential simulations of `graph` and `trace`, or ``None`` if
+                the simulation type does not support batches (see
+                :data:`BATCH_TYPES`)
+        """
+        if self._simulation_class not in BATCH_TYPES:
+            return None
+        key = (graph, trace)
+        if key not in self._batches:
+            self._batches[key] = BATCH_TYPES[self._simulation_class](
+                self.platform, graph, trace
+            )
+        return self._batches[key]
+
+    def _get_analysis(self, graph, trace):
+        """Get the throughput analysis used by the pre-filter.
+
+        Returns:
+            ThroughputAnalysis: the analysis of `graph` and `trace`, or
+                ``None`` if the application cannot be analyzed
+        """
+        key = (graph, trace)
+        if key not in self._analyses:
+            try:
+                analysis = ThroughputAnalysis(self.platform, graph, trace)
+            except RuntimeError as e:
+                log.warning(f"Simulating all mappings without pre-filter: {e}")
+                analysis = None
+            self._analyses[key] = analysis
+        return self._analyses[key]
+
+    def _prefilter(self, graph, trace, mappings):
+        """Select the mappings worth simulating.
+
+        The execution times of `mappings` are estimated with a
+        :class:`~mocasin.simulate.throughput.ThroughputAnalysis`. Only the
+        share ``config.prefilter`` of the mappings with the shortest estimated
+        execution times is simulated.
+
+        Returns:
+            list: ``None`` for each mapping that should be simulated, and the
+                estimated result (marked as ``estimated``) for each other
+                mapping
+        """
+        if self.config.prefilter is None or len(mappings) == 0:
+            return [None] * len(mappings)
+        analysis = self._get_analysis(graph, self._get_cached_trace(trace))
+        if analysis is None:
+            return [None] * len(mappings)
+        estimates = [
+            replace(e, estimated=True)
+            for e in analysis.simulate(mappings)
+        ]
+        order = sorted(
+            range(len(mappings)), key=lambda i: estimates[i].exec_time
+        )
+        for i in order[: math.ceil(self.config.prefilter * len(mappings))]:
+            estimates[i] = None
+        self.statistics.mappings_estimated(
+            sum(e is not None for e in estimates)
+        )
+        return estimates
+
+    def _get_pool(self, graph, trace):
+        """Get a worker pool for the given graph and trace.
+
+        A running pool is reused if its workers hold the same simulation
+        context. Otherwise, it is replaced by a new pool.
+        """
+        if self._pool is not None and not self._pool.serves(
+            self.platform, graph, trace
+        ):
+            self._close_pool()
+        if self._pool is None:
+            self._pool = SimulationWorkerPool(
+                self.platform,
+                graph,
+                trace,
+                jobs=self.config.jobs,
+                simulation_class=self._simulation_class,
+            )
+        return self._pool
 
     def lookup(self, graph, mapping):
-        """Look up the results from the cache."""
-        if graph not in self._cache:
-            self._cache.update({graph: {}})
+        """Look up the results from the cache.
 
-        if mapping not in self._cache[graph]:
-            self._cache[graph].update({mapping: None})
+        Returns:
+            SimulationResult: the cached result or ``False`` if `mapping` was
+                not simulated yet
+        """
+        sim_res = self._cache.lookup(graph, mapping)
+        if sim_res is None and self._store is not None:
+            if graph in self._store_contexts:
+                sim_res = self._store.lookup(
+                    self._store_contexts[graph], mapping
+                )
+                if sim_res is not None:
+                    self.add_mapping_result(graph, mapping, sim_res)
+
+        if sim_res is None:
+            self.statistics.cache_miss()
             return False
 
-        return self._cache[graph][mapping]
+        self.statistics.cache_hit()
+        return sim_res
 
     def add_mapping_result(self, graph, mapping, sim_res):
         """Save the simulation results in the cache."""
-        assert graph in self._cache
-        self._cache[graph][mapping] = sim_res
+        evicted = self._cache.add(graph, mapping, sim_res)
+        if evicted:
+            self.statistics.cache_evictions(evicted)
 
     def reset_statistics(self):
         self.statistics.reset()
@@ -129,67 +645,57 @@ class SimulationManager:
             mappings = [representation.fromRepresentation(m) for m in tup]
         return mappings, tup
 
-    def _prepare_simulations(self, graph, trace, mappings, lookups):
-        """Prepare arguments for simulations."""
-        # create a list of simulations to be run.
-        # each element is a tuple (simulation, hydra_configuration)
-        simulations = []
-        # Logging are not configured in the spawned processes on mac OS.
-        # As a workaround, suggested in
-        # https://github.com/facebookresearch/hydra/issues/1005
-        # we pass the hydra configuration to the child processes
-        cfg_pickled = None
-        if HydraConfig.initialized():
-            config = HydraConfig.get()
-            cfg_pickled = cloudpickle.dumps(config)
-        for i, mapping in enumerate(mappings):
-            # skip if this particular mapping is in the cache
-            if lookups[i]:
-                continue
+    def _prepare_simulations(self, mappings, lookups):
+        """Collect the mappings that are not cached yet."""
+        return [m for i, m in enumerate(mappings) if not lookups[i]]
 
-            simulation = DataflowSimulation(
-                self.platform, graph, mapping, trace
-            )
-
-            simulations.append((simulation, cfg_pickled))
-        return simulations
+    def _run_simulations(self, graph, trace, mappings):
+        """Perform simulations.
 
-    def _run_simulations(self, simulations):
-        """Perform simulations."""
-        if self.config.parallel and len(simulations) > self.config.chunk_size:
+        Returns:
+            list of SimulationResult: the results in the order of `mappings`
+        """
+        trace = self._get_cached_trace(trace)
+        if self.config.parallel and len(mappings) > self.config.chunk_size:
             # since mappings are simulated in parallel, whole simulation time
             # is added later as offset
-            for _ in simulations:
+            for _ in mappings:
                 self.statistics.mapping_evaluated(0)
 
-            # run the simulations in parallel
-            with mp.Pool(processes=self.config.jobs) as pool:
-                to_simulate = pool.imap(
-                    run_simulation_logger_wrapper,
-                    simulations,
-                    chunksize=self.config.chunk_size,
+            # run the simulations in the worker pool
+            pool = self._get_pool(graph, trace)
+            to_simulate = pool.imap(mappings, chunksize=self.config.chunk_size)
+            if self.config.progress:
+                to_simulate = tqdm.tqdm(
+                    to_simulate,
+                    total=len(mappings),
                 )
-                if self.config.progress:
-                    to_simulate = tqdm.tqdm(
-                        to_simulate,
-                        total=len(simulations),
-                    )
-                simulated = list(to_simulate)
-                time = sum([s[1] for s in simulated])
-                simulated = [s[0] for s in simulated]
-                self.statistics.add_offset(time)
+            simulated = list(to_simulate)
+            time = sum([s[1] for s in simulated])
+            simulated = [s[0] for s in simulated]
+            self.statistics.add_offset(time)
         else:
             simulated = []
             # run the simulations sequentially
-            for s in simulations:
-                s, time = run_simulation(s[0])
-                simulated.append(s)
+            batch = self._get_batch(graph, trace)
+            for mapping in mappings:
+                if batch is not None:
+                    result, time = run_batch_simulation(batch, mapping)
+                    simulated.append(result)
+                    self.statistics.mapping_evaluated(time)
+                    continue
+                simulation = self._simulation_class(
+                    self.platform, graph, mapping, trace, production=True
+                )
+                s, time = run_simulation(simulation)
+                simulated.append(s.result)
                 self.statistics.mapping_evaluated(time)
         return simulated
 
     def _append_mapping_metadata(self, mapping, sim_res):
         # save execution time and energy in ms and mJ, respectively
         mapping.metadata.exec_time = sim_res.exec_time / 1000000000.0
+        mapping.metadata.estimated = sim_res.estimated
         print(sim_res)
         mapping.metadata.energy = None
         if sim_res.dynamic_energy is not None:
@@ -199,39 +705,57 @@ class SimulationManager:
         self, graph, mappings, tup, lookups, simulated, update_metadata
     ):
         sim_results = []
+        new_results = []
         sim_iter = iter(simulated)
         for i, mapping in enumerate(mappings):
             sim_lookup = lookups[i]
             if sim_lookup:
                 sim_res = sim_lookup
             else:
-                s = next(sim_iter)
-                sim_res = s.result
+                sim_res = next(sim_iter)
                 self.add_mapping_result(graph, tup[i], sim_res)
+                new_results.append((tup[i], sim_res))
             sim_results.append(sim_res)
             if update_metadata:
                 self._append_mapping_metadata(mapping, sim_res)
 
+        if self._store is not None:
+            self._store.add_results(self._store_contexts[graph], new_results)
+
         return sim_results
 
     def simulate(
-        self, graph, trace, representation, input_mappings, update_metadata=True
+        self,
+        graph,
+        trace,
+        representation,
+        input_mappings,
+        update_metadata=True,
+        prefilter=True,
     ):
         """Simulate multiple mappings.
 
         Args:
             input_mappings: input mappings
+            prefilter (bool): whether to apply ``config.prefilter``. If
+                ``False``, all uncached mappings are simulated, e.g., to
+                confirm estimated results.
 
         Returns:
             list of the objects of the class `SimulationResult`. The length of
             the list is equal to the length of `input_mappings`.
         """
+        self._record_finished()
+
         # check inputs
         if len(input_mappings) == 0:
             log.warning("Trying to simulate an empty mapping list")
             return []
 
         self.statistics.set_rep_init_time(representation.init_time)
+        self.statistics.set_canonical_cache(
+            getattr(representation, "canonical_cache", None)
+        )
 
         time = process_time()
         mappings, tup = self._prepare_mappings_tuples(
@@ -239,6 +763,9 @@ class SimulationManager:
         )
         self.statistics.add_rep_time(process_time() - time)
 
+        if self._store is not None:
+            self._update_store_context(graph, trace, representation)
+
         # first look up as many as possible:
         lookups = [self.lookup(graph, t) for t in tup]
         num = len([m for m in lookups if m])
@@ -251,11 +778,22 @@ class SimulationManager:
                 self._append_mapping_metadata(m, sim_res)
             return lookups
 
+        # Estimate the results of the mappings that are not worth simulating.
+        # The estimates are treated like lookups, so they are not cached.
+        if prefilter and self.config.prefilter is not None:
+            uncached = [i for i, sim_res in enumerate(lookups) if not sim_res]
+            estimates = self._prefilter(
+                graph, trace, [mappings[i] for i in uncached]
+            )
+            for i, sim_res in zip(uncached, estimates):
+                if sim_res is not None:
+                    lookups[i] = sim_res
+
         # Prepare simulation arguments
-        simulations = self._prepare_simulations(graph, trace, mappings, lookups)
+        to_simulate = self._prepare_simulations(mappings, lookups)
 
         # Run simulations itself
-        simulated = self._run_simulations(simulations)
+        simulated = self._run_simulations(graph, trace, to_simulate)
 
         # Collect the simulation results and store them
         sim_results = self._store_simulation_results(
@@ -263,42 +801,208 @@ class SimulationManager:
         )
         return sim_results
 
+    def submit(
+        self, graph, trace, representation, input_mappings, update_metadata=True
+    ):
+        """Start the simulation of multiple mappings without waiting.
+
+        Cached mappings resolve immediately, and mappings that are already
+        being simulated share the future of the running simulation. In
+        parallel mode, the remaining mappings are sent to the worker pool in
+        chunks of ``config.chunk_size`` and this method returns right away.
+        Otherwise, they are simulated before this method returns.
+
+        The results of finished simulations are added to the cache (and the
+        result store) by :meth:`as_completed` and by any later call to the
+        simulation manager.
+
+        Args:
+            input_mappings: input mappings
+            update_metadata (bool): whether to record the results in the
+                metadata of the mappings
+
+        Returns:
+            list of concurrent.futures.Future: a future per mapping in
+                `input_mappings` that resolves to a `SimulationResult`
+        """
+        self._record_finished()
+        if len(input_mappings) == 0:
+            return []
+
+        self.statistics.set_rep_init_time(representation.init_time)
+        self.statistics.set_canonical_cache(
+            getattr(representation, "canonical_cache", None)
+        )
+
+        time = process_time()
+        mappings, tup = self._prepare_mappings_tuples(
+            representation, input_mappings
+        )
+        self.statistics.add_rep_time(process_time() - time)
+
+        if self._store is not None:
+            self._update_store_context(graph, trace, representation)
+
+        futures = []
+        to_simulate = []
+        num = 0
+        for mapping, t in zip(mappings, tup):
+            key = (graph, t)
+            if key in self._inflight:
+                future, waiting = self._inflight[key]
+                if update_metadata:
+                    waiting.append(mapping)
+                futures.append(future)
+                num += 1
+                continue
+
+            future = concurrent.futures.Future()
+            sim_res = self.lookup(graph, t)
+            if sim_res:
+                if update_metadata:
+                    self._append_mapping_metadata(mapping, sim_res)
+                future.set_result(sim_res)
+                num += 1
+            else:
+                waiting = [mapping] if update_metadata else []
+                self._inflight[key] = (future, waiting)
+                to_simulate.append((key, mapping, future))
+            futures.append(future)
+        log.info(f"{num} from cache.")
+        self.statistics.mappings_cached(num)
+
+        estimates = self._prefilter(
+            graph, trace, [m for _, m, _ in to_simulate]
+        )
+        for (key, _, future), sim_res in zip(to_simulate, estimates):
+            if sim_res is not None:
+                _, waiting = self._inflight.pop(key)
+                for mapping in waiting:
+                    self._append_mapping_metadata(mapping, sim_res)
+                future.set_result(sim_res)
+        to_simulate = [t for t, e in zip(to_simulate, estimates) if e is None]
+
+        if to_simulate:
+            self._start_simulations(
+                graph, trace, to_simulate, self._store_contexts.get(graph)
+            )
+        return futures
+
+    def as_completed(self, futures, timeout=None):
+        """Iterate over futures returned by :meth:`submit` as they complete.
+
+        The results of a completed simulation are recorded before its future
+        is yielded. Like :func:`concurrent.futures.as_completed`, duplicate
+        futures are yielded only once.
+
+        Args:
+            futures (list of concurrent.futures.Future): the futures
+            timeout (float, optional): the maximum number of seconds to wait
+
+        Yields:
+            concurrent.futures.Future: the futures in the order they complete
+        """
+        for future in concurrent.futures.as_completed(futures, timeout):
+            self._record_finished()
+            yield future
+
+    def _start_simulations(self, graph, trace, to_simulate, context):
+        """Start simulations for :meth:`submit`.
+
+        Args:
+            to_simulate (list of tuple): tuples of the in-flight key, the
+                mapping and the future of each simulation
+            context (str): the result store context the simulations were
+                submitted under, or ``None`` if no result store is used
+        """
+        if not self.config.parallel:
+            simulated = self._run_simulations(
+                graph, trace, [m for _, m, _ in to_simulate]
+            )
+            self._record_results(to_simulate, simulated, context)
+            for (_, _, future), sim_res in zip(to_simulate, simulated):
+                future.set_result(sim_res)
+            return
+
+        # since mappings are simulated in parallel, the simulation time is
+        # added later as offset
+        for _ in to_simulate:
+            self.statistics.mapping_evaluated(0)
+        pool = self._get_pool(graph, self._get_cached_trace(trace))
+        chunk_size = self.config.chunk_size
+        for i in range(0, len(to_simulate), chunk_size):
+            chunk = to_simulate[i : i + chunk_size]
+            pool.apply_async(
+                [m for _, m, _ in chunk],
+                callback=functools.partial(self._chunk_done, chunk, context),
+                error_callback=functools.partial(self._chunk_failed, chunk),
+            )
+
+    def _chunk_done(self, chunk, context, simulated):
+        # Called from a helper thread of the pool. The results are recorded
+        # later in the main thread, see _record_finished().
+        self._finished.append((chunk, context, simulated))
+        for (_, _, future), (sim_res, _) in zip(chunk, simulated):
+            future.set_result(sim_res)
+
+    def _chunk_failed(self, chunk, exception):
+        # Called from a helper thread of the pool.
+        self._finished.append((chunk, None, None))
+        for _, _, future in chunk:
+            future.set_exception(exception)
+
+    def _record_finished(self):
+        """Record the results of all chunks finished by the worker pool."""
+        while self._finished:
+            chunk, context, simulated = self._finished.popleft()
+            if simulated is None:
+                for key, _, _ in chunk:
+                    del self._inflight[key]
+                continue
+            self.statistics.add_offset(sum(time for _, time in simulated))
+            self._record_results(
+                chunk, [sim_res for sim_res, _ in simulated], context
+            )
+
+    def _record_results(self, chunk, simulated, context):
+        """Add the results of submitted simulations to the cache.
+
+        The results are stored under the result store `context` that was
+        current when the simulations were submitted.
+        """
+        new_results = []
+        for (key, _, _), sim_res in zip(chunk, simulated):
+            graph, t = key
+            _, waiting = self._inflight.pop(key)
+            self.add_mapping_result(graph, t, sim_res)
+            new_results.append((t, sim_res))
+            for mapping in waiting:
+                self._append_mapping_metadata(mapping, sim_res)
+
+        if self._store is not None:
+            self._store.add_results(context, new_results)
+
     def dump(self, filename):
         # TODO: Use MappingTableWriter
         log.info(f"dumping cache to {filename}")
         with open(filename, "x") as file:
             file.write("mapping,runtime\n")
-            for mapping in self._cache:
+            for _, mapping, sim_res in self._cache.items():
                 file.write(
                     f"\"{str(mapping).replace('(','').replace(')','')}\","
-                    f"{self._cache[mapping]}\n"
+                    f"{sim_res.exec_time}\n"
                 )
         # TODO: Use a separate method to dump this data
         filename = filename.replace("csv", "h5")
         log.info(f"dumping cache to {filename}")
         f = h5py.File(filename, "w")
-        for i, mapping in enumerate(self._cache):
+        for i, (_, mapping, sim_res) in enumerate(self._cache.items()):
             f.create_dataset(str(i), data=np.array(mapping), compression="gzip")
-            f[str(i)].attrs["runtime"] = self._cache[mapping]
+            f[str(i)].attrs["runtime"] = sim_res.exec_time
         f.close()
         log.info("cache dumped.")
 
 
-def run_simulation_logger_wrapper(arguments):
-    """Simulation wrapper with logger settings.
-
-    Logging are not configured in the spawned processes on mac OS.
-    As a workaround, suggested in
-    https://github.com/facebookresearch/hydra/issues/1005
-    we pass the hydra configuration from the main process.
-    """
-    simulation, cfg_pickled = arguments
-    if cfg_pickled:
-        config = pickle.loads(cfg_pickled)
-        hydra.core.utils.configure_log(config.job_logging, config.verbose)
-    return run_simulation(simulation)
-
-
 def run_simulation(simulation):
     with simulation:
         start_time = process_time()
@@ -307,6 +1011,18 @@ def run_simulation(simulation):
     return simulation, time
 
 
+def run_batch_simulation(batch, mapping):
+    """Simulate a single mapping within a :class:`FastSimulationBatch`.
+
+    Returns:
+        tuple: the simulation result and the time spent simulating
+    """
+    start_time = process_time()
+    result = batch.simulate_mapping(mapping)
+    time = process_time() - start_time
+    return result, time
+
+
 def statistics_parser(dir):
     results = {}
     with open(os.path.join(dir, "statistics.txt"), "r") as f:
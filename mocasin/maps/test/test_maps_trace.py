@@ -0,0 +1,80 @@
+# Copyright (C) 2026 TU Dresden
+# Licensed under the ISC license (see LICENSE.txt)
+
+import os
+
+import pytest
+
+from mocasin.common.test.trace_utils import segments_as_tuples
+from mocasin.common.trace import SegmentType
+from mocasin.maps.trace import MapsTrace
+
+_TRACES = {
+    "ARM_CORTEX_A7": ["m 0 10", "w ch 2 20", "r ch 0 1 30", "m 0 40", "e"],
+    "ARM_CORTEX_A15": ["m 0 5", "w ch 2 10", "r ch 0 1 15", "m 0 20", "e"],
+}
+
+
+@pytest.fixture
+def cache_home(tmpdir, monkeypatch):
+    cache_home = tmpdir.mkdir("cache")
+    monkeypatch.setenv("XDG_CACHE_HOME", str(cache_home))
+    return str(cache_home)
+
+
+@pytest.fixture
+def trace_dir(tmpdir, cache_home):
+    trace_dir = tmpdir.mkdir("traces")
+    for processor_type, lines in _TRACES.items():
+        path = trace_dir.join(f"proc.{processor_type}.0.cpntrace")
+        path.write("\n".join(lines) + "\n")
+    return str(trace_dir)
+
+
+def test_compiled_trace(trace_dir, cache_home):
+    expected = segments_as_tuples(
+        MapsTrace(trace_dir, compile=False).get_trace("proc")
+    )
+    assert len(expected) == 6
+    assert expected[2] == (SegmentType.WRITE_TOKEN, "ch", 2, None)
+    assert expected[5][3] == {"ARM_CORTEX_A7": 40, "ARM_CORTEX_A15": 20}
+
+    trace = MapsTrace(trace_dir)
+    assert segments_as_tuples(trace.get_trace("proc")) == expected
+    # the compiled trace is stored in the user's cache directory
+    assert len(os.listdir(trace_dir)) == len(_TRACES)
+    compiled_dir = os.path.join(cache_home, "mocasin", "maps")
+    (digest,) = os.listdir(compiled_dir)
+    assert sorted(os.listdir(os.path.join(compiled_dir, digest))) == [
+        "proc.json",
+        "proc.npy",
+    ]
+    # a new object replays the compiled file
+    assert (
+        segments_as_tuples(MapsTrace(trace_dir).get_trace("proc")) == expected
+    )
+
+
+def test_compiled_trace_cache_dir(trace_dir, tmpdir):
+    cache_dir = str(tmpdir.join("compiled"))
+    list(MapsTrace(trace_dir, cache_dir=cache_dir).get_trace("proc"))
+    assert os.path.isfile(os.path.join(cache_dir, "proc.npy"))
+
+
+def test_compiled_trace_outdated(trace_dir):
+    trace = MapsTrace(trace_dir)
+    list(trace.get_trace("proc"))
+
+    for processor_type in _TRACES:
+        path = os.path.join(trace_dir, f"proc.{processor_type}.0.cpntrace")
+        with open(path, "w") as f:
+            f.write("m 0 100\ne\n")
+    segments = segments_as_tuples(MapsTrace(trace_dir).get_trace("proc"))
+    assert segments == [
+        (
+            SegmentType.COMPUTE,
+            None,
+            None,
+            {"ARM_CORTEX_A7": 100, "ARM_CORTEX_A15": 100},
+        )
+    ]
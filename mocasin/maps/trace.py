@@ -6,10 +6,13 @@
 
 import contextlib
 import glob
+import hashlib
+import json
 import logging
 import os
 
 from hydra.utils import to_absolute_path
+import numpy as np
 
 from mocasin.common.trace import (
     DataflowTrace,
@@ -17,22 +20,90 @@ from mocasin.common.trace import (
     ReadTokenSegment,
     WriteTokenSegment,
 )
+from mocasin.util.files import atomic_write
 
 
 log = logging.getLogger(__name__)
 
 
+# Kinds of rows in a compiled trace. Each row corresponds to a line of the
+# text trace, and all kinds start with a compute segment.
+_COMPUTE = 0
+_READ = 1
+_WRITE = 2
+
+# Bump this whenever the layout of compiled traces changes
+_COMPILED_VERSION = 1
+
+# Number of rows to convert to Python objects at once during replay
+_REPLAY_CHUNK_SIZE = 4096
+
+
+def _default_cache_dir(trace_dir):
+    """Get the directory of compiled traces within the user's cache directory.
+
+    Each trace directory gets its own subdirectory, named after a hash of its
+    absolute path.
+    """
+    cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.expanduser(
+        "~/.cache"
+    )
+    digest = hashlib.sha256(trace_dir.encode()).hexdigest()[:16]
+    return os.path.join(cache_home, "mocasin", "maps", digest)
+
+
+def _compiled_dtype(num_processor_types):
+    return np.dtype(
+        [
+            ("kind", np.uint8),
+            ("channel", np.int32),
+            ("tokens", np.int64),
+            ("cycles", np.int64, (num_processor_types,)),
+        ]
+    )
+
+
 class MapsTrace(DataflowTrace):
     """Represents the  behavior of a MAPS (KPN) application
 
     See `~DataflowTrace`.
 
+    Parsing the textual ``.cpntrace`` files is slow. Therefore, the trace of
+    each process is compiled into a compact columnar binary file on first
+    access. This file stores one row per trace line, containing the line type,
+    a channel id, a token count and the cycles for each processor type. Any
+    later access memory-maps the compiled file instead of parsing the text
+    files again. Compiled files are recompiled automatically if the trace files
+    are modified.
+
     Args:
         trace_dir (str): path to the directory containing all trace files
+        cache_dir (str, optional): path to the directory where compiled traces
+            are stored. If None, a subdirectory of ``mocasin/maps`` in the
+            user's cache directory (``$XDG_CACHE_HOME`` or ``~/.cache``) is
+            used, such that the trace directory is left untouched. Defaults to
+            None.
+        compile (bool, optional): whether to use compiled traces. If False,
+            the text files are parsed on each call of :meth:`get_trace`.
+            Defaults to True.
     """
 
-    def __init__(self, trace_dir):
+    def __init__(self, trace_dir, cache_dir=None, compile=True):
         self._trace_dir = to_absolute_path(trace_dir)
+        if cache_dir is None:
+            self._cache_dir = _default_cache_dir(self._trace_dir)
+        else:
+            self._cache_dir = to_absolute_path(cache_dir)
+        self._compile = compile
+        # compiled traces that were already loaded by this object
+        self._compiled = {}
+
+    def __getstate__(self):
+        # Do not pickle the loaded (memory-mapped) traces, they are reloaded
+        # from the compiled files on demand.
+        state = self.__dict__.copy()
+        state["_compiled"] = {}
+        return state
 
     def get_trace(self, process):
         """Get the trace for a specific process/actor in the dataflow app
@@ -45,6 +116,145 @@ class MapsTrace(DataflowTrace):
             ReadTokenSegment: if the next segment is a read segment
             WriteTokenSegment: if the next segment is a write segment
         """
+        if self._compile:
+            yield from self._replay_compiled(process)
+        else:
+            yield from self._parse_trace(process)
+
+    def compile_trace(self, process):
+        """Compile the trace of a process into the binary trace format.
+
+        The compiled trace is written to the cache directory. If the cache
+        directory is not writable, the compiled trace is only kept in memory.
+
+        Args:
+            process (str): Name of the process to compile the trace for
+
+        Returns:
+            tuple: a tuple of the list of processor types, the list of channel
+                names, and the structured numpy array containing the rows
+        """
+        trace_file_paths = self._find_trace_files(process)
+        processor_types = [
+            os.path.basename(path).split(".")[1] for path in trace_file_paths
+        ]
+        channels = []
+        channel_ids = {}
+        rows = []
+        for marker, channel, tokens, cycles in self._parse_lines(process):
+            if channel is None:
+                channel_id = -1
+            else:
+                channel_id = channel_ids.get(channel)
+                if channel_id is None:
+                    channel_id = channel_ids[channel] = len(channels)
+                    channels.append(channel)
+            rows.append(
+                (
+                    marker,
+                    channel_id,
+                    tokens,
+                    [cycles[t] for t in processor_types],
+                )
+            )
+        data = np.array(rows, dtype=_compiled_dtype(len(processor_types)))
+
+        meta = {
+            "version": _COMPILED_VERSION,
+            "processor_types": processor_types,
+            "channels": channels,
+            "sources": self._source_stamps(trace_file_paths),
+        }
+        try:
+            self._write_compiled(process, meta, data)
+        except OSError as e:
+            log.warning(
+                f"Could not store the compiled trace of process {process} "
+                f"({e}). The compiled trace is only kept in memory."
+            )
+        return processor_types, channels, data
+
+    def _compiled_paths(self, process):
+        base = os.path.join(self._cache_dir, process)
+        return f"{base}.npy", f"{base}.json"
+
+    def _source_stamps(self, trace_file_paths):
+        stamps = {}
+        for path in trace_file_paths:
+            stat = os.stat(path)
+            stamps[os.path.basename(path)] = [stat.st_mtime_ns, stat.st_size]
+        return stamps
+
+    def _write_compiled(self, process, meta, data):
+        os.makedirs(self._cache_dir, exist_ok=True)
+        data_path, meta_path = self._compiled_paths(process)
+        # concurrent runs never see partially written files
+        with atomic_write(data_path) as f:
+            np.save(f, data)
+        with atomic_write(meta_path, "w") as f:
+            json.dump(meta, f)
+
+    def _load_compiled(self, process):
+        """Load a compiled trace, (re)compiling it if necessary."""
+        if process in self._compiled:
+            return self._compiled[process]
+
+        data_path, meta_path = self._compiled_paths(process)
+        compiled = None
+        try:
+            with open(meta_path) as f:
+                meta = json.load(f)
+            trace_file_paths = self._find_trace_files(process)
+            if meta["version"] == _COMPILED_VERSION and meta[
+                "sources"
+            ] == self._source_stamps(trace_file_paths):
+                data = np.load(data_path, mmap_mode="r")
+                compiled = (meta["processor_types"], meta["channels"], data)
+        except (OSError, ValueError, KeyError):
+            pass
+
+        if compiled is None:
+            log.info(f"compile the trace of process {process}")
+            compiled = self.compile_trace(process)
+
+        self._compiled[process] = compiled
+        return compiled
+
+    def _replay_compiled(self, process):
+        processor_types, channels, data = self._load_compiled(process)
+        for start in range(0, len(data), _REPLAY_CHUNK_SIZE):
+            chunk = data[start : start + _REPLAY_CHUNK_SIZE]
+            for kind, channel, tokens, cycles in zip(
+                chunk["kind"].tolist(),
+                chunk["channel"].tolist(),
+                chunk["tokens"].tolist(),
+                chunk["cycles"].tolist(),
+            ):
+                yield ComputeSegment(dict(zip(processor_types, cycles)))
+                if kind == _READ:
+                    yield ReadTokenSegment(
+                        channel=channels[channel], num_tokens=tokens
+                    )
+                elif kind == _WRITE:
+                    yield WriteTokenSegment(
+                        channel=channels[channel], num_tokens=tokens
+                    )
+
+    def _parse_trace(self, process):
+        for marker, channel, tokens, cycles in self._parse_lines(process):
+            yield ComputeSegment(cycles)
+            if marker == _READ:
+                yield ReadTokenSegment(channel=channel, num_tokens=tokens)
+            elif marker == _WRITE:
+                yield WriteTokenSegment(channel=channel, num_tokens=tokens)
+
+    def _parse_lines(self, process):
+        """Parse the text trace files of a process.
+
+        Yields:
+            tuple: a tuple of the line kind, the channel name, the number of
+                tokens and the processor cycles for each line
+        """
 
         # use an exit stack to keep track of all files we open
         with contextlib.ExitStack() as stack:
@@ -55,41 +265,42 @@ class MapsTrace(DataflowTrace):
 
             # iterate over all the lines in all the files simultaneously
             for lines in zip(*trace_files):
-                log.debug(f"reading next trace lines for process {process}")
                 # check if we received enough lines
                 if len(lines) != len(trace_files):
                     raise RuntimeError(
                         f"The trace files for process {process} do not match!"
                     )
 
-                marker = self._get_element(lines, 0)
+                fields = [line.split() for line in lines]
+                marker = self._get_element(fields, 0)
 
                 if marker == "m":
-                    yield ComputeSegment(
-                        self._get_processor_cycles(processor_types, lines, 2)
+                    yield (
+                        _COMPUTE,
+                        None,
+                        0,
+                        self._get_processor_cycles(processor_types, fields, 2),
                     )
                 elif marker == "r":
-                    yield ComputeSegment(
-                        self._get_processor_cycles(processor_types, lines, 4)
-                    )
-                    yield ReadTokenSegment(
-                        channel=self._get_element(lines, 1),
-                        num_tokens=int(self._get_element(lines, 3)),
+                    yield (
+                        _READ,
+                        self._get_element(fields, 1),
+                        int(self._get_element(fields, 3)),
+                        self._get_processor_cycles(processor_types, fields, 4),
                     )
                 elif marker == "w":
-                    yield ComputeSegment(
-                        self._get_processor_cycles(processor_types, lines, 3)
-                    )
-                    yield WriteTokenSegment(
-                        channel=self._get_element(lines, 1),
-                        num_tokens=int(self._get_element(lines, 2)),
+                    yield (
+                        _WRITE,
+                        self._get_element(fields, 1),
+                        int(self._get_element(fields, 2)),
+                        self._get_processor_cycles(processor_types, fields, 3),
                     )
                 elif marker == "e":
                     return
                 else:
                     raise RuntimeError("Encountered an unknown line marker!")
 
-    def _open_trace_files(self, stack, process):
+    def _find_trace_files(self, process):
         # find all trace files for the given process
         trace_file_paths = glob.glob(
             os.path.join(self._trace_dir, f"{process}.*.*.cpntrace")
@@ -103,6 +314,10 @@ class MapsTrace(DataflowTrace):
             raise RuntimeError(
                 f"There is no trace file for the process {process}!"
             )
+        return sorted(trace_file_paths)
+
+    def _open_trace_files(self, stack, process):
+        trace_file_paths = self._find_trace_files(process)
 
         # open all files
         trace_files = []
@@ -113,13 +328,13 @@ class MapsTrace(DataflowTrace):
 
         return processor_types, trace_files
 
-    def _get_processor_cycles(self, processor_types, lines, index):
-        cycles = (int(line.split()[index]) for line in lines)
+    def _get_processor_cycles(self, processor_types, fields, index):
+        cycles = (int(f[index]) for f in fields)
         processor_cycles = {t: c for t, c in zip(processor_types, cycles)}
         return processor_cycles
 
-    def _get_element(self, lines, index):
-        elements = {line.split()[index] for line in lines}
+    def _get_element(self, fields, index):
+        elements = {f[index] for f in fields}
         if len(elements) != 1:
             raise RuntimeError("The trace files do not match!")
         return elements.pop()
@@ -15,7 +15,7 @@ from mocasin.common.platform import (
     Primitive,
     CommunicationPhase,
 )
-from mocasin.platforms.utils import simpleDijkstra, yxRouting
+from mocasin.platforms.utils import RoutingTable, simpleDijkstra, yxRouting
 from mocasin.platforms.topologies import meshTopology
 from mocasin.util import logging
 import sys
@@ -194,72 +194,66 @@ class PlatformDesigner:
             routingFunction = yxRouting
         else:
             routingFunction = simpleDijkstra
-
-        for router in router_list:
-            # extract the associated pe for each router
-            for element in platform.network[router]:
-                if type(element) is Processor:
-                    src = element
-                    prim = Primitive("prim_" + noc_name + "_" + src.name)
-
-                    for innerRouter in router_list:
-                        # extract the associated pe for inner router
-                        for element in platform.network[innerRouter]:
-                            if type(element) is Processor:
-                                sink = element
-
-                                if src != sink:
-                                    resources = routingFunction(
-                                        adjacencyList,
-                                        innerRouter,
-                                        router,
-                                    )
-
-                                    produce_resources = resources[:]
-                                    produce_resources.insert(0, sink)
-                                    produce_resources.append(src)
-                                    platform.find_physical_links(
-                                        produce_resources
-                                    )
-                                    produce_resources.pop(0)
-                                    produce_resources.pop()
-
-                                    produce = CommunicationPhase(
-                                        "produce", produce_resources, "write"
-                                    )
-
-                                    consume_resources = list(
-                                        reversed(resources)
-                                    )
-                                    consume_resources.insert(0, src)
-                                    consume_resources.append(sink)
-                                    platform.find_physical_links(
-                                        consume_resources
-                                    )
-                                    consume_resources.pop(0)
-                                    consume_resources.pop()
-
-                                    consume = CommunicationPhase(
-                                        "consume", consume_resources, "read"
-                                    )
-
-                                    prim.add_producer(sink, [produce])
-                                    prim.add_consumer(sink, [consume])
-
-                                else:
-                                    resources = [router]
-                                    produce = CommunicationPhase(
-                                        "produce", resources, "write"
-                                    )
-                                    consume = CommunicationPhase(
-                                        "consume",
-                                        list(reversed(resources)),
-                                        "read",
-                                    )
-                                    prim.add_producer(sink, [produce])
-                                    prim.add_consumer(sink, [consume])
-
-                    platform.add_primitive(prim)
+        # compute the routes once instead of searching them for every pair
+        routing = RoutingTable(adjacencyList, routingFunction)
+
+        # extract the associated pes for each router
+        router_pes = [
+            (
+                router,
+                [e for e in platform.network[router] if type(e) is Processor],
+            )
+            for router in router_list
+        ]
+
+        for router, src_pes in router_pes:
+            for src in src_pes:
+                prim = Primitive("prim_" + noc_name + "_" + src.name)
+
+                for innerRouter, sink_pes in router_pes:
+                    for sink in sink_pes:
+                        if src != sink:
+                            resources = routing.route(innerRouter, router)
+
+                            produce_resources = resources[:]
+                            produce_resources.insert(0, sink)
+                            produce_resources.append(src)
+                            platform.find_physical_links(produce_resources)
+                            produce_resources.pop(0)
+                            produce_resources.pop()
+
+                            produce = CommunicationPhase(
+                                "produce", produce_resources, "write"
+                            )
+
+                            consume_resources = list(reversed(resources))
+                            consume_resources.insert(0, src)
+                            consume_resources.append(sink)
+                            platform.find_physical_links(consume_resources)
+                            consume_resources.pop(0)
+                            consume_resources.pop()
+
+                            consume = CommunicationPhase(
+                                "consume", consume_resources, "read"
+                            )
+
+                            prim.add_producer(sink, [produce])
+                            prim.add_consumer(sink, [consume])
+
+                        else:
+                            resources = [router]
+                            produce = CommunicationPhase(
+                                "produce", resources, "write"
+                            )
+                            consume = CommunicationPhase(
+                                "consume",
+                                list(reversed(resources)),
+                                "read",
+                            )
+                            prim.add_producer(sink, [produce])
+                            prim.add_consumer(sink, [consume])
+
+                platform.add_primitive(prim)
 
 
 class genericProcessor(Processor):
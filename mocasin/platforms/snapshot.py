@@ -0,0 +1,186 @@
+# Copyright (C) 2026 TU Dresden
+# Licensed under the ISC license (see LICENSE.txt)
+
+"""On-disk snapshots of fully built platforms.
+
+Building a platform, e.g., with the
+:class:`~mocasin.platforms.platformDesigner.PlatformDesigner`, generates all
+communication primitives and can take considerable time for large platforms.
+Since platforms do not change between runs, a snapshot of the built platform
+is stored on disk and loaded by later runs instead of rebuilding it.
+
+**Classes:**
+    * :class:`PlatformSnapshotCache`: a directory of platform snapshots
+
+**Functions:**
+    * :func:`fingerprint_platform_config`: a content hash of a platform
+      configuration
+    * :func:`instantiate_platform`: instantiate the platform of a task
+      configuration, using snapshots if enabled
+"""
+
+import hashlib
+import importlib
+import os
+import pickle
+import time
+
+import hydra
+from hydra.utils import to_absolute_path
+from omegaconf import OmegaConf
+
+from mocasin.util import logging
+from mocasin.util.files import atomic_write
+
+log = logging.getLogger(__name__)
+
+# Modules whose code defines how a platform is built. A change to any of them
+# invalidates all snapshots.
+_PLATFORM_MODULES = [
+    "mocasin.common.platform",
+    "mocasin.platforms.platformDesigner",
+    "mocasin.platforms.topologies",
+    "mocasin.platforms.utils",
+]
+
+
+def _hash_file(h, path):
+    with open(path, "rb") as f:
+        h.update(hashlib.sha256(f.read()).digest())
+
+
+def _config_files(node):
+    """Generate all strings in a (resolved) config that name existing files."""
+    if isinstance(node, dict):
+        for value in node.values():
+            yield from _config_files(value)
+    elif isinstance(node, list):
+        for value in node:
+            yield from _config_files(value)
+    elif isinstance(node, str):
+        path = to_absolute_path(node)
+        if os.path.isfile(path):
+            yield path
+
+
+def fingerprint_platform_config(cfg):
+    """Compute a content hash of a platform configuration.
+
+    The hash covers the resolved configuration, the content of all files the
+    configuration refers to (e.g., a platform description file), and the
+    source code of the platform class and the modules used to build
+    platforms.
+
+    Args:
+        cfg (~omegaconf.dictconfig.DictConfig): the platform configuration,
+            which can be instantiated to a
+            :class:`~mocasin.common.platform.Platform` object
+
+    Returns:
+        str: a hex digest
+    """
+    h = hashlib.sha256()
+    h.update(OmegaConf.to_yaml(cfg, resolve=True).encode())
+    container = OmegaConf.to_container(cfg, resolve=True)
+    for path in _config_files(container):
+        _hash_file(h, path)
+    modules = list(_PLATFORM_MODULES)
+    target = container.get("_target_")
+    if target is not None:
+        modules.append(target.rsplit(".", 1)[0])
+    for name in modules:
+        path = getattr(importlib.import_module(name), "__file__", None)
+        if path is not None:
+            _hash_file(h, path)
+    return h.hexdigest()
+
+
+class PlatformSnapshotCache:
+    """A directory of platform snapshots.
+
+    Each snapshot is a pickled :class:`~mocasin.common.platform.Platform`
+    stored in a file named after the fingerprint of its configuration (see
+    :func:`fingerprint_platform_config`). Snapshots are written atomically,
+    such that concurrent runs never read a partially written snapshot.
+
+    Args:
+        directory (str): the directory containing the snapshots. It is
+            created if it does not exist.
+    """
+
+    def __init__(self, directory):
+        self.directory = to_absolute_path(directory)
+        os.makedirs(self.directory, exist_ok=True)
+
+    def _path(self, key):
+        return os.path.join(self.directory, f"{key}.pickle")
+
+    def lookup(self, key):
+        """Load a snapshot.
+
+        Args:
+            key (str): the fingerprint of the platform configuration
+
+        Returns:
+            Platform: the platform or ``None`` if there is no (readable)
+                snapshot for `key`
+        """
+        try:
+            with open(self._path(key), "rb") as f:
+                return pickle.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            log.warning(f"Ignoring unreadable platform snapshot {key}: {e}")
+            return None
+
+    def add(self, key, platform):
+        """Store a snapshot.
+
+        Args:
+            key (str): the fingerprint of the platform configuration
+            platform (Platform): the platform
+        """
+        with atomic_write(self._path(key)) as f:
+            pickle.dump(platform, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def instantiate_platform(cfg):
+    """Instantiate the platform of a task configuration.
+
+    If ``platform_cache`` is set in the configuration, the platform is loaded
+    from a snapshot in this directory. If there is no snapshot yet, the
+    platform is built, its adjacency dict is calculated, and a snapshot is
+    stored for later runs.
+
+    Args:
+        cfg (~omegaconf.dictconfig.DictConfig): the hydra configuration object
+            of a task
+
+    Returns:
+        Platform: the platform
+    """
+    cache_dir = cfg.get("platform_cache")
+    if cache_dir is None:
+        return hydra.utils.instantiate(cfg["platform"])
+
+    start = time.perf_counter()
+    cache = PlatformSnapshotCache(cache_dir)
+    key = fingerprint_platform_config(cfg["platform"])
+    platform = cache.lookup(key)
+    if platform is not None:
+        log.info(
+            f"Loaded platform {platform.name} from snapshot in "
+            f"{(time.perf_counter() - start) * 1000:.1f} ms"
+        )
+        return platform
+
+    platform = hydra.utils.instantiate(cfg["platform"])
+    # the adjacency dict is needed by most representations
+    platform.to_adjacency_dict()
+    cache.add(key, platform)
+    log.info(
+        f"Built platform {platform.name} and stored a snapshot in "
+        f"{(time.perf_counter() - start) * 1000:.1f} ms"
+    )
+    return platform
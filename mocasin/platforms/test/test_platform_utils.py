@@ -4,6 +4,7 @@
 # Authors: Felix Teweleit
 
 from mocasin.platforms import utils
+from mocasin.platforms.topologies import meshTopology
 
 
 class TestUtils(object):
@@ -30,3 +31,21 @@ class TestUtils(object):
     def test_dijkstra_cyclic_3(self, cyclicGraph):
         result = utils.simpleDijkstra(cyclicGraph, 9, 4)
         assert result == [9, 8, 7, 4] or result == [9, 8, 5, 4]
+
+    def test_routing_table_dijkstra(self, DAG, cyclicGraph):
+        for graph in [DAG, cyclicGraph]:
+            table = utils.RoutingTable(graph)
+            for source in graph:
+                for target in graph:
+                    assert table.route(source, target) == (
+                        utils.simpleDijkstra(graph, source, target)
+                    )
+
+    def test_routing_table_yx(self):
+        mesh = meshTopology([f"router_{i}" for i in range(16)])
+        table = utils.RoutingTable(mesh, utils.yxRouting)
+        for source in mesh:
+            for target in mesh:
+                assert table.route(source, target) == (
+                    utils.yxRouting(mesh, source, target)
+                )
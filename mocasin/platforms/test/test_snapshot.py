@@ -0,0 +1,81 @@
+# Copyright (C) 2026 TU Dresden
+# Licensed under the ISC license (see LICENSE.txt)
+
+from omegaconf import OmegaConf
+
+from mocasin.platforms.snapshot import (
+    PlatformSnapshotCache,
+    fingerprint_platform_config,
+    instantiate_platform,
+)
+
+
+def _config(tmpdir, frequency=2000000000):
+    processor = {
+        "_target_": "mocasin.platforms.platformDesigner.genericProcessor",
+        "type": "proc_type_0",
+        "frequency": frequency,
+    }
+    return OmegaConf.create(
+        {
+            "platform_cache": str(tmpdir.join("platforms")),
+            "platform": {
+                "_target_": "mocasin.platforms.odroid.DesignerPlatformOdroid",
+                "processor_0": processor,
+                "processor_1": dict(processor, type="proc_type_1"),
+            },
+        }
+    )
+
+
+def _describe(platform):
+    return sorted(
+        (prim.name, pe, tuple(r.name for r in phase.resources))
+        for prim in platform.primitives()
+        for phases in (prim.produce_phases, prim.consume_phases)
+        for pe in phases
+        for phase in phases[pe]
+    )
+
+
+def test_fingerprint(tmpdir):
+    cfg = _config(tmpdir)
+    assert fingerprint_platform_config(cfg.platform) == (
+        fingerprint_platform_config(_config(tmpdir).platform)
+    )
+    assert fingerprint_platform_config(cfg.platform) != (
+        fingerprint_platform_config(_config(tmpdir, frequency=1000).platform)
+    )
+
+
+def test_instantiate_platform(tmpdir):
+    cfg = _config(tmpdir)
+    cache = PlatformSnapshotCache(cfg.platform_cache)
+    key = fingerprint_platform_config(cfg.platform)
+    assert cache.lookup(key) is None
+
+    built = instantiate_platform(cfg)
+    assert cache.lookup(key) is not None
+
+    loaded = instantiate_platform(cfg)
+    assert loaded is not built
+    assert _describe(loaded) == _describe(built)
+    assert loaded._adjacency_dicts
+    assert loaded.to_adjacency_dict() == built.to_adjacency_dict()
+
+
+def test_instantiate_platform_disabled(tmpdir):
+    cfg = _config(tmpdir)
+    cfg.platform_cache = None
+    instantiate_platform(cfg)
+    assert not tmpdir.join("platforms").check()
+
+
+def test_unreadable_snapshot(tmpdir):
+    cfg = _config(tmpdir)
+    cache = PlatformSnapshotCache(cfg.platform_cache)
+    key = fingerprint_platform_config(cfg.platform)
+    tmpdir.join("platforms", f"{key}.pickle").write("garbage")
+    assert cache.lookup(key) is None
+    assert instantiate_platform(cfg) is not None
+    assert cache.lookup(key) is not None
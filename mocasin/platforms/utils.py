@@ -118,6 +118,12 @@ def yxRouting(adjacency_list, source, target):
     In particular, the adjacency list has to have a perfect
     square as the number of processors.
     """
+    keys = list(OrderedDict(adjacency_list))
+    return _yxRoute(adjacency_list, keys, keys.index, source, target)
+
+
+def _yxRoute(adjacency_list, keys, index, source, target):
+    """Calculate a Y-X route, given the key list and a key index function."""
     n = np.sqrt(len(adjacency_list))
     if int(n) != n:
         log.error(
@@ -128,12 +134,10 @@ def yxRouting(adjacency_list, source, target):
     if source == target:
         return [source]
 
-    keys = list(OrderedDict(adjacency_list))
-
-    source_val = keys.index(source)
+    source_val = index(source)
     source_val = (source_val % n) * n + int(source_val / n)
 
-    target_val = keys.index(target)
+    target_val = index(target)
     target_val = (target_val % n) * n + int(target_val / n)
 
     source_x, source_y = valToXY(source_val, n)
@@ -166,3 +170,95 @@ def yxRouting(adjacency_list, source, target):
         last_proc = proc
 
     return route
+
+
+class RoutingTable:
+    """Routes between all pairs of nodes in a network.
+
+    The table maps the nodes of the adjacency list to integer ids. Routes
+    according to :func:`simpleDijkstra` are calculated by a breadth-first
+    search that is run once per source node and stored as an array of
+    predecessors. Ties are broken in the same way as in
+    :func:`simpleDijkstra`, so both return identical routes. Routes according
+    to :func:`yxRouting` are calculated directly from the node ids. Any other
+    routing function is called once per pair of nodes and its result is
+    cached.
+
+    Args:
+        adjacencyList (dict): The adjacency list of the network.
+        routingFunction (callable): The routing function to tabulate.
+    """
+
+    def __init__(self, adjacencyList, routingFunction=simpleDijkstra):
+        self._adjacency_list = adjacencyList
+        self._routing_function = routingFunction
+        self._nodes = list(adjacencyList)
+        self._ids = {node: i for i, node in enumerate(self._nodes)}
+        self._adjacency = [
+            [self._ids[x] for x in adjacencyList[node]] for node in self._nodes
+        ]
+        self._predecessors = {}
+        self._routes = {}
+
+    def route(self, source, target):
+        """Return the route from `source` to `target`.
+
+        Args:
+            source: The source node.
+            target: The target node.
+
+        Returns:
+            list: The nodes on the route including `source` and `target`, or
+            None if `target` is not reachable.
+        """
+        if self._routing_function is simpleDijkstra:
+            return self._shortest_route(source, target)
+        if self._routing_function is yxRouting:
+            return _yxRoute(
+                self._adjacency_list,
+                self._nodes,
+                self._ids.__getitem__,
+                source,
+                target,
+            )
+        key = (source, target)
+        if key not in self._routes:
+            self._routes[key] = self._routing_function(
+                self._adjacency_list, source, target
+            )
+        route = self._routes[key]
+        return None if route is None else list(route)
+
+    def _shortest_route(self, source, target):
+        source_id = self._ids[source]
+        if not self._adjacency[source_id]:
+            return None
+        predecessors = self._predecessors.get(source_id)
+        if predecessors is None:
+            predecessors = self._search(source_id)
+            self._predecessors[source_id] = predecessors
+
+        node = self._ids[target]
+        if predecessors[node] < 0:
+            return None
+        route = [node]
+        while node != source_id:
+            node = predecessors[node]
+            route.append(node)
+        return [self._nodes[i] for i in reversed(route)]
+
+    def _search(self, source):
+        # simpleDijkstra visits the nodes of each distance in the order of the
+        # adjacency list and assigns the predecessor on the first discovery
+        predecessors = np.full(len(self._nodes), -1, dtype=np.int64)
+        predecessors[source] = source
+        frontier = [source]
+        while frontier:
+            discovered = []
+            for node in frontier:
+                for reachable in self._adjacency[node]:
+                    if predecessors[reachable] < 0:
+                        predecessors[reachable] = node
+                        discovered.append(reachable)
+            frontier = sorted(discovered)
+        return predecessors.tolist()
@@ -8,7 +8,8 @@ from numpy.random import randint
 from copy import copy
 import random
 import timeit
-from os.path import exists
+import hashlib
+from os.path import exists, splitext
 
 try:
     import pynauty as pynauty
@@ -33,8 +34,10 @@ from .automorphisms import (
     edge_to_node_autgrp,
     list_to_tuple_permutation,
     checkSymmetries,
+    symmetries_from_json,
 )
-from .permutations import Permutation, PermutationGroup
+from .cache import CanonicalFormCache
+from .permutations import Permutation, PermutationGroup, StabilizerChain
 import mocasin.util.random_distributions.lp as lp
 from mocasin.util import logging
 
@@ -377,7 +380,9 @@ class SymmetryRepresentation(metaclass=MappingRepresentation):
 
     The symmetries representation uses the mpsym library to accelerate symmetry
     calculations. This can be disabled by setting disable_mpsym to True, which
-    uses the python fallback version of the symmetries instead.
+    uses the python fallback version of the symmetries instead. The fallback
+    calculates canonical mappings with a
+    :class:`~mocasin.representations.permutations.StabilizerChain`.
 
     The calculation of the symmetries can be a costly computation, yet it only
     depends on the architecture. Thus, the symmetries of an architecture can be
@@ -387,7 +392,16 @@ class SymmetryRepresentation(metaclass=MappingRepresentation):
     be disabled with the disable_symmetries_test flag. This can be useful, e.g.
     for approximating a NoC architecture as a bus. To pre-compute the symmetries
     and store them in a file, use the calculate_platform_symmetries task. This
-    pre-computation only works when using mpsym.
+    pre-computation only works when using mpsym, but the python fallback also
+    reads the symmetries from the file.
+
+    The canonical representatives of the most recently used mapping vectors
+    are kept in a :class:`~mocasin.representations.cache.CanonicalFormCache`
+    of at most canonical_cache_size entries (unbounded if None). If
+    persistent_canonical_cache is set and the platform has the field
+    symmetries_json, the cache is stored in a file next to the symmetries
+    JSON file when the simulation manager is closed, and loaded by later
+    runs.
     """
 
     def __init__(
@@ -400,6 +414,8 @@ class SymmetryRepresentation(metaclass=MappingRepresentation):
         canonical_operations=True,
         disable_mpsym=False,
         disable_symmetries_test=False,
+        canonical_cache_size=100000,
+        persistent_canonical_cache=False,
     ):
         self._topologyGraph = platform.to_adjacency_dict(
             include_proc_type_labels=True
@@ -503,39 +519,94 @@ class SymmetryRepresentation(metaclass=MappingRepresentation):
                         # TODO: ensure that nodes_correspondence fits simpleVec
 
         if not self.sym_library:
-            log.info(
-                "Using python symmetries: Initalizing architecture graph..."
-            )
-            (
-                adjacency_dict,
-                num_vertices,
-                coloring,
-                self._arch_nc,
-            ) = to_labeled_edge_graph(self._topologyGraph)
-            nautygraph = pynauty.Graph(
-                num_vertices, True, adjacency_dict, coloring
-            )
-            log.info(
-                "Architecture graph initialized. Calculating "
-                "automorphism group using Nauty..."
-            )
-            autgrp_edges = pynauty.autgrp(nautygraph)
-            autgrp, _ = edge_to_node_autgrp(autgrp_edges[0], self._arch_nc)
-            permutations_lists = map(list_to_tuple_permutation, autgrp)
-            permutations = [
-                Permutation.fromLists(p, n=n) for p in permutations_lists
-            ]
-            self._G = PermutationGroup(permutations)
+            permutations = None
+            if hasattr(platform, "ag_json") and exists(platform.ag_json):
+                try:
+                    _, generators = symmetries_from_json(platform.ag_json)
+                    if disable_symmetries_test:
+                        log.warning("Using symmetries JSON without testing.")
+                        correct = True
+                    else:
+                        correct = checkSymmetries(
+                            platform.to_adjacency_dict(), generators
+                        )
+                except Exception as e:
+                    log.warning(
+                        "An unknown error occurred while reading the "
+                        "symmetries JSON file. Did you provide the correct "
+                        f"file for the given platform? ({e})"
+                    )
+                    correct = False
+                if correct:
+                    permutations = [Permutation(g) for g in generators]
+                    log.info("Python symmetries initialized: JSON file.")
+                else:
+                    log.warning("Symmetries json does not fit platform.")
+
+            if permutations is None:
+                log.info(
+                    "Using python symmetries: Initalizing architecture graph..."
+                )
+                (
+                    adjacency_dict,
+                    num_vertices,
+                    coloring,
+                    self._arch_nc,
+                ) = to_labeled_edge_graph(self._topologyGraph)
+                nautygraph = pynauty.Graph(
+                    num_vertices, True, adjacency_dict, coloring
+                )
+                log.info(
+                    "Architecture graph initialized. Calculating "
+                    "automorphism group using Nauty..."
+                )
+                autgrp_edges = pynauty.autgrp(nautygraph)
+                autgrp, _ = edge_to_node_autgrp(autgrp_edges[0], self._arch_nc)
+                permutations_lists = map(list_to_tuple_permutation, autgrp)
+                permutations = [
+                    Permutation.fromLists(p, n=n) for p in permutations_lists
+                ]
+            self._G = PermutationGroup(permutations, n=n)
+            self._chain = StabilizerChain(self._G)
             log.info("Initialized automorphism group with internal symmetries")
 
+        self.canonical_cache = self._init_canonical_cache(
+            canonical_cache_size, persistent_canonical_cache, correct
+        )
+
+    def _init_canonical_cache(self, capacity, persistent, correct):
+        path = None
+        fingerprint = None
+        if persistent:
+            ag_json = getattr(self.platform, "ag_json", None)
+            if ag_json is not None and exists(ag_json):
+                path = splitext(ag_json)[0] + ".canonical.pickle"
+                # the representatives depend on the symmetries and the backend
+                h = hashlib.sha256()
+                with open(ag_json, "rb") as f:
+                    h.update(f.read())
+                h.update(repr((self.sym_library, correct)).encode())
+                fingerprint = h.hexdigest()
+            else:
+                log.warning(
+                    "Cannot persist the canonical form cache without a "
+                    "symmetries JSON file."
+                )
+        return CanonicalFormCache(capacity, path=path, fingerprint=fingerprint)
+
     def _simpleVec2Elem(self, x):
         x_ = x[: self._d]
         # keep channels if exist (they should be mapped accordingly...)
         _x = x[self._d :]
-        if self.sym_library:
-            return list(self._ag.representative(x_)) + _x
-        else:
-            return self._G.tuple_normalize(x_) + _x
+        key = tuple(x_)
+        representative = self.canonical_cache.lookup(key)
+        if representative is None:
+            if self.sym_library:
+                representative = tuple(self._ag.representative(x_))
+            else:
+                representative = tuple(self._chain.representative(x_))
+            self.canonical_cache.add(key, representative)
+        return list(representative) + _x
 
     def changed_parameters(self):
         return False
@@ -548,7 +619,7 @@ class SymmetryRepresentation(metaclass=MappingRepresentation):
         if self.sym_library:
             return self._ag.representative(procs_only)
         else:
-            return self._G.tuple_normalize(procs_only)
+            return self._chain.representative(procs_only)
 
     def uniform(self):
         return self.fromRepresentation(self._uniform())
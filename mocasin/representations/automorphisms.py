@@ -2,6 +2,9 @@
 # Licensed under the ISC license (see LICENSE.txt)
 #
 # Authors: Andres Goens
+import json
+import re
+
 try:
     import pynauty as pynauty
 except ImportError:
@@ -149,3 +152,96 @@ def checkSymmetries(platform_graph, ag):
             moved[j] = set(perm.act(list(graph[i])))
         correct = correct and moved == graph
     return correct
+
+
+def _graph_automorphisms(graph):
+    """Calculate generators of the automorphism group of a JSON graph.
+
+    Channel types are modelled by one layer of vertices per type, and self
+    loops by the coloring, such that nauty only sees a simple graph.
+    """
+    processors = {p: t for p, t in graph["processors"]}
+    n = len(processors)
+    layers = {t: i for i, t in enumerate(graph["channel_types"])}
+    adjacency = {v: [] for v in range(n * len(layers))}
+    loops = {p: set() for p in processors}
+    for src, channels in graph["channels"]:
+        for dst, channel_type in channels:
+            if src == dst:
+                loops[src].add(channel_type)
+            else:
+                offset = layers[channel_type] * n
+                adjacency[offset + src].append(offset + dst)
+    for layer in range(1, len(layers)):
+        for p in processors:
+            adjacency[(layer - 1) * n + p].append(layer * n + p)
+
+    colors = {}
+    for layer in range(len(layers)):
+        for p, t in processors.items():
+            color = (layer, t, tuple(sorted(loops[p])))
+            colors.setdefault(color, set()).add(layer * n + p)
+    nautygraph = pynauty.Graph(
+        len(adjacency),
+        directed=graph["directed"],
+        adjacency_dict=adjacency,
+        vertex_coloring=[colors[c] for c in sorted(colors)],
+    )
+    generators = pynauty.autgrp(nautygraph)[0]
+    return n, [gen[:n] for gen in generators]
+
+
+def symmetries_from_json(path):
+    """Read the automorphism group of a platform from a symmetries JSON file.
+
+    Supports the files written by the calculate_platform_symmetries task,
+    which either contain a strong generating set of the group
+    ("automorphisms") or a graph ("graph"), or describe the platform as
+    identical copies of a proto graph connected by a super graph
+    ("super_graph"). The automorphism group of the latter is the wreath
+    product of the automorphism groups of both graphs.
+
+    Args:
+        path (str): the path to the JSON file
+
+    Returns:
+        (int, list of list of int): the number of processors and a
+            generating set of the automorphism group, where every generator
+            is given by the list of images of the processors
+    """
+    with open(path) as f:
+        description = json.load(f)
+
+    if "automorphisms" in description:
+        n, _, generators = description["automorphisms"]
+        perms = []
+        for gen in generators:
+            cycles = [
+                [int(p) for p in c.split(",")]
+                for c in re.findall(r"\(([^)]*)\)", gen)
+            ]
+            perms.append(list(Permutation.fromLists(cycles, n=n)))
+        return n, perms
+
+    if "graph" in description:
+        return _graph_automorphisms(description["graph"])
+
+    if "super_graph" in description:
+        proto, super_graph = description["super_graph"]
+        n_proto, proto_gens = _graph_automorphisms(proto["graph"])
+        n_super, super_gens = _graph_automorphisms(super_graph["graph"])
+        n = n_proto * n_super
+        perms = []
+        for block in range(n_super):
+            for gen in proto_gens:
+                perm = list(range(n))
+                for p in range(n_proto):
+                    perm[block * n_proto + p] = block * n_proto + gen[p]
+                perms.append(perm)
+        for gen in super_gens:
+            perms.append(
+                [gen[p // n_proto] * n_proto + p % n_proto for p in range(n)]
+            )
+        return n, perms
+
+    raise ValueError(f"Unknown format of the symmetries file {path}")
@@ -0,0 +1,124 @@
+# Copyright (C) 2026 TU Dresden
+# Licensed under the ISC license (see LICENSE.txt)
+
+"""Caching of canonical representatives of mappings.
+
+**Classes:**
+    * :class:`CanonicalFormCache`: a bounded memo table from mapping vectors
+      to their canonical representatives
+"""
+
+import pickle
+
+from mocasin.util import logging
+from mocasin.util.files import atomic_write
+from mocasin.util.lru import LRUCache
+
+log = logging.getLogger(__name__)
+
+
+class CanonicalFormCache:
+    """A bounded memo table from mapping vectors to canonical representatives.
+
+    Calculating the canonical representative of a mapping vector under the
+    symmetries of a platform is expensive, while mappers ask for the same
+    vectors repeatedly. The cache stores the representatives of the most
+    recently used vectors and counts its hits and misses.
+
+    If a path is given, the cache can be persisted with :meth:`save` and is
+    loaded on initialization. The fingerprint identifies the symmetries the
+    representatives were calculated with. A persisted cache with a different
+    fingerprint is ignored.
+
+    Args:
+        capacity (int, optional): maximum number of cached representatives.
+            If ``None``, the cache is unbounded. Defaults to ``None``.
+        path (str, optional): the file the cache is persisted in
+        fingerprint (str, optional): an identifier of the symmetries
+    """
+
+    def __init__(self, capacity=None, path=None, fingerprint=None):
+        self._entries = LRUCache(capacity)
+        self.path = path
+        self.fingerprint = fingerprint
+        self.hits = 0
+        self.misses = 0
+        self._modified = False
+        if path is not None:
+            self._load()
+
+    def __len__(self):
+        return len(self._entries)
+
+    @property
+    def capacity(self):
+        """int: the maximum number of cached representatives"""
+        return self._entries.capacity
+
+    @property
+    def hit_rate(self):
+        """float: the ratio of lookups that hit the cache"""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def lookup(self, vector):
+        """Look up the canonical representative of a vector.
+
+        Args:
+            vector (tuple): the mapping vector
+
+        Returns:
+            tuple: the representative or ``None`` if `vector` is not cached
+        """
+        representative = self._entries.get(vector)
+        if representative is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return representative
+
+    def add(self, vector, representative):
+        """Add the canonical representative of a vector.
+
+        Evicts the least recently used entry if the cache is full.
+
+        Args:
+            vector (tuple): the mapping vector
+            representative (tuple): its canonical representative
+        """
+        self._entries.put(vector, representative)
+        self._modified = True
+
+    def _load(self):
+        try:
+            with open(self.path, "rb") as f:
+                fingerprint, entries = pickle.load(f)
+        except FileNotFoundError:
+            return
+        except Exception as e:
+            log.warning(f"Ignoring unreadable canonical form cache: {e}")
+            return
+        if fingerprint != self.fingerprint:
+            log.info("Ignoring canonical form cache of other symmetries")
+            return
+        for vector, representative in entries:
+            self.add(vector, representative)
+        self._modified = False
+        log.info(f"Loaded {len(self)} canonical forms from {self.path}")
+
+    def save(self):
+        """Persist the cache, if it has a path and was modified.
+
+        Failing to write the file is not an error, since the cache is only an
+        optimization.
+        """
+        if self.path is None or not self._modified:
+            return
+        entries = list(self._entries.items())
+        try:
+            with atomic_write(self.path) as f:
+                pickle.dump((self.fingerprint, entries), f)
+        except OSError as e:
+            log.warning(f"Could not save the canonical form cache: {e}")
+            return
+        self._modified = False
@@ -8,7 +8,6 @@ import logging
 import numpy as np
 from sys import exit, stdout
 from numpy.random import randint
-from itertools import product
 from . import permutations as perm
 
 
@@ -42,11 +41,17 @@ class FiniteMetricSpace:
                 points.append(i)
         return points
 
+    def _distances_from(self, p):
+        """Return an array with the distances from point `p` to all points."""
+        return self.D[p]
+
     def ball(self, p, r):
-        return self._ballNaive(p, r)
+        return np.flatnonzero(self._distances_from(p) <= r).tolist()
 
     def uniformFromBall(self, p, r, npoints=1):
-        return self._uniformFromBallNaive(p, r, npoints=npoints)
+        ball = np.array(self.ball(p, r))
+        point_positions = randint(0, len(ball) - 1, size=npoints)
+        return ball[point_positions].tolist()
 
     def _uniformFromBallNaive(self, p, r, npoints=1):
         ball = self.ball(p, r)
@@ -115,17 +120,67 @@ class FiniteMetricSpaceLP(FiniteMetricSpace):
                 1 / float(self.p),
             )
 
+    def _combine(self, a, b):
+        # combine the distances of two coordinates (or coordinate blocks),
+        # adding in the same order as _distCalc to get identical results
+        if self.p > 100:
+            return np.maximum(a, b)
+        return np.add(a, b)
+
+    def _finalize(self, dists):
+        if self.p > 100:
+            return dists
+        return np.power(dists, 1 / float(self.p))
+
+    def _coordinate_distances(self, dists):
+        if self.p > 100:
+            return dists
+        return np.power(dists, self.p)
+
+    def _tupleDistances(self, x):
+        """Calculate the distances from tuple `x` to all tuples in M^d.
+
+        The distances are computed on demand by broadcasting the rows of the
+        base space, without materializing the full distance matrix.
+
+        Args:
+            x (list of int): a point in M^d
+
+        Returns:
+            numpy.ndarray: distances indexed by the integer representation of
+            the target tuples (see :meth:`tuple2Int`)
+        """
+        assert len(x) == self.d
+        dists = None
+        for xi in x:
+            row = self._coordinate_distances(self.M._distances_from(xi))
+            if dists is None:
+                dists = row
+            else:
+                # the new coordinate is the most significant one
+                dists = self._combine(row[:, None], dists[None, :]).ravel()
+        return self._finalize(dists)
+
+    def _distances_from(self, p):
+        if self.D is not None:
+            return self.D[p]
+        return self._tupleDistances(FiniteMetricSpaceLP.int2Tuple(self, p))
+
     def _populateD(self):
         logging.debug("Populating D...")
         stdout.flush()
-        self.D = np.zeros((self.n, self.n))
-        for x, y in product(
-            product(range(self.M.n), repeat=self.d),
-            product(range(self.M.n), repeat=self.d),
-        ):
-            x_l = self.tuple2Int(x)
-            y_l = self.tuple2Int(y)
-            self.D[x_l, y_l] = self._distCalc(x, y)
+        base = self._coordinate_distances(
+            np.array([self.M._distances_from(i) for i in range(self.M.n)])
+        )
+        n = self.M.n
+        D = base
+        for _ in range(1, self.d):
+            # the new coordinate is the most significant one
+            m = D.shape[0]
+            D = self._combine(
+                base[:, None, :, None], D[None, :, None, :]
+            ).reshape(n * m, n * m)
+        self.D = self._finalize(D)
         logging.debug("done.")
 
     def ball(self, p, r):
@@ -201,6 +256,17 @@ class FiniteMetricSpaceSym(FiniteMetricSpace):
         )
         return min(dists)
 
+    def _representatives(self):
+        # the first element of each orbit, as used by _distCalc
+        return [list(self.elem2orb[y])[0] for y in range(self.n)]
+
+    def _distances_from(self, p):
+        if self.D is not None:
+            return self.D[p]
+        orbit = list(self.elem2orb[p])
+        dists = np.array([self.M._distances_from(xs) for xs in orbit])
+        return dists[:, self._representatives()].min(axis=0)
+
     def _populateD(self):
         # print("Populating D...",end='')
         if self.n == -1:
@@ -208,11 +274,8 @@ class FiniteMetricSpaceSym(FiniteMetricSpace):
                 self.G.enumerate_orbits()
             )  # should I remove this per default? Could be very expensive!
         stdout.flush()
-        self.D = np.zeros((self.n, self.n))
-        for x, y in product(range(self.n), repeat=2):
-            self.D[x, y] = self._distCalc(
-                list(self.elem2orb[x]), list(self.elem2orb[y])
-            )
+        self.D = None
+        self.D = np.array([self._distances_from(x) for x in range(self.n)])
         # print("done.")
 
     def elem2Tuple(self, elem):
@@ -311,6 +374,19 @@ class FiniteMetricSpaceLPSym(FiniteMetricSpaceLP, FiniteMetricSpaceSym):
         # print(list(map( lambda xs : (FiniteMetricSpaceLP.dist(self,list(xs),y[0]),(xs,tuple(y[0]))), self.elem2orb[self.orb2elem[tuple(x[0])]])))
         return min(dists)
 
+    def _distances_from(self, p):
+        if self.D is not None:
+            return self.D[p]
+        orbit = list(self.elem2orb[p])
+        dists = np.array([self._tupleDistances(list(xs)) for xs in orbit])
+        representatives = [
+            self.tuple2Int(list(rep)) for rep in self._representatives()
+        ]
+        return dists[:, representatives].min(axis=0)
+
+    _representatives = FiniteMetricSpaceSym._representatives
+    _populateD = FiniteMetricSpaceSym._populateD
+
     def ball(self, p, r):
         return FiniteMetricSpaceSym.ball(self, p, r)
 
@@ -6,6 +6,9 @@
 import functools
 import time
 from itertools import product
+
+import numpy as np
+
 from mocasin.util.logging import getLogger
 
 log = getLogger(__name__)
@@ -375,6 +378,202 @@ class PermutationGroupFromGens(PermutationGroup):
         PermutationGroup.__init__(self, gs, n, *args)
 
 
+def _inverse(perms):
+    """Invert the permutations in the rows of a 2D array."""
+    inverse = np.empty_like(perms)
+    rows = np.arange(perms.shape[0])[:, None]
+    inverse[rows, perms] = np.arange(perms.shape[1])
+    return inverse
+
+
+def _compose(a, b):
+    """Compose the permutations in the rows of two 2D arrays (a after b)."""
+    return a[np.arange(a.shape[0])[:, None], b]
+
+
+def _unique_rows(perms):
+    """Remove duplicate rows from a 2D array."""
+    # compare hashes of the rows first and check for collisions
+    weights = (np.arange(perms.shape[1]) * 2654435761 + 1) % 2**31
+    _, index, inverse = np.unique(
+        perms @ weights, return_index=True, return_inverse=True
+    )
+    if np.array_equal(perms[index][inverse.ravel()], perms):
+        return perms[index]
+    perms = np.ascontiguousarray(perms)
+    rows = perms.view(np.dtype((np.void, perms.itemsize * perms.shape[1])))
+    _, index = np.unique(rows.ravel(), return_index=True)
+    return perms[index]
+
+
+def _sims_filter(perms, identity):
+    """Reduce a generating set of a permutation group.
+
+    Sifts the permutations through a table indexed by the first point ``i``
+    moved by a permutation and its image ``j``, as proposed by Sims. The
+    result generates the same group and contains at most one permutation per
+    pair ``(i, j)``.
+
+    Args:
+        perms (numpy.ndarray): the permutations in the rows of a 2D array
+        identity (numpy.ndarray): the identity permutation
+
+    Returns:
+        numpy.ndarray: the reduced generating set
+    """
+    points = identity.tolist()
+    table = {}
+    for perm in perms.tolist():
+        while perm != points:
+            i = next(p for p, q in zip(points, perm) if p != q)
+            entry = table.get((i, perm[i]))
+            if entry is None:
+                inverse = [0] * len(perm)
+                for p, q in enumerate(perm):
+                    inverse[q] = p
+                table[(i, perm[i])] = (perm, inverse)
+                break
+            # divide by the table entry, which fixes all points up to i
+            inverse = entry[1]
+            perm = [inverse[q] for q in perm]
+    generators = [perm for perm, _ in table.values()]
+    return np.array(generators, dtype=np.intp).reshape(-1, len(points))
+
+
+class _Stabilizer:
+    """The orbits of a permutation group and a transversal for each orbit.
+
+    Args:
+        generators (numpy.ndarray): the generators in the rows of a 2D array
+        n (int): the degree of the group
+    """
+
+    def __init__(self, generators, n):
+        self.generators = generators
+        identity = np.arange(n)
+        # orbit_min[z]: the smallest point in the orbit of z
+        # transversal[z]: a group element that maps orbit_min[z] to z
+        # to_min[z]: the inverse of transversal[z]
+        self.orbit_min = identity
+        if len(generators) > 0:
+            preimages = _inverse(generators)
+            while True:
+                lowered = np.minimum(
+                    self.orbit_min, self.orbit_min[preimages].min(axis=0)
+                )
+                if np.array_equal(lowered, self.orbit_min):
+                    break
+                self.orbit_min = lowered
+
+        # breadth-first search from the minimum of every orbit
+        self.transversal = np.tile(identity, (n, 1))
+        visited = self.orbit_min == identity
+        frontier = np.flatnonzero(visited)
+        while len(frontier) > 0:
+            images = generators[:, frontier].ravel()
+            gen_idx = np.repeat(np.arange(len(generators)), len(frontier))
+            src = np.tile(frontier, len(generators))
+            new = ~visited[images]
+            frontier, first = np.unique(images[new], return_index=True)
+            gen_idx, src = gen_idx[new][first], src[new][first]
+            visited[frontier] = True
+            self.transversal[frontier] = _compose(
+                generators[gen_idx], self.transversal[src]
+            )
+        self.to_min = _inverse(self.transversal)
+        self.orbit_size = np.bincount(self.orbit_min, minlength=n)[
+            self.orbit_min
+        ]
+        # a pointwise stabilizer is determined by the points it fixes
+        self.key = np.flatnonzero(self.orbit_size == 1).tobytes()
+        self.children = {}
+
+    def stabilizer_generators(self, point):
+        """Calculate the generators of the stabilizer of an orbit minimum.
+
+        Uses Schreier's lemma and reduces the generators with
+        :func:`_sims_filter`.
+        """
+        identity = np.arange(len(self.orbit_min))
+        orbit = np.flatnonzero(self.orbit_min == point)
+        gens = self.generators
+        # s * u_z for all generators s and orbit points z
+        composed = gens[
+            np.arange(len(gens))[:, None, None], self.transversal[orbit][None]
+        ]
+        # u_{s(z)}^-1 * s * u_z
+        schreier = _compose(
+            self.to_min[gens[:, orbit]].reshape(-1, len(identity)),
+            composed.reshape(-1, len(identity)),
+        )
+        schreier = schreier[(schreier != identity).any(axis=1)]
+        return _sims_filter(_unique_rows(schreier), identity)
+
+
+class StabilizerChain:
+    """Canonical representatives of tuples under a permutation group.
+
+    The canonical representative of a tuple of points is its
+    lexicographically smallest image under the group. It is calculated
+    point by point: the first entry is the smallest point in the orbit of
+    the first point, and every further entry is the smallest point in the
+    orbit under the pointwise stabilizer of the entries chosen so far. The
+    stabilizers are calculated with Schreier's lemma on demand and cached.
+    Since a pointwise stabilizer is determined by the set of all points it
+    fixes, different prefixes share the same stabilizer, and later tuples
+    mostly need array lookups only.
+
+    Args:
+        group (PermutationGroup): the group acting on points
+    """
+
+    def __init__(self, group):
+        self.n = group.n
+        self._identity = np.arange(self.n)
+        generators = np.array([list(g) for g in group], dtype=np.intp).reshape(
+            -1, self.n
+        )
+        self._root = _Stabilizer(generators, self.n)
+        self._stabilizers = {self._root.key: self._root}
+
+    def _stabilizer(self, parent, point):
+        stabilizer = parent.children.get(point)
+        if stabilizer is None:
+            generators = parent.stabilizer_generators(point)
+            stabilizer = _Stabilizer(generators, self.n)
+            stabilizer = self._stabilizers.setdefault(
+                stabilizer.key, stabilizer
+            )
+            parent.children[point] = stabilizer
+        return stabilizer
+
+    def representative(self, tup):
+        """Calculate the canonical representative of a tuple.
+
+        Args:
+            tup (list of int): the tuple of points
+
+        Returns:
+            list of int: the lexicographically smallest tuple in the orbit of
+                `tup`
+        """
+        g = self._identity
+        stabilizer = self._root
+        result = []
+        for i, x in enumerate(tup):
+            if len(stabilizer.generators) == 0:
+                # the remaining entries cannot be changed anymore
+                result.extend(g[list(tup[i:])].tolist())
+                break
+            y = g[x]
+            m = stabilizer.orbit_min[y]
+            result.append(int(m))
+            if stabilizer.orbit_size[y] > 1:
+                g = stabilizer.to_min[y][g]
+                stabilizer = self._stabilizer(stabilizer, m)
+        return result
+
+
 class PartialPermutation(dict):
     def __init__(self, l, *args):
         assert type(l) == list
@@ -0,0 +1,59 @@
+# Copyright (C) 2026 TU Dresden
+# Licensed under the ISC license (see LICENSE.txt)
+
+import os
+
+import pytest
+
+from mocasin.platforms.odroid import DesignerPlatformOdroid
+from mocasin.platforms.platformDesigner import genericProcessor
+from mocasin.representations.automorphisms import (
+    checkSymmetries,
+    symmetries_from_json,
+)
+from mocasin.representations.permutations import (
+    Permutation,
+    PermutationGroup,
+)
+
+SYMMETRIES_DIR = os.path.join(
+    os.path.dirname(__file__), "..", "..", "platforms", "symmetries"
+)
+
+
+def test_symmetries_from_json_automorphisms():
+    platform = DesignerPlatformOdroid(
+        genericProcessor("proc_type_0"), genericProcessor("proc_type_1")
+    )
+    n, generators = symmetries_from_json(
+        os.path.join(SYMMETRIES_DIR, "odroid.json")
+    )
+    assert n == 8
+    assert checkSymmetries(platform.to_adjacency_dict(), generators)
+    group = PermutationGroup([Permutation(g) for g in generators])
+    assert group.enumerate_orbits() == [
+        frozenset({0, 1, 2, 3}),
+        frozenset({4, 5, 6, 7}),
+    ]
+
+
+@pytest.mark.parametrize(
+    "name, n, orbit",
+    [
+        # corners of the outer 4x4 meshes of a chain of four meshes
+        ("haec", 64, {c + 16 * i for c in [0, 3, 12, 15] for i in [0, 3]}),
+        # the P1 processors of the five clusters
+        (
+            "mppa_coolidge",
+            85,
+            {p + 17 * i for p in range(16) for i in range(5)},
+        ),
+    ],
+)
+def test_symmetries_from_json_super_graph(name, n, orbit):
+    m, generators = symmetries_from_json(
+        os.path.join(SYMMETRIES_DIR, f"{name}.json")
+    )
+    assert m == n
+    group = PermutationGroup([Permutation(g) for g in generators])
+    assert set(group.point_orbit(0)) == orbit
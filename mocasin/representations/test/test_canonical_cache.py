@@ -0,0 +1,46 @@
+# Copyright (C) 2026 TU Dresden
+# Licensed under the ISC license (see LICENSE.txt)
+
+import pytest
+
+from mocasin.representations.cache import CanonicalFormCache
+
+
+def test_canonical_cache_lru():
+    cache = CanonicalFormCache(capacity=2)
+    assert cache.lookup((1, 0)) is None
+    cache.add((1, 0), (0, 1))
+    cache.add((2, 0), (0, 1))
+    assert cache.lookup((1, 0)) == (0, 1)
+    # (2, 0) is the least recently used entry
+    cache.add((3, 0), (0, 1))
+    assert len(cache) == 2
+    assert cache.lookup((2, 0)) is None
+    assert cache.lookup((1, 0)) == (0, 1)
+    assert cache.hits == 2
+    assert cache.misses == 2
+    assert cache.hit_rate == 0.5
+
+
+def test_canonical_cache_invalid_capacity():
+    with pytest.raises(ValueError):
+        CanonicalFormCache(capacity=0)
+
+
+def test_canonical_cache_persistent(tmpdir):
+    path = str(tmpdir.join("canonical.pickle"))
+    cache = CanonicalFormCache(path=path, fingerprint="a")
+    cache.save()
+    assert not tmpdir.join("canonical.pickle").exists()
+    cache.add((1, 0), (0, 1))
+    cache.save()
+
+    cache = CanonicalFormCache(path=path, fingerprint="a")
+    assert cache.lookup((1, 0)) == (0, 1)
+    # a cache of other symmetries is ignored
+    cache = CanonicalFormCache(path=path, fingerprint="b")
+    assert len(cache) == 0
+
+    tmpdir.join("canonical.pickle").write("garbage")
+    cache = CanonicalFormCache(path=path, fingerprint="a")
+    assert len(cache) == 0
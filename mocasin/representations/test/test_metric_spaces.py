@@ -8,6 +8,7 @@ from mocasin.representations.metric_spaces import (
     arch_to_distance_metric_naive,
     FiniteMetricSpaceLP,
     FiniteMetricSpaceLPSym,
+    FiniteMetricSpaceSym,
 )
 from mocasin.representations.embeddings import isMetricSpaceMatrix
 import numpy as np
@@ -154,6 +155,57 @@ class TestMetricSpaces(object):
 
         assert len(oneBall) == 10
 
+    def test_finiteMetricSpace_ball(self, exampleClusterArch):
+        testSpace = exampleClusterArch
+        for p in range(testSpace.n):
+            for r in [0, 1, 2.5, 4]:
+                assert testSpace.ball(p, r) == testSpace._ballNaive(p, r)
+
+    def test_finiteMetricSpaceLP_ballNaive(self, exampleClusterArch):
+        for p in [1, 2, 101]:
+            testProdSpace = FiniteMetricSpaceLP(exampleClusterArch, d=3, p=p)
+            point = testProdSpace.tuple2Int([3, 2, 7])
+            for r in [1, 2, 4]:
+                assert testProdSpace.ball(point, r) == (
+                    testProdSpace._ballNaive(point, r)
+                )
+
+    def test_finiteMetricSpaceLP_populateD(self, exampleClusterArch):
+        for p in [1, 2, 101]:
+            testProdSpace = FiniteMetricSpaceLP(exampleClusterArch, d=2, p=p)
+            rows = [
+                testProdSpace._distances_from(x) for x in range(testProdSpace.n)
+            ]
+            testProdSpace._populateD()
+            assert testProdSpace.D.shape == (256, 256)
+            assert np.array_equal(testProdSpace.D, np.array(rows))
+            for x, y in [(0, 0), (17, 3), (255, 100), (42, 201)]:
+                assert testProdSpace.D[x, y] == testProdSpace._distCalc(
+                    testProdSpace.int2Tuple(x), testProdSpace.int2Tuple(y)
+                )
+
+    def test_finiteMetricSpaceSym_populateD(
+        self, exampleClusterArch, autExampleClusterArch
+    ):
+        testSymSpace = FiniteMetricSpaceSym(
+            exampleClusterArch, autExampleClusterArch
+        )
+        ball = testSymSpace.ball(0, 2)
+        testSymSpace._populateD()
+        for x in range(testSymSpace.n):
+            for y in range(testSymSpace.n):
+                assert testSymSpace.D[x, y] == testSymSpace._distCalc(
+                    list(testSymSpace.elem2orb[x]),
+                    list(testSymSpace.elem2orb[y]),
+                )
+        assert testSymSpace.ball(0, 2) == ball
+        assert ball == testSymSpace._ballNaive(0, 2)
+
+    def test_finiteMetricSpaceLPSym_ball(self, exampleClusterArchSymmetries):
+        testSymSpace = FiniteMetricSpaceLPSym(exampleClusterArchSymmetries, d=2)
+        for r in [0, 1, 2, 4]:
+            assert testSymSpace.ball(3, r) == testSymSpace._ballNaive(3, r)
+
     def test_FiniteMetricSpaceLPSym_length(self, exampleClusterArchSymmetries):
         result = FiniteMetricSpaceLPSym(exampleClusterArchSymmetries, d=2).n
         assert result == 20
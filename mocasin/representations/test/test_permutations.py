@@ -11,6 +11,7 @@ from mocasin.representations.permutations import (
     DuplicateGroup,
     TrivialGroup,
     PermutationGroupFromGens,
+    StabilizerChain,
 )
 
 
@@ -217,6 +218,42 @@ class TestPermutation(object):
             0,
         ]
 
+    def test_stabilizer_chain(self):
+        s4xs8 = ProductGroup(
+            [SymmetricGroupTranspositions(8), SymmetricGroupTranspositions(4)]
+        )
+        s4xs8_double = DuplicateGroup(s4xs8)
+        arch_group = ProductGroup([s4xs8_double, TrivialGroup(3)])
+        chain = StabilizerChain(arch_group)
+
+        assert chain.representative([1, 10, 1, 9, 7, 1, 1, 1, 22, 25, 24]) == [
+            0,
+            8,
+            0,
+            9,
+            1,
+            0,
+            0,
+            0,
+            20,
+            25,
+            24,
+        ]
+
+    def test_stabilizer_chain_minimal(self):
+        # the generated group is not a product of symmetric groups
+        group = PermutationGroup(
+            [
+                Permutation.fromLists([[0, 1, 2, 3]], n=6),
+                Permutation.fromLists([[1, 3], [4, 5]], n=6),
+            ]
+        )
+        chain = StabilizerChain(group)
+        for tup in [[2, 3], [3, 1, 5], [5, 2, 0, 4], [4, 4, 3], [1, 2, 3, 4]]:
+            assert chain.representative(tup) == list(
+                min(group.tuple_orbit(tup))
+            )
+
     def test_duplicate_group(self):
         app_group = DuplicateGroup(
             ProductGroup(
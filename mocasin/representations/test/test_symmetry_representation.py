@@ -3,6 +3,8 @@
 #
 # Author: Robert Khasanov
 
+import os
+
 import pytest
 
 from mocasin.common.graph import DataflowChannel, DataflowProcess, DataflowGraph
@@ -49,3 +51,63 @@ def test_allEquivalent(platform, graph):
     assert (
         len(list(representation.allEquivalent(mapping, only_support=True))) == 6
     )
+
+
+def test_canonical_cache(platform, graph):
+    com_mapper = ComFullMapper(platform)
+    mapper = ProcPartialMapper(graph, platform, com_mapper)
+    representation = SymmetryRepresentation(
+        graph, platform, disable_mpsym=True, canonical_cache_size=2
+    )
+    cache = representation.canonical_cache
+    assert cache.capacity == 2
+
+    first = representation.toRepresentation(mapper.generate_mapping([4, 5]))
+    assert (cache.hits, cache.misses) == (0, 1)
+    mapping = mapper.generate_mapping([4, 5])
+    assert representation.toRepresentation(mapping) == first
+    mapping = mapper.generate_mapping([5, 4])
+    assert representation.toRepresentation(mapping) == first
+    assert (cache.hits, cache.misses) == (1, 2)
+
+
+def test_persistent_canonical_cache(platform, graph, tmpdir):
+    com_mapper = ComFullMapper(platform)
+    mapper = ProcPartialMapper(graph, platform, com_mapper)
+    symmetries_json = tmpdir.join("odroid.json")
+    symmetries_json.write("{}")
+    platform.ag_json = str(symmetries_json)
+
+    representation = SymmetryRepresentation(
+        graph, platform, disable_mpsym=True, persistent_canonical_cache=True
+    )
+    cache = representation.canonical_cache
+    assert cache.path == str(tmpdir.join("odroid.canonical.pickle"))
+    representation.toRepresentation(mapper.generate_mapping([4, 5]))
+    cache.save()
+
+    representation = SymmetryRepresentation(
+        graph, platform, disable_mpsym=True, persistent_canonical_cache=True
+    )
+    assert len(representation.canonical_cache) == 1
+
+
+def test_python_symmetries_from_json(platform, graph):
+    com_mapper = ComFullMapper(platform)
+    mapper = ProcPartialMapper(graph, platform, com_mapper)
+    mapping = mapper.generate_mapping([7, 1])
+
+    representation = SymmetryRepresentation(graph, platform, disable_mpsym=True)
+    assert representation.toRepresentation(mapping) == [4, 0]
+
+    platform.ag_json = os.path.join(
+        os.path.dirname(__file__),
+        "..",
+        "..",
+        "platforms",
+        "symmetries",
+        "odroid.json",
+    )
+    representation = SymmetryRepresentation(graph, platform, disable_mpsym=True)
+    assert not hasattr(representation, "_arch_nc")
+    assert representation.toRepresentation(mapping) == [4, 0]
@@ -16,6 +16,7 @@ from mocasin.common.trace import (
     DataflowTrace,
     ComputeSegment,
     ReadTokenSegment,
+    TraceLoop,
     WriteTokenSegment,
 )
 
@@ -288,23 +289,42 @@ class Sdf3Trace(DataflowTrace):
             ComputeSegment, ReadTokenSegment, or WriteTokenSegment: The next
                 segment in the process trace
         """
-        firings = self._firing_rules[process]
+        yield from self.get_trace_loop(process)
 
-        # place all initial tokens (also called delays)
-        for channel, count in firings.initial_writes.items():
-            yield WriteTokenSegment(channel=channel, num_tokens=count)
+    def get_trace_loop(self, process):
+        """Get the trace for a specific actor compressed as a loop
 
-        total_reps = self._repetition_vector[process] * self._repetitions
-        for _ in range(0, total_reps):
-            # read tokens
-            for channel, count in firings.reads.items():
-                yield ReadTokenSegment(channel=channel, num_tokens=count)
+        The prologue places all initial tokens (also called delays), and each
+        loop iteration contains the firings of the actor in one iteration of
+        the entire SDF graph.
 
-            # compute
-            yield ComputeSegment(
+        Args:
+            process (str): Name of the actor to get a trace for
+
+        Returns:
+            TraceLoop: the compressed trace
+        """
+        firings = self._firing_rules[process]
+
+        prologue = [
+            WriteTokenSegment(channel=channel, num_tokens=count)
+            for channel, count in firings.initial_writes.items()
+        ]
+
+        # read tokens, compute, and write tokens
+        firing = [
+            ReadTokenSegment(channel=channel, num_tokens=count)
+            for channel, count in firings.reads.items()
+        ]
+        firing.append(
+            ComputeSegment(
                 processor_cycles=self._actor_processor_cycles[process]
             )
+        )
+        firing.extend(
+            WriteTokenSegment(channel=channel, num_tokens=count)
+            for channel, count in firings.writes.items()
+        )
 
-            # write tokens
-            for channel, count in firings.writes.items():
-                yield WriteTokenSegment(channel=channel, num_tokens=count)
+        body = tuple(firing) * self._repetition_vector[process]
+        return TraceLoop(prologue, body, self._repetitions)
@@ -8,6 +8,7 @@ from dataclasses import dataclass
 import hydra
 import simpy
 
+from mocasin.platforms.snapshot import instantiate_platform
 from mocasin.simulate.application import RuntimeDataflowApplication
 from mocasin.simulate.system import RuntimeSystem
 
@@ -20,11 +21,14 @@ class SimulationResult:
         exec_time (float): total simulated time in ps.
         static_energy (float): static energy consumption in pJ.
         dynamic_energy (float): dynamic energy consumption in pJ.
+        estimated (bool): whether the result was estimated by the pre-filter
+            of the simulation manager instead of simulated.
     """
 
     exec_time: float
     static_energy: float
     dynamic_energy: float
+    estimated: bool = False
 
     @property
     def total_energy(self) -> float:
@@ -69,14 +73,19 @@ class BaseSimulation:
             ``RuntimeError`` .
         result (SimulationResult): the result of the simulation run. This is
             initialized to ``None`` and updated after calling ``run()``
+        production (bool): whether the simulation runs in production mode
 
     Args:
         platform (Platform): the platform that is simulated by this object
+        production (bool): If true, the simulation runs in production mode.
+            Then, the runtime objects discard all debug messages without
+            formatting them and no simulation traces can be recorded.
     """
 
-    def __init__(self, platform):
+    def __init__(self, platform, production=False):
         self.env = None
         self.platform = platform
+        self.production = production
         self.system = None
         self.result = None
         self.run = self._default_run
@@ -88,7 +97,7 @@ class BaseSimulation:
         RuntimeSystem instance ``system``.
         """
         self.env = simpy.Environment()
-        self.system = RuntimeSystem(self.platform, self.env)
+        self.system = RuntimeSystem(self.platform, self.env, self.production)
         self.run = self._run
         return self
 
@@ -144,6 +153,8 @@ class DataflowSimulation(BaseSimulation):
         wait_for_initial_tokens (bool): If true, the application's processes
             only start if initial tokens (first reads in the trace) are
             available. Otherwise, they would start and immediately block.
+        production (bool): If true, the simulation runs in production mode
+            (see :class:`BaseSimulation`).
     """
 
     def __init__(
@@ -153,8 +164,9 @@ class DataflowSimulation(BaseSimulation):
         mapping,
         app_trace,
         wait_for_initial_tokens=False,
+        production=False,
     ):
-        super().__init__(platform)
+        super().__init__(platform, production)
         self.graph = graph
         self.mapping = mapping
         self.app_trace = app_trace
@@ -222,7 +234,7 @@ class DataflowSimulation(BaseSimulation):
         Args:
             cfg: a hydra configuration object
         """
-        platform = hydra.utils.instantiate(cfg["platform"])
+        platform = instantiate_platform(cfg)
         trace = hydra.utils.instantiate(cfg["trace"])
         graph = hydra.utils.instantiate(cfg["graph"])
         rep = hydra.utils.instantiate(cfg["representation"], graph, platform)
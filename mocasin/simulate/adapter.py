@@ -19,3 +19,33 @@ class SimulateLoggerAdapter(logging.LoggerAdapter):
         instance = colored(self._instance, "green")
         msg = "@%14d %s: %s" % (self._env.now, instance, msg)
         return msg, kwargs
+
+
+class ProductionLoggerAdapter(SimulateLoggerAdapter):
+    """A logger adapter for production simulations.
+
+    Debug messages are discarded right away, without checking the log level
+    or formatting the message. All other messages are handled like in
+    :class:`SimulateLoggerAdapter`.
+    """
+
+    def debug(self, msg, *args, **kwargs):
+        pass
+
+
+def create_logger_adapter(logger, instance, env, production=False):
+    """Create a logger adapter for a runtime object of the simulation.
+
+    Args:
+        logger (logging.Logger): the logger of the module
+        instance (str): the name of the runtime object
+        env (~simpy.core.Environment): the simpy environment
+        production (bool): whether the simulation runs in production mode
+
+    Returns:
+        SimulateLoggerAdapter: a logger adapter that prefixes all messages
+            with the simulation time and the object name
+    """
+    if production:
+        return ProductionLoggerAdapter(logger, instance, env)
+    return SimulateLoggerAdapter(logger, instance, env)
@@ -7,7 +7,7 @@
 from mocasin.util import logging
 from mocasin.simulate.channel import RuntimeChannel
 from mocasin.simulate.process import RuntimeDataflowProcess
-from mocasin.simulate.adapter import SimulateLoggerAdapter
+from mocasin.simulate.adapter import create_logger_adapter
 
 
 log = logging.getLogger(__name__)
@@ -102,7 +102,9 @@ class RuntimeDataflowApplication(RuntimeApplication):
                 rc = self._channels[c.name]
                 proc.connect_to_outgoing_channel(rc)
 
-        self._log = SimulateLoggerAdapter(log, self.name, self.env)
+        self._log = create_logger_adapter(
+            log, self.name, self.env, system.production
+        )
 
     def processes(self):
         """Get a list of all processes
@@ -10,7 +10,7 @@ dataflow channels."""
 import weakref
 
 from mocasin.util import logging
-from mocasin.simulate.adapter import SimulateLoggerAdapter
+from mocasin.simulate.adapter import create_logger_adapter
 from mocasin.simulate.process import ProcessState
 
 
@@ -41,6 +41,12 @@ class RuntimeChannel(object):
         _capacity (int): maximum number of tokens that can be stored in a FIFO
         _primitive (Primitive): The communication primitive this channel is
             mmapped to
+        _consume_phases (dict[str, tuple]): A table of the consume phases of
+            the primitive per processor name. Each phase is stored together
+            with the resources that need to be requested during the phase.
+            The table is filled on first use.
+        _produce_phases (dict[str, tuple]): A table of the produce phases of
+            the primitive in the same format as :attr:`_consume_phases`.
 
     Args:
         name (str): the channel name
@@ -56,12 +62,15 @@ class RuntimeChannel(object):
 
         log.debug(f"initialize new runtime channel: ({self.full_name})")
 
-        self._log = SimulateLoggerAdapter(log, name, self.env)
+        self._production = app.system.production
+        self._log = create_logger_adapter(log, name, self.env, self._production)
         self._src = None
         self._sinks = []
         self._fifo_state = {}
         self._capacity = None
         self._primitive = None
+        self._consume_phases = {}
+        self._produce_phases = {}
         self._token_size = token_size
 
         self.tokens_produced = self.env.event()
@@ -110,7 +119,7 @@ class RuntimeChannel(object):
         self._fifo_state[process.name] = 0
 
         # record the channel creation in the simulation trace
-        if self.app.system.app_trace_enabled:
+        if not self._production and self.app.system.app_trace_enabled:
             self.trace_writer.update_counter(
                 self.app.name,
                 self.name,
@@ -276,55 +285,33 @@ class RuntimeChannel(object):
         assert process.check_state(ProcessState.RUNNING)
 
         sink = process.processor
-        prim = self._primitive
         log = self._log
 
         log.debug(
             "start a consume operation reading %d tokens using %s",
             num,
-            prim.name,
+            self._primitive.name,
         )
 
-        if sink not in prim.consumers:
-            raise RuntimeError(
-                "processor %s cannot consume tokens using the primitive %s"
-                % (sink.name, prim.name)
+        phases = self._consume_phases.get(sink.name)
+        if phases is None:
+            if sink not in self._primitive.consumers:
+                raise RuntimeError(
+                    "processor %s cannot consume tokens using the primitive %s"
+                    % (sink.name, self._primitive.name)
+                )
+            phases = self._consume_phases[sink.name] = self._prepare_phases(
+                self._primitive.consume_phases[sink.name]
             )
 
-        for phase in prim.consume_phases[sink.name]:
-            log.debug('start communication phase "%s"', phase.name)
-
-            # 1. request all resouces
-            requests = []
-            for r in phase.resources:
-                log.debug("via resource: %s", r.name)
-                if hasattr(r, "simpy_resource"):
-                    req = r.simpy_resource.request()
-                    requests.append(req)
-                    log.debug("request resource %s", r.name)
-                    yield req
-                else:
-                    requests.append(None)
-
-            # pay for the delay
-            size = num * self._token_size
-            ticks = phase.get_costs(size)
-            yield self.env.timeout(ticks)
-
-            # release all resources that we requested before
-            for res, req in zip(phase.resources, requests):
-                if req is not None:
-                    log.debug("release resource %s", r.name)
-                    res.simpy_resource.release(req)
-
-            log.debug("communication phase completed")
+        yield from self._communicate(phases, num)
 
         # update the state
         new_state = self._fifo_state[process.name] - num
         self._fifo_state[process.name] = new_state
 
         # record the consume operation in the simulation trace
-        if self.app.system.app_trace_enabled:
+        if not self._production and self.app.system.app_trace_enabled:
             self.trace_writer.update_counter(
                 self.app.name,
                 self.name,
@@ -368,55 +355,33 @@ class RuntimeChannel(object):
         assert process.check_state(ProcessState.RUNNING)
 
         src = process.processor
-        prim = self._primitive
         log = self._log
 
         log.debug(
             "start a produce operation writing %d tokens using %s",
             num,
-            prim.name,
+            self._primitive.name,
         )
 
-        if src not in prim.producers:
-            raise RuntimeError(
-                "processor %s cannot produce tokens using the primitive %s"
-                % (src.name, prim.name)
+        phases = self._produce_phases.get(src.name)
+        if phases is None:
+            if src not in self._primitive.producers:
+                raise RuntimeError(
+                    "processor %s cannot produce tokens using the primitive %s"
+                    % (src.name, self._primitive.name)
+                )
+            phases = self._produce_phases[src.name] = self._prepare_phases(
+                self._primitive.produce_phases[src.name]
             )
 
-        for phase in prim.produce_phases[src.name]:
-            log.debug('start communication phase "%s"', phase.name)
-
-            # 1. request all resouces
-            requests = []
-            for r in phase.resources:
-                log.debug("via resource: %s", r.name)
-                if hasattr(r, "simpy_resource"):
-                    req = r.simpy_resource.request()
-                    requests.append(req)
-                    log.debug("request resource %s", r.name)
-                    yield req
-                else:
-                    requests.append(None)
-
-            # pay for the delay
-            size = num * self._token_size
-            ticks = phase.get_costs(size)
-            yield self.env.timeout(ticks)
-
-            # release all resources that we requested before
-            for res, req in zip(phase.resources, requests):
-                if req is not None:
-                    log.debug("release resource %s", r.name)
-                    res.simpy_resource.release(req)
-
-            log.debug("communication phase completed")
+        yield from self._communicate(phases, num)
 
         # update the state
         for p in self._fifo_state:
             self._fifo_state[p] += num
 
         # record the produce operation in the simulation trace
-        if self.app.system.app_trace_enabled:
+        if not self._production and self.app.system.app_trace_enabled:
             self.trace_writer.update_counter(
                 self.app.name,
                 self.name,
@@ -430,12 +395,64 @@ class RuntimeChannel(object):
         self.tokens_produced.succeed()
         self.tokens_produced = self.env.event()
 
+    def _communicate(self, phases, num):
+        """An event generator that pays for the phases of a transfer.
+
+        For each phase, the resources that model an exclusive access are
+        requested at the start of the phase and released at its end.
+
+        Args:
+            phases (tuple): the phases as stored in :attr:`_consume_phases`
+                or :attr:`_produce_phases`
+            num (int): number of tokens to transfer
+
+        Yields:
+            ~simpy.events.Event: a series of events until all phases completed
+        """
+        log = self._log
+        size = num * self._token_size
+        for phase, resources in phases:
+            log.debug('start communication phase "%s"', phase.name)
+
+            # 1. request all resources
+            requests = []
+            for r in resources:
+                req = r.simpy_resource.request()
+                requests.append(req)
+                log.debug("request resource %s", r.name)
+                yield req
+
+            # pay for the delay
+            yield self.env.timeout(phase.get_costs(size))
+
+            # release all resources that we requested before
+            for r, req in zip(resources, requests):
+                log.debug("release resource %s", r.name)
+                r.simpy_resource.release(req)
+
+            log.debug("communication phase completed")
+
+    @staticmethod
+    def _prepare_phases(phases):
+        """Pair each phase with the resources requested during the phase."""
+        return tuple(
+            (
+                phase,
+                tuple(
+                    r for r in phase.resources if hasattr(r, "simpy_resource")
+                ),
+            )
+            for phase in phases
+        )
+
     def update_mapping_info(self, mapping_info):
         """Update the mapping information for this channel
 
         This needs to be called once before using the channel in an application.
         It will also be called in the context of a process migration, where in
-        consequence also the primitives need to be updated.
+        consequence also the primitives need to be updated. This also resets
+        the tables of communication phases, so changes to the primitive only
+        take effect after calling this method again.
 
         Args:
             mapping_info (ChannelMappingInfo): the new mapping info object
@@ -448,3 +465,5 @@ class RuntimeChannel(object):
             )
 
         self._primitive = mapping_info.primitive
+        self._consume_phases = {}
+        self._produce_phases = {}
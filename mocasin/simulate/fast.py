@@ -0,0 +1,876 @@
+# Copyright (C) 2026 TU Dresden
+# Licensed under the ISC license (see LICENSE.txt)
+
+"""An analytical fast-path simulator for dataflow applications.
+
+:class:`FastDataflowSimulation` replays the same traces and communication
+costs as :class:`~mocasin.simulate.DataflowSimulation`, but it uses a plain
+event queue instead of simpy processes, scheduler coroutines and logging
+adapters. It is intended for design space exploration, where many mappings of
+the same application need to be evaluated quickly. To evaluate many mappings
+at once, :class:`FastSimulationBatch` decodes the trace only once and shares
+the tick conversions and communication costs among all mappings.
+
+The fast simulator models the same first-come first-served processor
+scheduling, context switches, blocking channel semantics and exclusive
+communication resources as the discrete-event simulator. However, it makes
+two simplifications. First, requests of exclusive communication resources are
+served in the order they are issued, and all phases of a produce or consume
+operation are reserved at once. Second, the multithread scheduling policy is
+not supported. Further, simulation traces cannot be recorded.
+
+If the traces of all processes are loops with the same number of iterations
+(see :meth:`~mocasin.common.trace.DataflowTrace.get_trace_loop`), e.g., for
+SDF3 and TGFF applications, the simulation detects when the system reaches a
+periodic steady state. The state of the system, relative to the current time
+and the current iteration, is recorded whenever the first process starts a
+new iteration. Once a state repeats, the system behaves the same in every
+following period until the processes approach the end of their traces. The
+simulation then skips as many whole periods as possible by advancing the
+time, the busy times of the processors and the positions in the traces, and
+simulates the remaining iterations as usual. The results are the same as
+without skipping.
+"""
+
+from collections import deque
+import heapq
+import itertools
+import logging
+
+import hydra
+import numpy as np
+
+from mocasin.common.trace import SegmentType
+from mocasin.simulate import BaseSimulation, SimulationResult
+from mocasin.platforms.snapshot import instantiate_platform
+
+log = logging.getLogger(__name__)
+
+# The maximum number of states recorded while looking for a steady state
+_MAX_STATES = 1000
+
+# The scheduling policies implemented by the fast simulation
+SUPPORTED_POLICIES = ("FIFO", "RoundRobin")
+
+
+def unsupported_policies(platform):
+    """Find the scheduling policies of a platform, which are not supported.
+
+    Args:
+        platform (Platform): a platform
+
+    Returns:
+        set of str: the names of the policies used by a scheduler of
+            `platform`, which are not in :data:`SUPPORTED_POLICIES`
+    """
+    policies = {s.policy.name for s in platform.schedulers()}
+    return policies.difference(SUPPORTED_POLICIES)
+
+
+class _Scheduler:
+    """The scheduling state of a single processor."""
+
+    def __init__(self, processor, policy):
+        if policy.name not in SUPPORTED_POLICIES:
+            raise NotImplementedError(
+                "The fast simulation does not implement the "
+                f"{policy.name} scheduling policy"
+            )
+        if policy.name == "RoundRobin" and policy.time_slice is None:
+            raise RuntimeError(
+                "time_slice must be defined for a RoundRobin scheduler"
+            )
+        self.processor = processor
+        self.round_robin = policy.name == "RoundRobin"
+        self.time_slice = policy.time_slice if self.round_robin else None
+        self.scheduling_ticks = processor.ticks(policy.scheduling_cycles)
+        self.load_ticks = processor.context_load_ticks()
+        self.store_ticks = processor.context_store_ticks()
+        self.processes = deque()
+        self.ready = deque()
+        # the process whose context is currently loaded
+        self.current = None
+        self.busy = False
+        self.slice_end = None
+        # the time the running process was activated, None if no process runs
+        self.activated_at = None
+        self.busy_time = 0
+        self.last_update = 0
+
+    def schedule(self):
+        """Select the next process to run."""
+        if len(self.ready) == 0:
+            return None
+        if not self.round_robin:
+            return self.ready.popleft()
+        # This mirrors RoundRobinScheduler.schedule()
+        while True:
+            process = self.processes[0]
+            if process in self.ready:
+                self.ready.remove(process)
+                return process
+            self.processes.rotate(-1)
+
+
+class _Channel:
+    """The runtime state of a dataflow channel."""
+
+    def __init__(self, name, token_size, mapping_info):
+        self.name = name
+        self.token_size = token_size
+        self.capacity = mapping_info.capacity
+        self.primitive = mapping_info.primitive
+        self.src = None
+        # number of tokens stored in the FIFO of each sink
+        self.fifo = {}
+        self.waiting_readers = []
+        self.waiting_writers = []
+
+    def can_consume(self, process, num):
+        return self.fifo[process] >= num
+
+    def can_produce(self, num):
+        return all(v + num <= self.capacity for v in self.fifo.values())
+
+
+class _Process:
+    """The runtime state of a dataflow process.
+
+    The trace of the process consists of `segments[:prologue_len]`, followed
+    by repetitions of `segments[prologue_len:]`, with `length` segments in
+    total. `index` is the position in the whole trace and `position` is the
+    position in `segments`.
+    """
+
+    def __init__(self, name, segments, prologue_len, length, ticks, scheduler):
+        self.name = name
+        self.segments = segments
+        self.prologue_len = prologue_len
+        self.body_len = len(segments) - prologue_len
+        self.length = length
+        self.repetitions = 0
+        if self.body_len:
+            self.repetitions = (length - prologue_len) // self.body_len
+        # compute ticks on the mapped processor for each segment
+        self.ticks = ticks
+        self.index = 0
+        self.position = 0
+        self.segment = segments[0] if length else None
+        self.scheduler = scheduler
+        self.processor_type = scheduler.processor.type
+        self.channels = {}
+        self.remaining_cycles = None
+        # a list of (channel, num_tokens, is_read) tuples the process waits for
+        self.waits_for = None
+
+    def can_resume(self):
+        return all(
+            c.can_consume(self, n) if is_read else c.can_produce(n)
+            for c, n, is_read in self.waits_for
+        )
+
+    def advance(self):
+        self.index += 1
+        if self.index < self.length:
+            self.position += 1
+            if self.position == len(self.segments):
+                self.position = self.prologue_len
+            self.segment = self.segments[self.position]
+        else:
+            self.segment = None
+
+    def iteration(self):
+        """Get the current loop iteration or None within the prologue."""
+        if self.index < self.prologue_len:
+            return None
+        return (self.index - self.prologue_len) // self.body_len
+
+    def trace(self):
+        """Iterate over all segments of the trace."""
+        body = self.segments[self.prologue_len :]
+        return itertools.chain(
+            self.segments[: self.prologue_len],
+            itertools.chain.from_iterable(
+                itertools.repeat(body, self.repetitions)
+            ),
+        )
+
+
+class _CostTable:
+    """A table of communication costs shared by many simulation runs.
+
+    For each combination of primitive, processor, direction and transfer size,
+    the table stores the cost of each communication phase together with the
+    exclusive resources the phase occupies. Entries are calculated on first
+    use and reused afterwards.
+    """
+
+    def __init__(self):
+        self._phases = {}
+
+    def phases(self, prim, processor, produce, size):
+        """Get the phases of a produce or consume operation.
+
+        Returns:
+            list of tuple: a list of tuples of the exclusive resources and the
+                costs in ticks of each phase
+        """
+        key = (prim, processor, produce, size)
+        phases = self._phases.get(key)
+        if phases is None:
+            phases = self._phases[key] = self._calculate(
+                prim, processor, produce, size
+            )
+        return phases
+
+    def _calculate(self, prim, processor, produce, size):
+        if produce:
+            if processor not in prim.producers:
+                raise RuntimeError(
+                    f"processor {processor.name} cannot produce tokens using "
+                    f"the primitive {prim.name}"
+                )
+            phases = prim.produce_phases[processor.name]
+        else:
+            if processor not in prim.consumers:
+                raise RuntimeError(
+                    f"processor {processor.name} cannot consume tokens using "
+                    f"the primitive {prim.name}"
+                )
+            phases = prim.consume_phases[processor.name]
+        return [
+            (
+                tuple(r for r in phase.resources if r.exclusive),
+                phase.get_costs(size),
+            )
+            for phase in phases
+        ]
+
+
+class _Engine:
+    """The event queue and the state of a single fast simulation run."""
+
+    def __init__(self, batch, mapping, compute_ticks):
+        self.platform = batch.platform
+        self.now = 0
+        self._queue = []
+        self._counter = itertools.count()
+        # times until which exclusive communication resources are reserved
+        self._busy_until = {}
+
+        self._costs = batch.costs
+
+        self._schedulers = {}
+        for sched in self.platform.schedulers():
+            for proc in sched.processors:
+                self._schedulers[proc] = _Scheduler(proc, sched.policy)
+
+        channels = {}
+        for channel in batch.graph.channels():
+            channels[channel.name] = _Channel(
+                channel.name, channel.token_size, mapping.channel_info(channel)
+            )
+        self._channels = list(channels.values())
+
+        self._processes = []
+        for process in batch.graph.processes():
+            processor = mapping.process_info(process).affinity
+            prologue_len, length = batch.loops[process.name]
+            p = _Process(
+                process.name,
+                batch.segments[process.name],
+                prologue_len,
+                length,
+                compute_ticks[process.name, processor],
+                self._schedulers[processor],
+            )
+            for channel in process.incoming_channels:
+                c = channels[channel.name]
+                c.fifo[p] = 0
+                p.channels[channel.name] = c
+            for channel in process.outgoing_channels:
+                c = channels[channel.name]
+                c.src = p
+                p.channels[channel.name] = c
+            self._processes.append(p)
+        self._unfinished = len(self._processes)
+        self._wait_for_initial = batch.wait_for_initial_tokens
+
+        # the states recorded at the iteration starts of the first process,
+        # None if the steady state is not looked for (anymore)
+        self._states = {} if batch.fast_forward else None
+        self._checkpoint_due = False
+        self._ids = {p: i for i, p in enumerate(self._processes)}
+
+    def _push(self, time, callback, process):
+        heapq.heappush(
+            self._queue, (time, next(self._counter), callback, process)
+        )
+
+    def run(self):
+        """Run the simulation until all processes finished.
+
+        Returns:
+            int: the simulated time in ticks
+        """
+        for p in self._processes:
+            p.scheduler.processes.append(p)
+            if self._wait_for_initial and self._wait_initial_tokens(p):
+                continue
+            self._make_ready(p)
+
+        queue = self._queue
+        while self._unfinished > 0:
+            if not queue:
+                blocked = [p.name for p in self._processes if p.waits_for]
+                raise RuntimeError(
+                    "The simulation deadlocked. Blocked processes: "
+                    f"{', '.join(blocked)}"
+                )
+            self.now, _, callback, process = heapq.heappop(queue)
+            callback(process)
+            if self._checkpoint_due:
+                self._checkpoint()
+        return self.now
+
+    def calculate_energy(self):
+        """Calculate the static and the dynamic energy consumption.
+
+        Returns:
+            tuple: the static and the dynamic energy in pJ, or None if the
+                platform does not have a power model
+        """
+        if not self.platform.has_power_model():
+            return None
+        schedulers = self._schedulers.values()
+        total_time = max(s.last_update for s in schedulers)
+        static_energy = 0
+        dynamic_energy = 0
+        for s in schedulers:
+            if s.processor.static_power() is not None:
+                static_energy += s.processor.static_power() * total_time
+            if s.processor.dynamic_power() is not None:
+                dynamic_energy += s.processor.dynamic_power() * s.busy_time
+        if self.platform.peripheral_static_power:
+            static_energy += self.platform.peripheral_static_power * total_time
+        return static_energy, dynamic_energy
+
+    def _state(self):
+        """Get the state of the simulation relative to the current time.
+
+        Returns:
+            tuple: a hashable representation of the state of the processes,
+                channels, schedulers, events and communication resources. The
+                iterations of the processes are relative to the iteration of
+                the first process.
+        """
+        now = self.now
+        ids = self._ids
+        reference = self._processes[0].iteration()
+        processes = []
+        for p in self._processes:
+            if p.segment is None:
+                position = None
+            elif p.index < p.prologue_len:
+                position = (p.position, None)
+            else:
+                position = (p.position, p.iteration() - reference)
+            waits_for = None
+            if p.waits_for is not None:
+                waits_for = tuple((c.name, n, r) for c, n, r in p.waits_for)
+            processes.append((position, p.remaining_cycles, waits_for))
+        channels = tuple(
+            (
+                tuple(c.fifo.values()),
+                tuple(ids[p] for p in c.waiting_readers),
+                tuple(ids[p] for p in c.waiting_writers),
+            )
+            for c in self._channels
+        )
+        schedulers = []
+        for s in self._schedulers.values():
+            running = None
+            if s.activated_at is not None:
+                slice_end = None if s.slice_end is None else s.slice_end - now
+                running = (s.activated_at - now, slice_end)
+            schedulers.append(
+                (
+                    tuple(ids[p] for p in s.processes),
+                    tuple(ids[p] for p in s.ready),
+                    ids.get(s.current),
+                    s.busy,
+                    running,
+                )
+            )
+        events = tuple(
+            (time - now, callback.__name__, ids[p])
+            for time, _, callback, p in sorted(self._queue)
+        )
+        resources = frozenset(
+            (r, time - now)
+            for r, time in self._busy_until.items()
+            if time > now
+        )
+        return (
+            tuple(processes),
+            channels,
+            tuple(schedulers),
+            events,
+            resources,
+        )
+
+    def _checkpoint(self):
+        """Record the state and skip periods once the state repeats."""
+        self._checkpoint_due = False
+        schedulers = list(self._schedulers.values())
+        state = self._state()
+        iteration = self._processes[0].iteration()
+        record = (
+            self.now,
+            iteration,
+            [s.busy_time for s in schedulers],
+            [s.last_update for s in schedulers],
+        )
+        previous = self._states.get(state)
+        if previous is None:
+            # bound the memory if the steady state is not reached soon
+            if len(self._states) >= _MAX_STATES:
+                self._states.clear()
+            self._states[state] = record
+            return
+
+        self._states = None
+        time, previous_iteration, busy_times, last_updates = previous
+        period = iteration - previous_iteration
+        # skip whole periods while all processes remain within their loops
+        skip = min(
+            (
+                (p.repetitions - 1 - p.iteration()) // period
+                for p in self._processes
+                if p.segment is not None and p.index >= p.prologue_len
+            ),
+            default=0,
+        )
+        if skip <= 0:
+            return
+        log.debug(
+            f"Reached a steady state with a period of {period} iterations and "
+            f"{self.now - time} ticks, skipping {skip * period} iterations"
+        )
+
+        delta = skip * (self.now - time)
+        self.now += delta
+        # shifting all events preserves the heap order
+        self._queue[:] = [(t + delta, c, cb, p) for t, c, cb, p in self._queue]
+        for r in self._busy_until:
+            self._busy_until[r] += delta
+        for p in self._processes:
+            if p.segment is not None and p.index >= p.prologue_len:
+                p.index += skip * period * p.body_len
+        for s, busy_time, last_update in zip(
+            schedulers, busy_times, last_updates
+        ):
+            s.busy_time += skip * (s.busy_time - busy_time)
+            # processors that were idle during the period stay idle
+            if s.last_update != last_update:
+                s.last_update += delta
+            if s.activated_at is not None:
+                s.activated_at += delta
+            if s.slice_end is not None:
+                s.slice_end += delta
+
+    def _wait_initial_tokens(self, p):
+        """Block `p` if the initial reads in its trace cannot be satisfied."""
+        initial_reads = itertools.takewhile(
+            lambda s: s.segment_type == SegmentType.READ_TOKEN, p.trace()
+        )
+        waits_for = [
+            (p.channels[s.channel], s.num_tokens, True)
+            for s in initial_reads
+            if not p.channels[s.channel].can_consume(p, s.num_tokens)
+        ]
+        if not waits_for:
+            return False
+        self._block(p, waits_for)
+        return True
+
+    def _make_ready(self, p):
+        s = p.scheduler
+        if p not in s.ready:
+            s.ready.append(p)
+        if not s.busy:
+            self._dispatch(s)
+
+    def _dispatch(self, s):
+        p = s.schedule()
+        if p is None:
+            s.busy = False
+            return
+        s.busy = True
+        time = self.now + s.scheduling_ticks
+        if s.current is not p:
+            if s.current is not None:
+                time += s.store_ticks
+            time += s.load_ticks
+            s.current = p
+        self._push(time, self._activate, p)
+
+    def _activate(self, p):
+        s = p.scheduler
+        s.activated_at = s.last_update = self.now
+        if s.time_slice is not None:
+            s.slice_end = self.now + s.time_slice
+        self._start_segment(p)
+
+    def _release(self, p):
+        """Stop running `p` and schedule the next process."""
+        s = p.scheduler
+        s.busy_time += self.now - s.activated_at
+        s.activated_at = None
+        s.last_update = self.now
+        self._dispatch(s)
+
+    def _block(self, p, waits_for):
+        p.waits_for = waits_for
+        for c, _, is_read in waits_for:
+            if is_read:
+                c.waiting_readers.append(p)
+            else:
+                c.waiting_writers.append(p)
+
+    def _unblock(self, p):
+        for c, _, is_read in p.waits_for:
+            waiting = c.waiting_readers if is_read else c.waiting_writers
+            if p in waiting:
+                waiting.remove(p)
+        p.waits_for = None
+        self._make_ready(p)
+
+    def _communicate(self, p, channel, num, produce):
+        """Reserve all phases of a produce or consume operation.
+
+        Returns:
+            int: the time when the operation completes
+        """
+        phases = self._costs.phases(
+            channel.primitive,
+            p.scheduler.processor,
+            produce,
+            num * channel.token_size,
+        )
+        busy_until = self._busy_until
+        time = self.now
+        for exclusive, costs in phases:
+            for r in exclusive:
+                time = max(time, busy_until.get(r, 0))
+            time += costs
+            for r in exclusive:
+                busy_until[r] = time
+        return time
+
+    def _start_segment(self, p):
+        s = p.segment
+        if s is None:
+            self._finish(p)
+            return
+
+        segment_type = s.segment_type
+        if segment_type == SegmentType.COMPUTE:
+            scheduler = p.scheduler
+            if p.remaining_cycles is None:
+                ticks = p.ticks[p.position]
+            else:
+                ticks = scheduler.processor.ticks(p.remaining_cycles)
+            end = self.now + ticks
+            slice_end = scheduler.slice_end
+            if slice_end is not None and end > slice_end:
+                if p.remaining_cycles is None:
+                    cycles = s.processor_cycles[p.processor_type]
+                else:
+                    cycles = p.remaining_cycles
+                processed = int(
+                    round(float(cycles) * (slice_end - self.now) / ticks)
+                )
+                p.remaining_cycles = cycles - processed
+                self._push(slice_end, self._preempt, p)
+            else:
+                p.remaining_cycles = None
+                self._push(end, self._segment_done, p)
+        elif segment_type == SegmentType.READ_TOKEN:
+            c = p.channels[s.channel]
+            if c.can_consume(p, s.num_tokens):
+                end = self._communicate(p, c, s.num_tokens, produce=False)
+                self._push(end, self._read_done, p)
+            else:
+                self._block(p, [(c, s.num_tokens, True)])
+                self._release(p)
+        elif segment_type == SegmentType.WRITE_TOKEN:
+            c = p.channels[s.channel]
+            if c.can_produce(s.num_tokens):
+                end = self._communicate(p, c, s.num_tokens, produce=True)
+                self._push(end, self._write_done, p)
+            else:
+                self._block(p, [(c, s.num_tokens, False)])
+                self._release(p)
+        else:
+            raise RuntimeError(
+                f"Encountered an unknown segment type! ({segment_type})"
+            )
+
+    def _read_done(self, p):
+        s = p.segment
+        c = p.channels[s.channel]
+        c.fifo[p] -= s.num_tokens
+        for waiting in list(c.waiting_writers):
+            if waiting.can_resume():
+                self._unblock(waiting)
+        self._segment_done(p)
+
+    def _write_done(self, p):
+        s = p.segment
+        c = p.channels[s.channel]
+        for sink in c.fifo:
+            c.fifo[sink] += s.num_tokens
+        for waiting in list(c.waiting_readers):
+            if waiting.can_resume():
+                self._unblock(waiting)
+        self._segment_done(p)
+
+    def _segment_done(self, p):
+        p.advance()
+        if (
+            self._states is not None
+            and p is self._processes[0]
+            and p.position == p.prologue_len
+            and p.segment is not None
+        ):
+            self._checkpoint_due = True
+        slice_end = p.scheduler.slice_end
+        if slice_end is not None and self.now >= slice_end:
+            self._preempt(p)
+        else:
+            self._start_segment(p)
+
+    def _preempt(self, p):
+        if p.segment is None:
+            self._finish(p)
+            return
+        self._release(p)
+        self._make_ready(p)
+
+    def _finish(self, p):
+        self._unfinished -= 1
+        p.scheduler.processes.remove(p)
+        self._release(p)
+
+
+class FastSimulationBatch:
+    """Fast simulation of many mappings of the same dataflow application
+
+    The batch decodes the trace of each process only once. Traces are read
+    as loops (see :meth:`~mocasin.common.trace.DataflowTrace.get_trace_loop`),
+    so that only the prologue and a single loop iteration are stored. The
+    compute segments of each process are kept in a NumPy array with one
+    column per processor type, so that the compute times of a process on a
+    processor are converted to ticks in a single vectorized operation. The
+    converted ticks as well as the costs of all communication operations are
+    cached and reused by all mappings simulated with the same batch.
+
+    Args:
+        platform (Platform): the platform that is simulated
+        graph (DataflowGraph): the dataflow application to be executed on the
+            given ``platform``
+        app_trace (DataflowTrace): a trace for the given ``graph``
+        wait_for_initial_tokens (bool): If true, the application's processes
+            only start if initial tokens (first reads in the trace) are
+            available. Otherwise, they would start and immediately block.
+        fast_forward (bool): If true, periods of the steady state are skipped
+            (see the module documentation).
+    """
+
+    def __init__(
+        self,
+        platform,
+        graph,
+        app_trace,
+        wait_for_initial_tokens=False,
+        fast_forward=True,
+    ):
+        self.platform = platform
+        self.graph = graph
+        self.wait_for_initial_tokens = wait_for_initial_tokens
+        self.costs = _CostTable()
+
+        processor_types = sorted({p.type for p in platform.processors()})
+        self._type_index = {t: i for i, t in enumerate(processor_types)}
+
+        self.segments = {}
+        # the length of the prologue and of the whole trace of each process
+        self.loops = {}
+        self._cycles = {}
+        repetitions = set()
+        for process in graph.processes():
+            loop = app_trace.get_trace_loop(process.name)
+            segments = loop.prologue + loop.body
+            self.loops[process.name] = (len(loop.prologue), len(loop))
+            repetitions.add(loop.repetitions if loop.body else 0)
+            cycles = np.zeros((len(segments), len(processor_types)))
+            for i, segment in enumerate(segments):
+                if segment.segment_type != SegmentType.COMPUTE:
+                    continue
+                for t, c in segment.processor_cycles.items():
+                    if t in self._type_index:
+                        cycles[i, self._type_index[t]] = c
+            self.segments[process.name] = segments
+            self._cycles[process.name] = cycles
+
+        # a steady state can only be detected if all processes iterate equally
+        self.fast_forward = (
+            fast_forward and len(repetitions) == 1 and repetitions.pop() > 1
+        )
+        self._ticks = {}
+
+    def _compute_ticks(self, process, processor):
+        """Get the compute ticks of each segment of `process` on `processor`."""
+        key = (process, processor)
+        ticks = self._ticks.get(key)
+        if ticks is None:
+            cycles = self._cycles[process][:, self._type_index[processor.type]]
+            frequency = float(processor.frequency_domain.frequency)
+            # the same rounding as in FrequencyDomain.cycles_to_ticks
+            ticks = np.rint(cycles * 1000000000000 / frequency)
+            ticks = self._ticks[key] = ticks.astype(np.int64).tolist()
+        return ticks
+
+    def simulate_mapping(self, mapping):
+        """Simulate a single mapping.
+
+        Args:
+            mapping (Mapping): a mapping of the graph to the platform
+
+        Returns:
+            SimulationResult: the simulation result
+        """
+        compute_ticks = {}
+        for process in self.graph.processes():
+            processor = mapping.process_info(process).affinity
+            compute_ticks[process.name, processor] = self._compute_ticks(
+                process.name, processor
+            )
+        engine = _Engine(self, mapping, compute_ticks)
+        exec_time = engine.run()
+        result = SimulationResult(
+            exec_time=exec_time, static_energy=None, dynamic_energy=None
+        )
+        energy = engine.calculate_energy()
+        if energy:
+            result.static_energy, result.dynamic_energy = energy
+        return result
+
+    def simulate(self, mappings):
+        """Simulate multiple mappings.
+
+        Args:
+            mappings (list of Mapping): mappings of the graph to the platform
+
+        Returns:
+            list of SimulationResult: the simulation results in the same order
+                as ``mappings``
+        """
+        return [self.simulate_mapping(m) for m in mappings]
+
+
+class FastDataflowSimulation(BaseSimulation):
+    """Fast simulation of a single dataflow application
+
+    This class can be used as a replacement for
+    :class:`~mocasin.simulate.DataflowSimulation`. See the module
+    documentation for the differences between both simulators. Since the fast
+    simulation does not use simpy, ``env`` and ``system`` are always ``None``.
+
+    Args:
+        platform (Platform): the platform that is simulated by this object
+        graph (DataflowGraph): the dataflow application to be executed on the
+            given ``platform``
+        mapping (Mapping): a mapping of the ``graph`` to the ``platform``
+        app_trace (DataflowTrace): a trace for the given ``graph``
+        wait_for_initial_tokens (bool): If true, the application's processes
+            only start if initial tokens (first reads in the trace) are
+            available. Otherwise, they would start and immediately block.
+        production (bool): Accepted for compatibility with
+            :class:`~mocasin.simulate.DataflowSimulation`. The fast simulation
+            never logs individual segments.
+        fast_forward (bool): If true, periods of the steady state are skipped
+            (see the module documentation).
+    """
+
+    def __init__(
+        self,
+        platform,
+        graph,
+        mapping,
+        app_trace,
+        wait_for_initial_tokens=False,
+        production=False,
+        fast_forward=True,
+    ):
+        super().__init__(platform, production)
+        self.graph = graph
+        self.mapping = mapping
+        self.app_trace = app_trace
+        self._wait_for_initial_tokens = wait_for_initial_tokens
+        self._fast_forward = fast_forward
+
+    def __enter__(self):
+        """Setup the simulation
+
+        Unlike :meth:`BaseSimulation.__enter__`, this does not create a simpy
+        environment or a runtime system.
+        """
+        self.run = self._run
+        return self
+
+    def __exit__(self, type, value, traceback):
+        """Finalize the simulation"""
+        self.run = self._default_run
+
+    def _run(self):
+        """Run the simulation.
+
+        May only be called once. Updates the :attr:`result` attribute.
+        """
+        if self.result is not None:
+            raise RuntimeError("A FastDataflowSimulation may only be run once!")
+
+        batch = FastSimulationBatch(
+            self.platform,
+            self.graph,
+            self.app_trace,
+            self._wait_for_initial_tokens,
+            self._fast_forward,
+        )
+        self.result = batch.simulate_mapping(self.mapping)
+
+    @staticmethod
+    def from_hydra(cfg, wait_for_initial_tokens):
+        """Factory method.
+
+        Instantiates :class:`FastDataflowSimulation` from a hydra configuration
+        object.
+
+        Args:
+            cfg: a hydra configuration object
+        """
+        platform = instantiate_platform(cfg)
+        trace = hydra.utils.instantiate(cfg["trace"])
+        graph = hydra.utils.instantiate(cfg["graph"])
+        rep = hydra.utils.instantiate(cfg["representation"], graph, platform)
+        mapper = hydra.utils.instantiate(cfg["mapper"], platform)
+        mapping = mapper.generate_mapping(
+            graph, trace=trace, representation=rep
+        )
+        simulation = FastDataflowSimulation(
+            platform, graph, mapping, trace, wait_for_initial_tokens
+        )
+
+        return simulation
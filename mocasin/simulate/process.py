@@ -18,7 +18,7 @@ import more_itertools
 import weakref
 
 from mocasin.common.trace import SegmentType
-from mocasin.simulate.adapter import SimulateLoggerAdapter
+from mocasin.simulate.adapter import create_logger_adapter
 
 
 log = logging.getLogger(__name__)
@@ -132,7 +132,10 @@ class RuntimeProcess(object):
         self._app = weakref.ref(app)
         self._state = ProcessState.CREATED
         self.processor = None
-        self._log = SimulateLoggerAdapter(log, self.full_name, self.env)
+        self._production = app.system.production
+        self._log = create_logger_adapter(
+            log, self.full_name, self.env, self._production
+        )
 
         # setup the events
         self.created = self.env.event()
@@ -150,7 +153,7 @@ class RuntimeProcess(object):
         self._interrupt = self.env.event()
 
         # record the process creation in the simulation trace
-        if self.app.system.app_trace_enabled:
+        if not self._production and self.app.system.app_trace_enabled:
             self.trace_writer.begin_duration(
                 self.app.name, self.name, "CREATED", category="Process"
             )
@@ -198,7 +201,7 @@ class RuntimeProcess(object):
         assert hasattr(self, cb_name)
 
         # record the transition in the simulation trace
-        if self.app.system.app_trace_enabled:
+        if not self._production and self.app.system.app_trace_enabled:
             self.trace_writer.end_duration(
                 self.app.name, self.name, self._state.name, category="Process"
             )
@@ -548,8 +551,10 @@ class RuntimeDataflowProcess(RuntimeProcess):
                 if not channel.can_consume(self, segment.num_tokens):
                     channel_token_pairs.append((channel, segment.num_tokens))
                     self._log.debug(
-                        f"Process blocks because it needs {segment.num_tokens} "
-                        f"initial tokens in channel {segment.channel}"
+                        "Process blocks because it needs %d initial tokens "
+                        "in channel %s",
+                        segment.num_tokens,
+                        segment.channel,
                     )
 
             if len(channel_token_pairs) > 0:
@@ -688,7 +693,9 @@ class RuntimeDataflowProcess(RuntimeProcess):
         # requests and process it only after the operation completes.
         s = self._current_segment
         c = self._channels[s.channel]()
-        self._log.debug(f"read {s.num_tokens} tokens from channel {s.channel}")
+        self._log.debug(
+            "read %d tokens from channel %s", s.num_tokens, s.channel
+        )
         if c.can_consume(self, s.num_tokens):
             return self.env.process(c.consume(self, s.num_tokens))
         else:
@@ -703,7 +710,9 @@ class RuntimeDataflowProcess(RuntimeProcess):
         # processed after this operation completes.
         s = self._current_segment
         c = self._channels[s.channel]()
-        self._log.debug(f"write {s.num_tokens} tokens to channel {s.channel}")
+        self._log.debug(
+            "write %d tokens to channel %s", s.num_tokens, s.channel
+        )
         if c.can_produce(self, s.num_tokens):
             return self.env.process(c.produce(self, s.num_tokens))
         else:
@@ -725,7 +734,7 @@ class RuntimeDataflowProcess(RuntimeProcess):
             processor_cycles = self._remaining_compute_cycles
 
         cycles = processor_cycles[self.processor.type]
-        self._log.debug(f"process for {cycles} cycles")
+        self._log.debug("process for %d cycles", cycles)
         ticks = self.processor.ticks(cycles)
 
         timeout = self.env.timeout(ticks)
@@ -764,7 +773,7 @@ class RuntimeDataflowProcess(RuntimeProcess):
                 # update total processed cycles
                 self._total_cycles_processed[processor] += cycles_processed
             self._log.debug(
-                f"process was deactivated after {cycles_processed} cycles"
+                "process was deactivated after %d cycles", cycles_processed
             )
 
     def get_progress(self):
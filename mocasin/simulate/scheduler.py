@@ -9,7 +9,7 @@ from enum import Enum
 import simpy
 
 from mocasin.util import logging
-from mocasin.simulate.adapter import SimulateLoggerAdapter
+from mocasin.simulate.adapter import create_logger_adapter
 from mocasin.simulate.process import ProcessState, RuntimeProcess
 
 
@@ -90,8 +90,11 @@ class RuntimeScheduler(object):
         self._scheduling_cycles = scheduling_cycles
         self._time_slice = time_slice
         self._system = system
+        self._production = system.production
 
-        self._log = SimulateLoggerAdapter(log, self.name, self.env)
+        self._log = create_logger_adapter(
+            log, self.name, self.env, self._production
+        )
 
         self._processes = deque()
         self._ready_queue = deque()
@@ -270,7 +273,7 @@ class RuntimeScheduler(object):
             self._ready_queue.append(process)
         process.ready.callbacks.append(self._cb_process_ready)
 
-        self._log.debug(f"process {process.name} became ready")
+        self._log.debug("process %s became ready", process.name)
 
         # notify the process ready event
         self.process_ready.succeed()
@@ -329,7 +332,7 @@ class RuntimeScheduler(object):
                 return
             if last_process is not None:
                 self._log.debug(
-                    f"store the context of process {next_process.full_name}"
+                    "store the context of process %s", next_process.full_name
                 )
                 # wait until the store operation is complete
                 ticks = self._processor.context_store_ticks()
@@ -337,12 +340,14 @@ class RuntimeScheduler(object):
 
         # load context of the new process
         if self._context_switch_mode != ContextSwitchMode.NEVER:
-            self._log.debug(f"load context of process {next_process.full_name}")
+            self._log.debug(
+                "load context of process %s", next_process.full_name
+            )
             # wait until the load operation is complete
             ticks = self._processor.context_load_ticks()
-            self._log.debug(f"before timeout {(ticks)}")
+            self._log.debug("before timeout %d", ticks)
             yield self.env.timeout(ticks)
-            self._log.debug(f"after timeout")
+            self._log.debug("after timeout")
 
     def _store_context(self, process, always=False):
         """A simpy process modeling the context storing for process
@@ -354,7 +359,9 @@ class RuntimeScheduler(object):
             return
 
         if always or self._context_switch_mode == ContextSwitchMode.ALWAYS:
-            self._log.debug(f"store the context of process {process.full_name}")
+            self._log.debug(
+                "store the context of process %s", process.full_name
+            )
             yield self.env.timeout(self._processor.context_store_ticks())
 
     def run(self):
@@ -453,7 +460,7 @@ class RuntimeScheduler(object):
 
     def _execute_process_workload(self, process):
         # record the process activation in the simulation trace
-        if self._system.platform_trace_enabled:
+        if not self._production and self._system.platform_trace_enabled:
             self.trace_writer.begin_duration(
                 self._system.platform.name,
                 self._processor.name,
@@ -483,7 +490,7 @@ class RuntimeScheduler(object):
             yield workload
 
         # record the process halting in the simulation trace
-        if self._system.platform_trace_enabled:
+        if not self._production and self._system.platform_trace_enabled:
             self.trace_writer.end_duration(
                 self._system.platform.name,
                 self._processor.name,
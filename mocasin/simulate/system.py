@@ -29,6 +29,9 @@ class RuntimeSystem:
     Attributes:
         platform (Platform): the underlying platform of the system
         trace_writer (TraceWriter): a trace writer to record simulation traces
+        production (bool): whether the system runs in production mode. In
+            production mode, the runtime objects discard all debug messages
+            and never record simulation traces.
         _env: the simpy environment
         _processes (set(RuntimeProcess)): set of all processes that where
             executed by the system
@@ -38,7 +41,7 @@ class RuntimeSystem:
             of processors to their schedulers
     """
 
-    def __init__(self, platform, env):
+    def __init__(self, platform, env, production=False):
         """Initialize a runtime system.
 
         Most importantly, this sets up all the schedulers in the system.
@@ -46,11 +49,13 @@ class RuntimeSystem:
         Args:
             platform (Platform): the platform to be simulated
             env: the simpy environment
+            production (bool): run the system in production mode
         """
         log.info("Initialize the system")
 
         self._env = env
         self.platform = platform
+        self.production = production
 
         self._processes = set()
 
@@ -7,7 +7,15 @@
 import simpy
 import pytest
 
+from mocasin.common.graph import DataflowChannel, DataflowGraph, DataflowProcess
 from mocasin.common.mapping import ChannelMappingInfo
+from mocasin.common.trace import (
+    ComputeSegment,
+    DataflowTrace,
+    ReadTokenSegment,
+    TraceLoop,
+    WriteTokenSegment,
+)
 from mocasin.platforms.odroid import DesignerPlatformOdroid
 from mocasin.platforms.platformDesigner import genericProcessor
 from mocasin.simulate.application import RuntimeApplication
@@ -28,6 +36,7 @@ def env():
 def system(env, mocker):
     m = mocker.Mock()
     m.env = env
+    m.production = False
     return m
 
 
@@ -132,3 +141,75 @@ def platform_power_partial_2_threads():
     )
     p = DesignerPlatformOdroid(pe_little, pe_big)
     return p
+
+
+@pytest.fixture
+def graph():
+    """A cyclic graph src -> {fwd, sink}, fwd -> sink, sink -> src."""
+    graph = DataflowGraph("fast")
+    processes = {}
+    for name in ["src", "fwd", "sink"]:
+        processes[name] = DataflowProcess(name)
+        graph.add_process(processes[name])
+    for name, source, sinks in [
+        ("c0", "src", ["fwd", "sink"]),
+        ("c1", "fwd", ["sink"]),
+        ("c2", "sink", ["src"]),
+    ]:
+        channel = DataflowChannel(name, 128)
+        processes[source].connect_to_outgoing_channel(channel)
+        for sink in sinks:
+            processes[sink].connect_to_incomming_channel(channel)
+        graph.add_channel(channel)
+    return graph
+
+
+class PipelineTrace(DataflowTrace):
+    """A trace of the graph provided by the `graph` fixture."""
+
+    def __init__(self, iterations):
+        self.iterations = iterations
+
+    def get_trace(self, process):
+        def compute(cycles):
+            return ComputeSegment(
+                {"proc_type_0": cycles, "proc_type_1": cycles // 2}
+            )
+
+        if process == "sink":
+            # initial tokens on the feedback channel
+            yield WriteTokenSegment("c2", 2)
+        for i in range(self.iterations):
+            if process == "src":
+                yield ReadTokenSegment("c2", 1)
+                yield compute(1000 + 100 * (i % 3))
+                yield WriteTokenSegment("c0", 1)
+            elif process == "fwd":
+                yield ReadTokenSegment("c0", 1)
+                yield compute(3000)
+                yield WriteTokenSegment("c1", 1)
+            elif process == "sink":
+                yield ReadTokenSegment("c0", 1)
+                yield ReadTokenSegment("c1", 1)
+                yield compute(500)
+                yield WriteTokenSegment("c2", 1)
+
+
+class PipelineLoopTrace(PipelineTrace):
+    """The same trace as PipelineTrace, compressed to a loop."""
+
+    def get_trace_loop(self, process):
+        segments = list(PipelineTrace(3).get_trace(process))
+        prologue = 1 if process == "sink" else 0
+        assert self.iterations % 3 == 0
+        return TraceLoop(
+            segments[:prologue], segments[prologue:], self.iterations // 3
+        )
+
+
+def simulation_result(simulation_class, platform, graph, mapping, trace, **kw):
+    """Run a simulation and return its result."""
+    simulation = simulation_class(platform, graph, mapping, trace, **kw)
+    with simulation:
+        simulation.run()
+    return simulation.result
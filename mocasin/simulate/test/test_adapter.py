@@ -0,0 +1,54 @@
+# Copyright (C) 2026 TU Dresden
+# Licensed under the ISC license (see LICENSE.txt)
+
+import logging
+
+from mocasin.mapper.random import RandomPartialMapper
+from mocasin.simulate import DataflowSimulation
+from mocasin.simulate.adapter import (
+    ProductionLoggerAdapter,
+    SimulateLoggerAdapter,
+    create_logger_adapter,
+)
+from mocasin.simulate.test.conftest import PipelineTrace, simulation_result
+
+
+def test_create_logger_adapter(env):
+    log = logging.getLogger(__name__)
+    adapter = create_logger_adapter(log, "test", env)
+    assert type(adapter) is SimulateLoggerAdapter
+    adapter = create_logger_adapter(log, "test", env, production=True)
+    assert isinstance(adapter, ProductionLoggerAdapter)
+
+
+def _runtime_debug_records(records):
+    # messages of the runtime objects are prefixed by the simulation time
+    return [
+        r for r in records if r.levelno == logging.DEBUG and r.msg[0] == "@"
+    ]
+
+
+def test_production_simulation(platform, graph, caplog):
+    mapping = RandomPartialMapper(platform, seed=3).generate_mapping(graph)
+    with caplog.at_level(logging.DEBUG, logger="mocasin.simulate"):
+        expected = simulation_result(
+            DataflowSimulation,
+            platform,
+            graph,
+            mapping,
+            PipelineTrace(5),
+            production=False,
+        )
+        assert _runtime_debug_records(caplog.records)
+        caplog.clear()
+
+        result = simulation_result(
+            DataflowSimulation,
+            platform,
+            graph,
+            mapping,
+            PipelineTrace(5),
+            production=True,
+        )
+        assert not _runtime_debug_records(caplog.records)
+    assert result == expected
@@ -254,7 +254,8 @@ class TestRuntimeChannel:
 
         # setup the primitive
         prim = Primitive("test_prim")
-        channel._primitive = prim
+        info = ChannelMappingInfo(primitive=prim, capacity=4)
+        channel.update_mapping_info(info)
 
         # sink1 processor not added yet -> should fail
         with pytest.raises(RuntimeError):
@@ -282,6 +283,8 @@ class TestRuntimeChannel:
             p.resources = []
             phases.append(p)
         prim.consume_phases[sink1.processor.name] = phases
+        # the channel looks up the phases only after a mapping update
+        channel.update_mapping_info(info)
 
         event = channel.tokens_consumed
         process = env.process(channel.consume(sink1, 2))
@@ -301,6 +304,7 @@ class TestRuntimeChannel:
                 r.simpy_resource = simpy.Resource(env)
                 resources.append(r)
                 p.resources.append(r)
+        channel.update_mapping_info(info)
 
         start = env.now
         event = channel.tokens_consumed
@@ -368,6 +372,8 @@ class TestRuntimeChannel:
             p.resources = []
             phases.append(p)
         prim.produce_phases[src.processor.name] = phases
+        # the channel looks up the phases only after a mapping update
+        channel.update_mapping_info(info)
 
         event = channel.tokens_produced
         process = env.process(channel.produce(src, 2))
@@ -388,6 +394,7 @@ class TestRuntimeChannel:
                 r.simpy_resource = simpy.Resource(env)
                 resources.append(r)
                 p.resources.append(r)
+        channel.update_mapping_info(info)
 
         start = env.now
         event = channel.tokens_produced
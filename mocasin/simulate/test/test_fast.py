@@ -0,0 +1,105 @@
+# Copyright (C) 2026 TU Dresden
+# Licensed under the ISC license (see LICENSE.txt)
+
+import logging
+
+import pytest
+
+from mocasin.common.test.trace_utils import segments_as_tuples
+from mocasin.mapper.random import RandomPartialMapper
+from mocasin.simulate import DataflowSimulation
+from mocasin.simulate.fast import FastDataflowSimulation, FastSimulationBatch
+from mocasin.simulate.test.conftest import (
+    PipelineLoopTrace,
+    PipelineTrace,
+    simulation_result,
+)
+
+
+@pytest.mark.parametrize("wait_for_initial_tokens", [False, True])
+def test_fast_simulation_matches_dataflow_simulation(
+    platform, graph, wait_for_initial_tokens
+):
+    trace = PipelineTrace(20)
+    mapper = RandomPartialMapper(platform, seed=42)
+    for _ in range(10):
+        mapping = mapper.generate_mapping(graph)
+        expected = simulation_result(
+            DataflowSimulation,
+            platform,
+            graph,
+            mapping,
+            trace,
+            wait_for_initial_tokens=wait_for_initial_tokens,
+        )
+        result = simulation_result(
+            FastDataflowSimulation,
+            platform,
+            graph,
+            mapping,
+            trace,
+            wait_for_initial_tokens=wait_for_initial_tokens,
+        )
+        assert result.exec_time == expected.exec_time
+        assert result.static_energy == pytest.approx(expected.static_energy)
+        assert result.dynamic_energy == pytest.approx(expected.dynamic_energy)
+
+
+def test_fast_simulation_runs_once(platform, graph):
+    mapping = RandomPartialMapper(platform, seed=1).generate_mapping(graph)
+    simulation = FastDataflowSimulation(
+        platform, graph, mapping, PipelineTrace(1)
+    )
+    with pytest.raises(RuntimeError):
+        simulation.run()
+    with simulation:
+        simulation.run()
+        with pytest.raises(RuntimeError):
+            simulation.run()
+
+
+def test_fast_simulation_batch(platform, graph):
+    trace = PipelineTrace(20)
+    mapper = RandomPartialMapper(platform, seed=7)
+    mappings = [mapper.generate_mapping(graph) for _ in range(10)]
+    batch = FastSimulationBatch(platform, graph, trace)
+    results = batch.simulate(mappings)
+    assert len(results) == len(mappings)
+    for mapping, result in zip(mappings, results):
+        expected = simulation_result(
+            DataflowSimulation, platform, graph, mapping, trace
+        )
+        assert result.exec_time == expected.exec_time
+        assert result.static_energy == pytest.approx(expected.static_energy)
+        assert result.dynamic_energy == pytest.approx(expected.dynamic_energy)
+
+
+def test_fast_simulation_fast_forward(platform, graph, caplog):
+    trace = PipelineLoopTrace(600)
+    for process in ["src", "fwd", "sink"]:
+        assert segments_as_tuples(
+            trace.get_trace_loop(process)
+        ) == segments_as_tuples(trace.get_trace(process))
+    mapper = RandomPartialMapper(platform, seed=3)
+    mappings = [mapper.generate_mapping(graph) for _ in range(10)]
+    expected = FastSimulationBatch(
+        platform, graph, trace, fast_forward=False
+    ).simulate(mappings)
+    with caplog.at_level(logging.DEBUG, logger="mocasin.simulate.fast"):
+        results = FastSimulationBatch(platform, graph, trace).simulate(mappings)
+    assert "steady state" in caplog.text
+    for result, reference in zip(results, expected):
+        assert result.exec_time == reference.exec_time
+        assert result.static_energy == pytest.approx(reference.static_energy)
+        assert result.dynamic_energy == pytest.approx(reference.dynamic_energy)
+
+    # the same results as the discrete-event simulation
+    trace = PipelineLoopTrace(30)
+    results = FastSimulationBatch(platform, graph, trace).simulate(mappings)
+    for mapping, result in zip(mappings, results):
+        expected = simulation_result(
+            DataflowSimulation, platform, graph, mapping, trace
+        )
+        assert result.exec_time == expected.exec_time
+        assert result.static_energy == pytest.approx(expected.static_energy)
+        assert result.dynamic_energy == pytest.approx(expected.dynamic_energy)
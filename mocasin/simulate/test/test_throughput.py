@@ -0,0 +1,105 @@
+# Copyright (C) 2026 TU Dresden
+# Licensed under the ISC license (see LICENSE.txt)
+
+import itertools
+
+import numpy as np
+import pytest
+
+from mocasin.mapper.random import RandomPartialMapper
+from mocasin.simulate.fast import FastSimulationBatch
+from mocasin.simulate.test.conftest import PipelineLoopTrace, PipelineTrace
+from mocasin.simulate.throughput import (
+    ThroughputAnalysis,
+    ThroughputSimulation,
+    max_cycle_mean,
+)
+
+
+def _max_cycle_mean(matrix):
+    """Enumerate all simple cycles of a small max-plus matrix."""
+    n = matrix.shape[0]
+    best = -np.inf
+    for length in range(1, n + 1):
+        for cycle in itertools.permutations(range(n), length):
+            if cycle[0] != min(cycle):
+                continue
+            weight = sum(
+                matrix[cycle[(i + 1) % length], cycle[i]] for i in range(length)
+            )
+            best = max(best, weight / length)
+    return best
+
+
+def test_max_cycle_mean():
+    inf = -np.inf
+    assert max_cycle_mean(np.empty((0, 0))) == -np.inf
+    # acyclic
+    assert max_cycle_mean(np.array([[inf, inf], [3.0, inf]])) == -np.inf
+    # a self loop and a cycle of length two
+    matrix = np.array([[2.0, 5.0], [1.0, inf]])
+    assert max_cycle_mean(matrix) == 3.0
+
+    rng = np.random.default_rng(42)
+    for _ in range(50):
+        n = rng.integers(1, 6)
+        matrix = rng.integers(0, 20, size=(n, n)).astype(float)
+        matrix[rng.random((n, n)) < 0.5] = -np.inf
+        assert max_cycle_mean(matrix) == pytest.approx(_max_cycle_mean(matrix))
+
+
+def test_throughput_analysis(platform, graph):
+    trace = PipelineLoopTrace(600)
+    mapper = RandomPartialMapper(platform, seed=3)
+    mappings = [mapper.generate_mapping(graph) for _ in range(10)]
+    analysis = ThroughputAnalysis(platform, graph, trace)
+    assert analysis.repetitions == 200
+    estimates = analysis.simulate(mappings)
+    simulated = FastSimulationBatch(platform, graph, trace).simulate(mappings)
+    for mapping, estimate, result in zip(mappings, estimates, simulated):
+        assert estimate.exec_time == pytest.approx(result.exec_time, rel=0.15)
+        # the execution time grows by the period with each iteration
+        period = analysis.iteration_period(mapping)
+        assert estimate.exec_time / analysis.repetitions == pytest.approx(
+            period, rel=0.01
+        )
+
+
+def test_throughput_analysis_energy(platform_power, graph):
+    trace = PipelineLoopTrace(30)
+    mapper = RandomPartialMapper(platform_power, seed=5)
+    mappings = [mapper.generate_mapping(graph) for _ in range(10)]
+    estimates = ThroughputAnalysis(platform_power, graph, trace).simulate(
+        mappings
+    )
+    simulated = FastSimulationBatch(platform_power, graph, trace).simulate(
+        mappings
+    )
+    for estimate, result in zip(estimates, simulated):
+        assert estimate.static_energy == pytest.approx(
+            result.static_energy, rel=0.15
+        )
+        assert estimate.dynamic_energy == pytest.approx(
+            result.dynamic_energy, rel=0.15
+        )
+
+
+def test_throughput_analysis_requires_loops(platform, graph):
+    with pytest.raises(RuntimeError):
+        ThroughputAnalysis(platform, graph, PipelineTrace(3))
+
+
+def test_throughput_simulation(platform, graph):
+    trace = PipelineLoopTrace(30)
+    mapping = RandomPartialMapper(platform, seed=1).generate_mapping(graph)
+    simulation = ThroughputSimulation(platform, graph, mapping, trace)
+    with pytest.raises(RuntimeError):
+        simulation.run()
+    with simulation:
+        simulation.run()
+        with pytest.raises(RuntimeError):
+            simulation.run()
+    expected = ThroughputAnalysis(platform, graph, trace).simulate_mapping(
+        mapping
+    )
+    assert simulation.result == expected
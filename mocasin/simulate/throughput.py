@@ -0,0 +1,663 @@
+# Copyright (C) 2026 TU Dresden
+# Licensed under the ISC license (see LICENSE.txt)
+
+"""A static throughput analysis of periodic dataflow applications.
+
+:class:`ThroughputAnalysis` estimates the execution time and the energy
+consumption of a mapping without simulating it. It requires that the traces of
+all processes are loops with the same number of iterations (see
+:meth:`~mocasin.common.trace.DataflowTrace.get_trace_loop`), where the
+prologue only places initial tokens. This is the case for SDF3 and TGFF
+applications. Each loop iteration is a sequence of firings, and each firing
+reads tokens, computes and writes tokens.
+
+The analysis builds a max-plus model of a few iterations of the whole
+application. The state of the model consists of the times at which the tokens
+and the free places stored in the channels between the iterations were
+produced, and the times at which the processors become available. The
+iterations are executed symbolically: a firing starts once its processor is
+available and all tokens it reads are produced, and it writes its tokens
+once the channels have enough free places. It takes the communication costs
+of its reads and writes (calculated from the communication primitives of the
+mapping) and the compute time on the processor it is mapped to. The firings
+mapped to the same processor are serialized in a static order, which is
+determined by a list schedule, and the scheduling and context switch
+overheads are added like in the simulation. This results in a max-plus
+matrix that maps the state before the iterations to the state after them.
+Several iterations are unrolled into one model, such that processes may run
+ahead of each other like in the simulation.
+
+Since every edge of the matrix spans the same number of iterations, the
+iteration period (the inverse of the throughput) follows from the maximum
+cycle ratio of the matrix graph, which equals its maximum cycle mean and is
+calculated with Karp's algorithm. The execution time is the time at which the
+last firing of the last iteration ends. It is obtained by iterating the
+max-plus model, where periods of the state are skipped like in the fast
+simulator. Hence, the costs of the analysis do not depend on the number of
+iterations.
+
+The model neglects contention on communication resources, preemption and the
+dynamic order of the firings. Its results are estimates. See
+``benchmarks/throughput.py`` for their accuracy compared to the simulation.
+"""
+
+from collections import deque
+import logging
+
+import hydra
+import numpy as np
+
+from mocasin.common.trace import SegmentType
+from mocasin.simulate import BaseSimulation, SimulationResult
+from mocasin.simulate.fast import _CostTable
+from mocasin.platforms.snapshot import instantiate_platform
+
+log = logging.getLogger(__name__)
+
+
+class _SparseMatrix:
+    """A max-plus matrix stored as a list of its finite entries.
+
+    The entries are sorted by row, such that the max-plus product with a
+    vector is a single :func:`numpy.maximum.reduceat`.
+    """
+
+    def __init__(self, matrix):
+        self.size = matrix.shape[0]
+        rows, cols = np.nonzero(np.isfinite(matrix))
+        self.cols = cols
+        self.weights = matrix[rows, cols]
+        self.rows, self.starts = np.unique(rows, return_index=True)
+
+    def product(self, vector):
+        """Calculate the max-plus product of the matrix and a vector."""
+        result = np.full(self.size, -np.inf)
+        if len(self.cols):
+            result[self.rows] = np.maximum.reduceat(
+                self.weights + vector[self.cols], self.starts
+            )
+        return result
+
+
+def max_cycle_mean(matrix):
+    """Calculate the maximum cycle mean of a max-plus matrix.
+
+    Uses Karp's algorithm. The walks may start at any node, which corresponds
+    to a super source with edges of weight zero to all nodes.
+
+    Args:
+        matrix (numpy.ndarray): an (n, n) array, where ``matrix[i, j]`` is the
+            weight of the edge from node j to node i, or ``-inf`` if there is
+            no such edge
+
+    Returns:
+        float: the maximum cycle mean, or ``-inf`` if the graph is acyclic
+    """
+    n = matrix.shape[0]
+    if n == 0:
+        return -np.inf
+    sparse = _SparseMatrix(matrix)
+    # walks[k, v]: the maximum weight of a walk with k edges ending in v
+    walks = np.empty((n + 1, n))
+    walks[0] = 0
+    for k in range(n):
+        walks[k + 1] = sparse.product(walks[k])
+    last = walks[n]
+    with np.errstate(invalid="ignore"):
+        means = (last[np.newaxis, :] - walks[:n]) / (
+            n - np.arange(n)[:, np.newaxis]
+        )
+    means[np.isnan(means) | ~np.isfinite(walks[:n])] = np.inf
+    means = np.min(means, axis=0)[np.isfinite(last)]
+    return float(np.max(means)) if len(means) else -np.inf
+
+
+class _Firing:
+    """The segments of a single firing of a process."""
+
+    __slots__ = ("reads", "processor_cycles", "writes")
+
+    def __init__(self):
+        self.reads = []
+        self.processor_cycles = None
+        self.writes = []
+
+
+def _parse_firings(process, body):
+    """Split the loop body of a process into firings."""
+    firings = []
+    firing = None
+    for s in body:
+        segment_type = s.segment_type
+        if firing is None or (
+            segment_type != SegmentType.WRITE_TOKEN
+            and (firing.writes or firing.processor_cycles is not None)
+        ):
+            firing = _Firing()
+            firings.append(firing)
+        if segment_type == SegmentType.READ_TOKEN:
+            firing.reads.append((s.channel, s.num_tokens))
+        elif segment_type == SegmentType.COMPUTE:
+            firing.processor_cycles = s.processor_cycles
+        elif segment_type == SegmentType.WRITE_TOKEN:
+            firing.writes.append((s.channel, s.num_tokens))
+        else:
+            raise RuntimeError(
+                f"Encountered an unknown segment type in the trace of "
+                f"{process}! ({segment_type})"
+            )
+    return firings
+
+
+class ThroughputAnalysis:
+    """Static throughput analysis of many mappings of a dataflow application
+
+    The traces are read only once and shared by the analysis of all mappings,
+    like in :class:`~mocasin.simulate.fast.FastSimulationBatch`. The costs of
+    all communication operations are cached and reused as well. See the
+    module documentation for the model.
+
+    Args:
+        platform (Platform): the platform
+        graph (DataflowGraph): the dataflow application
+        app_trace (DataflowTrace): a trace for the given ``graph``
+        unroll (int): The number of iterations modeled at once. Within the
+            unrolled iterations, processes may run ahead of each other like
+            in the simulation, which avoids the overheads of switching
+            between processes after every iteration.
+
+    Raises:
+        RuntimeError: if the traces are not loops with the same number of
+            iterations, or if the prologue of a trace does not only write
+            initial tokens
+    """
+
+    def __init__(self, platform, graph, app_trace, unroll=16):
+        self.platform = platform
+        self.graph = graph
+        self.costs = _CostTable()
+        self._firings = {}
+        # the number of initial tokens in each channel
+        self._initial_tokens = {}
+        repetitions = set()
+        for process in graph.processes():
+            loop = app_trace.get_trace_loop(process.name)
+            if not loop.body:
+                raise RuntimeError(
+                    f"The trace of {process.name} is not a loop. The "
+                    "throughput analysis requires periodic traces."
+                )
+            for s in loop.prologue:
+                if s.segment_type != SegmentType.WRITE_TOKEN:
+                    raise RuntimeError(
+                        f"The prologue of the trace of {process.name} may "
+                        "only write initial tokens"
+                    )
+                self._initial_tokens[s.channel] = (
+                    self._initial_tokens.get(s.channel, 0) + s.num_tokens
+                )
+            repetitions.add(loop.repetitions)
+            self._firings[process.name] = _parse_firings(
+                process.name, loop.body
+            )
+        if len(repetitions) > 1:
+            raise RuntimeError(
+                "The traces of all processes must repeat equally often"
+            )
+        self.repetitions = repetitions.pop() if repetitions else 0
+        self.unroll = max(1, min(unroll, self.repetitions))
+        # the number of firings of each process in one iteration
+        self._iteration_firings = {}
+        for name, firings in self._firings.items():
+            self._iteration_firings[name] = len(firings)
+            self._firings[name] = firings * self.unroll
+
+        self._channels = {c.name: c for c in graph.channels()}
+        # the processes whose firings may start earlier or later after a
+        # firing of each process, apart from those on the same processor
+        self._neighbours = {}
+        for process in graph.processes():
+            neighbours = {process.name}
+            for channel in process.incoming_channels:
+                neighbours.add(channel.source.name)
+            for channel in process.outgoing_channels:
+                neighbours.update(p.name for p in channel.sinks)
+            self._neighbours[process.name] = neighbours
+        self._policies = {}
+        for sched in platform.schedulers():
+            for proc in sched.processors:
+                self._policies[proc] = sched.policy
+
+    def _communication_ticks(self, mapping, processor, name, num, produce):
+        channel = self._channels[name]
+        phases = self.costs.phases(
+            mapping.channel_info(channel).primitive,
+            processor,
+            produce,
+            num * channel.token_size,
+        )
+        return sum(costs for _, costs in phases)
+
+    def _firing_ticks(self, mapping):
+        """Calculate the durations of all firings of each process.
+
+        Returns:
+            dict: a tuple of the processor and a list of the durations of all
+                firings of each process. The duration of a firing is a tuple
+                of the ticks needed for reading, computing and writing.
+        """
+        durations = {}
+        for process in self.graph.processes():
+            processor = mapping.process_info(process).affinity
+            ticks = []
+            num_firings = self._iteration_firings[process.name]
+            for firing in self._firings[process.name][:num_firings]:
+                read = sum(
+                    self._communication_ticks(mapping, processor, c, n, False)
+                    for c, n in firing.reads
+                )
+                compute = 0
+                if firing.processor_cycles is not None:
+                    cycles = firing.processor_cycles[processor.type]
+                    compute = processor.ticks(cycles)
+                write = sum(
+                    self._communication_ticks(mapping, processor, c, n, True)
+                    for c, n in firing.writes
+                )
+                ticks.append((read, compute, write))
+            durations[process.name] = (processor, ticks * self.unroll)
+        return durations
+
+    def _execute(self, mapping, durations, order=None, current=None):
+        """Execute the unrolled iterations of the application symbolically.
+
+        The times of all events are vectors, such that the time of an event is
+        the max-plus product of the vector and the state at the beginning of
+        the iterations. The state consists of the times the initial tokens and
+        the free places of each channel were produced, and the times the
+        processors become available.
+
+        A firing starts once the processor is available and all tokens it
+        reads are produced. The scheduling and the context switch overheads
+        are only added if the process has to wait for tokens, or if another
+        process ran on the processor before. The firing writes its tokens
+        once there are enough free places in the channels. Its reads free
+        places in the channels it reads from.
+
+        If `order` is None, the firings are list-scheduled by their earliest
+        start time, assuming that all state variables are zero, and only the
+        order is calculated. Otherwise, the firings are executed in the given
+        order.
+
+        Args:
+            mapping (Mapping): a mapping of the graph to the platform
+            durations (dict): the result of :meth:`_firing_ticks`
+            order (list of str, optional): the processes of the firings in
+                the order of their execution
+            current (dict, optional): the process whose context is loaded on
+                each processor at the beginning of the iteration
+
+        Returns:
+            tuple: the order of the firings, the process whose context is
+                loaded on each processor at the end of the iteration, the
+                (n, n) max-plus matrix of the iterations, the end times of
+                the first i iterations relative to the state (an array of
+                shape (unroll, n)) and the busy ticks of each processor
+        """
+        processes = [p.name for p in self.graph.processes()]
+        processors = list(dict.fromkeys(p for p, _ in durations.values()))
+
+        # the numbers of state variables of the tokens and the free places in
+        # the queue of each channel and sink, and of the processors
+        tokens = {}
+        places = {}
+        for process in self.graph.processes():
+            for channel in process.incoming_channels:
+                count = self._initial_tokens.get(channel.name, 0)
+                capacity = mapping.channel_info(channel).capacity
+                tokens[channel.name, process.name] = count
+                places[channel.name, process.name] = max(capacity - count, 0)
+        num_vars = sum(tokens.values()) + sum(places.values()) + len(processors)
+
+        # The list schedule only needs the times for a zero state, which are
+        # scalars. Otherwise, the times are vectors.
+        symbolic = order is not None
+        if symbolic:
+            maximum = np.maximum
+            never = np.full(num_vars, -np.inf)
+            variables = iter(range(num_vars))
+
+            def initial(count):
+                queue = deque()
+                for _ in range(count):
+                    vector = never.copy()
+                    vector[next(variables)] = 0
+                    queue.append(vector)
+                return queue
+
+        else:
+            maximum = max
+            never = -np.inf
+
+            def initial(count):
+                return deque([0.0] * count)
+
+        tokens = {key: initial(count) for key, count in tokens.items()}
+        places = {key: initial(count) for key, count in places.items()}
+        available = {p: initial(1)[0] for p in processors}
+        overheads = {}
+        for p in processors:
+            scheduling = p.ticks(self._policies[p].scheduling_cycles)
+            switch = p.context_load_ticks() + p.context_store_ticks()
+            overheads[p] = (scheduling, switch)
+
+        current = dict(current or {})
+        next_firing = dict.fromkeys(processes, 0)
+        busy = dict.fromkeys(processors, 0)
+        lasts = [never] * self.unroll
+        executed = []
+        # the start times of the next firings for the list schedule
+        estimates = {}
+        colocated = {}
+        for name, (processor, _) in durations.items():
+            colocated.setdefault(processor, set()).add(name)
+
+        def latest(time, queue, num):
+            for i in range(num):
+                time = maximum(time, queue[i])
+            return time
+
+        def start_time(name):
+            processor, ticks = durations[name]
+            index = next_firing[name]
+            if index == len(ticks):
+                return None
+            firing = self._firings[name][index]
+            for c, num in firing.reads:
+                if len(tokens[c, name]) < num:
+                    return None
+            for c, num in firing.writes:
+                for sink in self._channels[c].sinks:
+                    if len(places[c, sink.name]) < num:
+                        return None
+            scheduling, switch = overheads[processor]
+            start = available[processor]
+            if current.get(processor) != name:
+                start = start + scheduling
+                if processor in current:
+                    start = start + switch
+            if firing.reads:
+                woken = never
+                for c, num in firing.reads:
+                    woken = latest(woken, tokens[c, name], num)
+                start = maximum(start, woken + scheduling)
+            return start
+
+        num_firings = sum(len(t) for _, t in durations.values())
+        for i in range(num_firings):
+            if symbolic:
+                name = order[i]
+                start = start_time(name)
+            else:
+                name = start = None
+                for candidate in processes:
+                    if candidate not in estimates:
+                        estimates[candidate] = start_time(candidate)
+                    s = estimates[candidate]
+                    if s is not None and (start is None or s < start):
+                        name, start = candidate, s
+            if start is None:
+                raise RuntimeError(
+                    "The application deadlocks in the throughput analysis"
+                )
+
+            processor, ticks = durations[name]
+            index = next_firing[name]
+            firing = self._firings[name][index]
+            read, compute, write = ticks[index]
+            end = start + read
+            for c, num in firing.reads:
+                queue = tokens[c, name]
+                for _ in range(num):
+                    queue.popleft()
+                places[c, name].extend([end] * num)
+            end = end + compute
+            if firing.writes:
+                woken = never
+                for c, num in firing.writes:
+                    for sink in self._channels[c].sinks:
+                        queue = places[c, sink.name]
+                        woken = latest(woken, queue, num)
+                        for _ in range(num):
+                            queue.popleft()
+                end = maximum(end, woken + overheads[processor][0]) + write
+                for c, num in firing.writes:
+                    for sink in self._channels[c].sinks:
+                        tokens[c, sink.name].extend([end] * num)
+            available[processor] = end
+            current[processor] = name
+            busy[processor] += read + compute + write
+            iteration = index // self._iteration_firings[name]
+            lasts[iteration] = maximum(lasts[iteration], end)
+            next_firing[name] += 1
+            executed.append(name)
+            for affected in (self._neighbours[name], colocated[processor]):
+                for n in affected:
+                    estimates.pop(n, None)
+
+        if not symbolic:
+            return executed, current, None, None, busy
+
+        # In a consistent application, the queues contain as many tokens and
+        # free places as in the beginning. Their times form the next state.
+        rows = [v for queue in tokens.values() for v in queue]
+        rows.extend(v for queue in places.values() for v in queue)
+        rows.extend(available[p] for p in processors)
+        if len(rows) != num_vars:
+            raise RuntimeError(
+                "The application is inconsistent. One iteration does not "
+                "restore the initial tokens."
+            )
+        lasts = np.maximum.accumulate(np.array(lasts), axis=0)
+        return executed, current, np.array(rows), lasts, busy
+
+    def model(self, mapping):
+        """Build the max-plus model of a mapping.
+
+        The static order of the firings on each processor is determined by a
+        list schedule of the first unrolled iterations. Context switches
+        between the last firing of the unrolled iterations and the first
+        firing of the next ones are taken into account.
+
+        Args:
+            mapping (Mapping): a mapping of the graph to the platform
+
+        Returns:
+            tuple: the (n, n) max-plus matrix of the unrolled iterations, the
+                end times of the first i iterations relative to the state (an
+                array of shape (unroll, n)), and the busy ticks of each
+                processor in the unrolled iterations
+        """
+        durations = self._firing_ticks(mapping)
+        order, current, _, _, _ = self._execute(mapping, durations)
+        _, _, matrix, lasts, busy = self._execute(
+            mapping, durations, order, current
+        )
+        return matrix, lasts, busy
+
+    def iteration_period(self, mapping):
+        """Calculate the iteration period of a mapping.
+
+        Args:
+            mapping (Mapping): a mapping of the graph to the platform
+
+        Returns:
+            float: the time in ticks between two iterations in the steady
+                state, i.e., the inverse of the throughput
+        """
+        matrix, _, _ = self.model(mapping)
+        return max_cycle_mean(matrix) / self.unroll
+
+    def _makespan(self, matrix, lasts):
+        """Calculate the end time of the last iteration.
+
+        Iterates the model, and skips whole periods once the state relative
+        to its maximum repeats.
+        """
+        if self.repetitions == 0:
+            return 0
+        steps, remainder = divmod(self.repetitions, self.unroll)
+        if remainder == 0:
+            steps -= 1
+        matrix = _SparseMatrix(matrix)
+        state = np.zeros(matrix.size)
+        seen = {}
+        k = 0
+        while k < steps:
+            offset = state.max()
+            key = (state - offset).tobytes()
+            previous = seen.get(key)
+            if previous is None:
+                seen[key] = (k, offset)
+            else:
+                period = k - previous[0]
+                skipped = (steps - k) // period
+                state = state + skipped * (offset - previous[1])
+                k += skipped * period
+                seen.clear()
+                if k == steps:
+                    break
+            state = matrix.product(state)
+            k += 1
+        return float(np.max(lasts[remainder - 1] + state))
+
+    def simulate_mapping(self, mapping):
+        """Estimate the execution time and energy of a single mapping.
+
+        Args:
+            mapping (Mapping): a mapping of the graph to the platform
+
+        Returns:
+            SimulationResult: the estimated result
+        """
+        matrix, lasts, busy = self.model(mapping)
+        exec_time = int(round(self._makespan(matrix, lasts)))
+        result = SimulationResult(
+            exec_time=exec_time, static_energy=None, dynamic_energy=None
+        )
+        if self.platform.has_power_model():
+            static_energy = 0
+            dynamic_energy = 0
+            for processor in self.platform.processors():
+                if processor.static_power() is not None:
+                    static_energy += processor.static_power() * exec_time
+                if processor.dynamic_power() is not None and processor in busy:
+                    dynamic_energy += (
+                        processor.dynamic_power()
+                        * busy[processor]
+                        * self.repetitions
+                        / self.unroll
+                    )
+            if self.platform.peripheral_static_power:
+                static_energy += (
+                    self.platform.peripheral_static_power * exec_time
+                )
+            result.static_energy = static_energy
+            result.dynamic_energy = dynamic_energy
+        return result
+
+    def simulate(self, mappings):
+        """Estimate the results of multiple mappings.
+
+        Args:
+            mappings (list of Mapping): mappings of the graph to the platform
+
+        Returns:
+            list of SimulationResult: the estimated results in the same order
+                as ``mappings``
+        """
+        return [self.simulate_mapping(m) for m in mappings]
+
+
+class ThroughputSimulation(BaseSimulation):
+    """Simulation-free evaluation of a single dataflow application
+
+    This class can be used as a replacement for
+    :class:`~mocasin.simulate.DataflowSimulation`, which estimates the result
+    with :class:`ThroughputAnalysis` instead of simulating the application.
+    Like in :class:`~mocasin.simulate.fast.FastDataflowSimulation`, ``env``
+    and ``system`` are always ``None``.
+
+    Args:
+        platform (Platform): the platform
+        graph (DataflowGraph): the dataflow application
+        mapping (Mapping): a mapping of the ``graph`` to the ``platform``
+        app_trace (DataflowTrace): a trace for the given ``graph``
+        wait_for_initial_tokens (bool): Accepted for compatibility with
+            :class:`~mocasin.simulate.DataflowSimulation`. In the model,
+            processes always wait for the tokens they read.
+        production (bool): Accepted for compatibility with
+            :class:`~mocasin.simulate.DataflowSimulation`.
+    """
+
+    def __init__(
+        self,
+        platform,
+        graph,
+        mapping,
+        app_trace,
+        wait_for_initial_tokens=False,
+        production=False,
+    ):
+        super().__init__(platform, production)
+        self.graph = graph
+        self.mapping = mapping
+        self.app_trace = app_trace
+
+    def __enter__(self):
+        """Setup the analysis
+
+        Unlike :meth:`BaseSimulation.__enter__`, this does not create a simpy
+        environment or a runtime system.
+        """
+        self.run = self._run
+        return self
+
+    def __exit__(self, type, value, traceback):
+        """Finalize the analysis"""
+        self.run = self._default_run
+
+    def _run(self):
+        """Run the analysis.
+
+        May only be called once. Updates the :attr:`result` attribute.
+        """
+        if self.result is not None:
+            raise RuntimeError("A ThroughputSimulation may only be run once!")
+
+        analysis = ThroughputAnalysis(self.platform, self.graph, self.app_trace)
+        self.result = analysis.simulate_mapping(self.mapping)
+
+    @staticmethod
+    def from_hydra(cfg, wait_for_initial_tokens):
+        """Factory method.
+
+        Instantiates :class:`ThroughputSimulation` from a hydra configuration
+        object.
+
+        Args:
+            cfg: a hydra configuration object
+        """
+        platform = instantiate_platform(cfg)
+        trace = hydra.utils.instantiate(cfg["trace"])
+        graph = hydra.utils.instantiate(cfg["graph"])
+        rep = hydra.utils.instantiate(cfg["representation"], graph, platform)
+        mapper = hydra.utils.instantiate(cfg["mapper"], platform)
+        mapping = mapper.generate_mapping(
+            graph, trace=trace, representation=rep
+        )
+        simulation = ThroughputSimulation(
+            platform, graph, mapping, trace, wait_for_initial_tokens
+        )
+
+        return simulation
@@ -7,6 +7,7 @@ import hydra
 import logging
 from mocasin.common.graph import DataflowGraph
 import os
+from mocasin.platforms.snapshot import instantiate_platform
 
 log = logging.getLogger(__name__)
 
@@ -29,7 +30,7 @@ def calculate_platform_embedding(cfg):
         This can be either MetricSpaceEmbedding or SymmetryEmbedding.
 
     """
-    platform = hydra.utils.instantiate(cfg["platform"])
+    platform = instantiate_platform(cfg)
     json_file = cfg["platform"]["embedding_json"]
     if json_file is not None and os.path.exists(json_file):
         log.info("JSON file already found. Removing and recalculating")
@@ -3,10 +3,10 @@
 #
 # Authors: Christian Menard, Andres Goens
 
-import hydra
 import logging
 import pynauty
 import mocasin.representations.automorphisms as aut
+from mocasin.platforms.snapshot import instantiate_platform
 
 log = logging.getLogger(__name__)
 try:
@@ -29,7 +29,7 @@ def calculate_platform_symmetries(cfg):
         * **mpsym:** a boolean value selecting mpsym as backend (and JSON as output)
         Otherwise it outputs plaintext from the python implementation.
     """
-    platform = hydra.utils.instantiate(cfg["platform"])
+    platform = instantiate_platform(cfg)
     log.info("start converting platform to edge graph for automorphisms.")
     plat_graph = platform.to_adjacency_dict(include_proc_type_labels=True)
     use_mpsym = cfg["mpsym"]
@@ -6,13 +6,14 @@
 import logging
 
 import hydra
+from mocasin.platforms.snapshot import instantiate_platform
 
 log = logging.getLogger(__name__)
 
 
 def enumerate_equivalent(cfg):
     graph = hydra.utils.instantiate(cfg["graph"])
-    platform = hydra.utils.instantiate(cfg["platform"])
+    platform = instantiate_platform(cfg)
     trace = hydra.utils.instantiate(cfg["trace"])
     if (
         cfg["representation"]._target_
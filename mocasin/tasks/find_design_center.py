@@ -15,6 +15,7 @@ import sys
 
 from mocasin.design_centering import sample as dc_sample
 from mocasin.design_centering import util as dc_util
+from mocasin.platforms.snapshot import instantiate_platform
 
 log = logging.getLogger(__name__)
 
@@ -32,7 +33,7 @@ def dc_task(cfg):
 
     threshold = cfg["threshold"]
     graph = hydra.utils.instantiate(cfg["graph"])
-    platform = hydra.utils.instantiate(cfg["platform"])
+    platform = instantiate_platform(cfg)
     trace = hydra.utils.instantiate(cfg["trace"])
     representation = hydra.utils.instantiate(
         cfg["representation"], graph, platform
@@ -170,8 +171,10 @@ def dc_task(cfg):
         ):
             tp.plot_perturbations(pert_res, cfg["perturbations_out"])
 
+        pm.close()
         log.info("==== Perturbation Test done ====")
 
+    oracle.close()
     log.info(f"total simulations from cache: {oracle.total_cached}")
     if not os.path.exists(cfg["out_dir"]):
         os.mkdir(cfg["out_dir"])
@@ -11,6 +11,7 @@ import hydra
 
 from mocasin.maps.mapping import export_maps_mapping
 from mocasin.simulate import DataflowSimulation
+from mocasin.platforms.snapshot import instantiate_platform
 
 log = logging.getLogger(__name__)
 
@@ -46,7 +47,7 @@ def generate_mapping(cfg):
     It is recommended to use the silent all logginf o (``-s``) to suppress all
     logging output from the individual simulations.
     """
-    platform = hydra.utils.instantiate(cfg["platform"])
+    platform = instantiate_platform(cfg)
     trace = hydra.utils.instantiate(cfg["trace"])
     graph = hydra.utils.instantiate(cfg["graph"])
     representation = hydra.utils.instantiate(
@@ -9,6 +9,7 @@ from pathlib import Path
 import hydra
 
 from mocasin.util.mapping_table import MappingTableWriter
+from mocasin.platforms.snapshot import instantiate_platform
 
 log = logging.getLogger(__name__)
 
@@ -42,7 +43,7 @@ def pareto_front(cfg):
         * **mapping_table:** the output path for the mapping table.
     """
     graph = hydra.utils.instantiate(cfg["graph"])
-    platform = hydra.utils.instantiate(cfg["platform"])
+    platform = instantiate_platform(cfg)
     trace = hydra.utils.instantiate(cfg["trace"])
     representation = hydra.utils.instantiate(
         cfg["representation"], graph, platform
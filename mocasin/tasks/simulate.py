@@ -44,6 +44,18 @@ def simulate(cfg):
     simulation = hydra.utils.instantiate(cfg.simulation_type, cfg)
 
     with simulation:
+        # not all simulation types provide a runtime system that can be traced
+        if (
+            trace_cfg is not None
+            and trace_cfg["file"] is not None
+            and simulation.system is None
+        ):
+            log.warning(
+                "The selected simulation type does not support recording a "
+                "simulation trace"
+            )
+            trace_cfg = None
+
         if trace_cfg is not None and trace_cfg["file"] is not None:
             simulation.system.app_trace_enabled = trace_cfg["app"]
             simulation.system.platform_trace_enabled = trace_cfg["platform"]
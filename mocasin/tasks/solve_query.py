@@ -7,6 +7,7 @@ import hydra
 
 from mocasin.util.logging import getLogger
 from mocasin.ontologies.solver import Solver
+from mocasin.platforms.snapshot import instantiate_platform
 
 logger = getLogger(__name__)
 
@@ -16,7 +17,7 @@ def solve_query(cfg):
     # find a way to hand in a set of mappings on which equal_operations can be applied
 
     graph = hydra.utils.instantiate(cfg["graph"])
-    platform = hydra.utils.instantiate(cfg["platform"])
+    platform = instantiate_platform(cfg)
     query = cfg["query"]
     vector = cfg["vector"]
     if (
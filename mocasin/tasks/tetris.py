@@ -38,6 +38,13 @@ def tetris_scheduler(cfg):
           info
         * **job_table:** the job table
         * **output_schedule:** the output file with the generated schedule
+        * **precalc_orbits:** whether all orbits are calculated before the
+          scheduling
+        * **precalc_orbits_jobs:** the number of processes calculating the
+          orbits in advance
+        * **orbit_cache:** the directory of the on-disk orbit store (disabled if
+          null)
+        * **orbit_cache_size:** the maximal number of orbits kept in memory
     """
     # Suppress logs from mocasin module
     init_logging()
@@ -46,7 +53,7 @@ def tetris_scheduler(cfg):
     if cfg["precalc_orbits"]:
         log.info("Start precalculation of all orbits")
         start = timeit.default_timer()
-        scheduling.precalculate_orbits()
+        scheduling.precalculate_orbits(jobs=cfg["precalc_orbits_jobs"])
         stop = timeit.default_timer()
         log.info("Precalculation done")
         precalc_time = stop - start
@@ -56,6 +63,7 @@ def tetris_scheduler(cfg):
     scheduling.run()
     stop = timeit.default_timer()
     log.info("Scheduling done")
+    scheduling.scheduler.orbit_lookup_manager.close()
     scheduling_time = stop - start
 
     print("Job table file: " + str(cfg["job_table"]))
@@ -97,6 +105,9 @@ def tetris_manager(cfg):
         * **stats_jobs:** the output file for job statistics
         * **stats_manager:** the output file for manager statistics
         * **summary:** the output file for the summary results
+        * **orbit_cache:** the directory of the on-disk orbit store (disabled if
+          null)
+        * **orbit_cache_size:** the maximal number of orbits kept in memory
     """
     # Suppress logs from mocasin module
     init_logging()
@@ -108,6 +119,7 @@ def tetris_manager(cfg):
     management.run()
     stop = timeit.default_timer()
     log.info("Tetris management done")
+    management.manager.scheduler.orbit_lookup_manager.close()
 
     stats = management.stats
     summary = management.summary
@@ -4,6 +4,7 @@
 # Authors: Christian Menard
 
 import hydra
+from mocasin.platforms.snapshot import instantiate_platform
 
 
 def graph_to_dot(cfg):
@@ -40,7 +41,7 @@ def platform_to_dot(cfg):
           :class:`~mocasin.common.platform.Platform` object.
         * **dot:** the output file
     """
-    platform = hydra.utils.instantiate(cfg["platform"])
+    platform = instantiate_platform(cfg)
     platform.to_pydot().write_raw(cfg["output_file"])
 
 
@@ -63,7 +64,7 @@ def mapping_to_dot(cfg):
         * **dot:** the output file
     """
     graph = hydra.utils.instantiate(cfg["graph"])
-    platform = hydra.utils.instantiate(cfg["platform"])
+    platform = instantiate_platform(cfg)
     trace = hydra.utils.instantiate(cfg["trace"])
     representation = hydra.utils.instantiate(
         cfg["representation"], graph, platform
@@ -7,11 +7,12 @@ import hydra
 import tkinter as tk
 
 from mocasin.gui.drawAPI import drawAPI
+from mocasin.platforms.snapshot import instantiate_platform
 
 
 def visualize(cfg):
     graph = hydra.utils.instantiate(cfg["graph"])
-    platform = hydra.utils.instantiate(cfg["platform"])
+    platform = instantiate_platform(cfg)
     trace = hydra.utils.instantiate(cfg["trace"])
     representation = hydra.utils.instantiate(
         cfg["representation"], graph, platform
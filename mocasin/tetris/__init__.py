@@ -5,6 +5,7 @@
 
 from mocasin.tetris.job_state import Job
 from mocasin.tetris.manager import ResourceManager
+from mocasin.tetris.orbit_lookup import OrbitLookupManager
 from mocasin.tetris.tracer import TracePlayer
 from mocasin.tetris.tetris_reader import read_applications, read_requests
 
@@ -15,6 +16,7 @@ import logging
 import sys
 
 from hydra.utils import to_absolute_path
+from mocasin.platforms.snapshot import instantiate_platform
 
 log = logging.getLogger(__name__)
 
@@ -81,7 +83,7 @@ class TetrisScheduling:
                 log.error("{}".format(s.to_str()))
             sys.exit(1)
 
-    def precalculate_orbits(self):
+    def precalculate_orbits(self, jobs=1):
         """Precalculate all orbits before running the scheduler.
 
         The calculation of the mapping orbit is implemented in strict way, which
@@ -90,14 +92,19 @@ class TetrisScheduling:
         we estimate the scalability of the algorithm by pre-calculation of the
         orbits and excluding the precalculation time from the overall scheduling
         time.
+
+        Args:
+            jobs (int): the number of processes calculating the orbits
         """
         orbit_manager = self.scheduler.orbit_lookup_manager
-        for job in self.jobs:
-            mappings = job.request.mappings
-            for mapping in mappings:
-                entry = orbit_manager.get_orbit_entry(job.app, mapping)
-                gen = entry.get_generator()
-                list(gen)
+        orbit_manager.precalculate(
+            [
+                (job.app, mapping)
+                for job in self.jobs
+                for mapping in job.request.mappings
+            ],
+            jobs=jobs,
+        )
 
     def run(self):
         self.schedule = self.scheduler.schedule(
@@ -116,7 +123,7 @@ class TetrisScheduling:
             cfg: a hydra configuration object
         """
         # Set the platform
-        platform = hydra.utils.instantiate(cfg["platform"])
+        platform = instantiate_platform(cfg)
 
         # Read applications and mappings
         base_apps_dir = to_absolute_path(cfg["tetris_apps_dir"])
@@ -126,7 +133,16 @@ class TetrisScheduling:
         reqs = read_requests(to_absolute_path(cfg["job_table"]), apps)
 
         # Initialize tetris scheduler
-        scheduler = hydra.utils.instantiate(cfg["resource_manager"], platform)
+        orbit_lookup_manager = OrbitLookupManager(
+            platform,
+            cache_size=cfg["orbit_cache_size"],
+            cache_dir=cfg["orbit_cache"],
+        )
+        scheduler = hydra.utils.instantiate(
+            cfg["resource_manager"],
+            platform,
+            orbit_lookup_manager=orbit_lookup_manager,
+        )
 
         scheduling = TetrisScheduling(scheduler, reqs)
         return scheduling
@@ -236,7 +252,7 @@ class TetrisManagement:
             cfg: a hydra configuration object
         """
         # Set the platform
-        platform = hydra.utils.instantiate(cfg["platform"])
+        platform = instantiate_platform(cfg)
 
         # Read applications and mappings
         base_apps_dir = to_absolute_path(cfg["tetris_apps_dir"])
@@ -247,7 +263,16 @@ class TetrisManagement:
         reqs = read_requests(to_absolute_path(trace_filename), apps)
 
         # Initialize tetris scheduler
-        scheduler = hydra.utils.instantiate(cfg["resource_manager"], platform)
+        orbit_lookup_manager = OrbitLookupManager(
+            platform,
+            cache_size=cfg["orbit_cache_size"],
+            cache_dir=cfg["orbit_cache"],
+        )
+        scheduler = hydra.utils.instantiate(
+            cfg["resource_manager"],
+            platform,
+            orbit_lookup_manager=orbit_lookup_manager,
+        )
 
         # TODO: add a flag to the config: "schedule_iteratively"
         manager = ResourceManager(platform, scheduler)
@@ -3,11 +3,164 @@
 #
 # Authors: Robert Khasanov
 
-from mocasin.representations import SymmetryRepresentation
-
+from copy import copy
+import dbm
+import functools
+import hashlib
 from itertools import count
+import logging
+import multiprocessing as mp
+import os
+import shelve
 from threading import Lock
 
+from hydra.utils import to_absolute_path
+import numpy as np
+
+from mocasin.representations import SymmetryRepresentation
+from mocasin.util.lru import LRUCache
+
+log = logging.getLogger(__name__)
+
+
+def fingerprint_platform(platform):
+    """Compute a hash identifying the symmetries of a platform.
+
+    The hash covers the name of the platform, its processors and the
+    communication costs between them, from which the symmetries are derived.
+
+    Args:
+        platform (Platform): a platform
+
+    Returns:
+        str: a hex digest
+    """
+    h = hashlib.sha256()
+    h.update(platform.name.encode())
+    for p in platform.processors():
+        h.update(f"{p.name}:{p.type};".encode())
+    adjacency = platform.to_adjacency_dict()
+    h.update(repr(sorted(adjacency.items())).encode())
+    return h.hexdigest()
+
+
+def _compact_orbit(orbit, num_processors):
+    """Convert an orbit to a two-dimensional array of the smallest int type."""
+    dtype = np.min_scalar_type(max(num_processors - 1, 0))
+    return np.array(list(orbit), dtype=dtype)
+
+
+def _reorder_orbit(orbit, vector, only_support):
+    """Generate a stored orbit starting with `vector`.
+
+    The element of the orbit equal to `vector` (or with the same support, if
+    `only_support` is true) is replaced by `vector` itself.
+    """
+    yield vector
+    if only_support:
+        support = frozenset(vector)
+        for x in map(tuple, orbit.tolist()):
+            if frozenset(x) != support:
+                yield x
+    else:
+        for x in map(tuple, orbit.tolist()):
+            if x != vector:
+                yield x
+
+
+# The platform, the graphs and the representations of a worker process of
+# :meth:`OrbitLookupManager.precalculate`. It is set once by the pool
+# initializer.
+_worker_context = None
+
+
+def _init_orbit_worker(platform, graphs, only_support):
+    global _worker_context
+    _worker_context = (platform, graphs, only_support, {})
+
+
+def _enumerate_orbit(task):
+    """Enumerate the orbit of a mapping vector within a pool worker.
+
+    Args:
+        task (tuple): the index of the graph and the mapping vector
+
+    Returns:
+        numpy.ndarray: the orbit (see :func:`_compact_orbit`)
+    """
+    platform, graphs, only_support, representations = _worker_context
+    index, vector = task
+    if index not in representations:
+        representations[index] = SymmetryRepresentation(graphs[index], platform)
+    orbit = representations[index]._allEquivalent(
+        list(vector), only_support=only_support
+    )
+    return _compact_orbit(orbit, len(platform.processors()))
+
+
+class OrbitStore:
+    """A persistent store of mapping orbits.
+
+    The orbits are stored in a :mod:`shelve` database named after the
+    fingerprint of the platform (see :func:`fingerprint_platform`). The
+    database is written only by the process that opened it.
+
+    Args:
+        directory (str): the directory containing the databases. It is
+            created if it does not exist.
+        fingerprint (str): the fingerprint of the platform
+    """
+
+    def __init__(self, directory, fingerprint):
+        directory = to_absolute_path(directory)
+        os.makedirs(directory, exist_ok=True)
+        self.path = os.path.join(directory, f"orbits-{fingerprint}")
+        try:
+            self._shelf = shelve.open(self.path)
+        except dbm.error as e:
+            log.warning(f"Could not open the orbit store {self.path}: {e}")
+            self._shelf = None
+
+    @staticmethod
+    def _key(key):
+        only_support, vector = key
+        return f"{int(only_support)}:" + ",".join(map(str, vector))
+
+    def lookup(self, key):
+        """Load an orbit.
+
+        Args:
+            key (tuple): a flag whether the orbit contains only mappings with
+                different supports and the canonical mapping vector
+
+        Returns:
+            numpy.ndarray: the orbit or ``None`` if it is not stored
+        """
+        if self._shelf is None:
+            return None
+        return self._shelf.get(self._key(key))
+
+    def add(self, key, orbit):
+        """Store an orbit.
+
+        Args:
+            key (tuple): see :meth:`lookup`
+            orbit (numpy.ndarray): the orbit
+        """
+        if self._shelf is not None:
+            self._shelf[self._key(key)] = orbit
+
+    def sync(self):
+        """Write the stored orbits to disk."""
+        if self._shelf is not None:
+            self._shelf.sync()
+
+    def close(self):
+        """Close the database."""
+        if self._shelf is not None:
+            self._shelf.close()
+            self._shelf = None
+
 
 class OrbitLookupEntry:
     """Orbit lookup entry.
@@ -16,18 +169,42 @@ class OrbitLookupEntry:
     oreviously found orbits in a cache. To iterate the values the class return
     the generator obect, which first yields the previously found mappings, then
     it generates new mappings.
+
+    If `orbit` is given, the mappings are generated from this previously
+    calculated orbit. Otherwise, the orbit is enumerated with the
+    representation, and `on_complete` is called with the list of mapping
+    vectors once the enumeration is finished.
     """
 
-    def __init__(self, platform, graph, mapping, only_support=True):
+    def __init__(
+        self,
+        platform,
+        graph,
+        mapping,
+        only_support=True,
+        representation=None,
+        orbit=None,
+        on_complete=None,
+    ):
         self.platform = platform
         self.graph = graph
         self.mapping = mapping
         self._lock = Lock()
-        self._representation = SymmetryRepresentation(graph, platform)
+        if representation is None:
+            representation = SymmetryRepresentation(graph, platform)
+        self._representation = representation
         self._cached_mappings = []
-        self._orbit_generator = self._representation.allEquivalent(
-            mapping, only_support=only_support
-        )
+        vector = tuple(mapping.to_list(channels=False))
+        if orbit is None:
+            self._orbit = []
+            self._on_complete = on_complete
+            self._orbit_generator = representation._allEquivalent(
+                list(vector), only_support=only_support
+            )
+        else:
+            self._orbit = None
+            self._on_complete = None
+            self._orbit_generator = _reorder_orbit(orbit, vector, only_support)
 
     def _at(self, i):
         with self._lock:
@@ -40,10 +217,19 @@ class OrbitLookupEntry:
                     " generated. Mapping must be accessed in-order."
                 )
             try:
-                m = next(self._orbit_generator)
-                self._cached_mappings.append(m)
+                vector = next(self._orbit_generator)
             except StopIteration:
-                m = None
+                if self._on_complete is not None:
+                    self._on_complete(self._orbit)
+                    self._on_complete = None
+                self._orbit = None
+                return None
+            if self._orbit is not None:
+                self._orbit.append(vector)
+            m = self._representation.list_mapper.generate_mapping(list(vector))
+            if hasattr(self.mapping, "metadata"):
+                m.metadata = copy(self.mapping.metadata)
+            self._cached_mappings.append(m)
             return m
 
     def get_generator(self):
@@ -59,23 +245,140 @@ class OrbitLookupManager:
 
     Calculating the orbit takes much time. This class is needed to reduce such
     overhead by caching the already calculated orbits.
+
+    The orbits are cached as arrays of mapping vectors, keyed by the canonical
+    mapping vector. Since the symmetries only depend on the platform, the
+    cached orbits are shared by all graphs and kept when the entries of a
+    graph are removed. At most `cache_size` orbits are kept in memory. If
+    `cache_dir` is given, all orbits are also stored on disk (see
+    :class:`OrbitStore`), such that later runs on the same platform skip the
+    calculation.
+
+    The entries returned by :meth:`get_orbit_entry` keep the mappings
+    generated so far. At most `cache_size` entries are kept as well. An
+    evicted entry is recreated on the next request, from the cached orbit if
+    it is still available.
+
+    Args:
+        platform (Platform): a platform
+        only_support (bool): whether the orbits contain only mappings with
+            different supports
+        cache_size (int): the maximal number of orbits and of orbit entries
+            kept in memory
+        cache_dir (str, optional): the directory of the on-disk orbit store
     """
 
-    def __init__(self, platform, only_support=True):
+    def __init__(
+        self, platform, only_support=True, cache_size=10000, cache_dir=None
+    ):
         self.platform = platform
         self._only_support = only_support
-        self._entries = {}
+        # (graph, mapping) -> OrbitLookupEntry
+        self._entries = LRUCache(cache_size)
+        self._representations = {}
+        self._orbits = LRUCache(cache_size)
+        self._store = None
+        if cache_dir is not None:
+            self._store = OrbitStore(cache_dir, fingerprint_platform(platform))
+
+    def _representation(self, graph):
+        if graph not in self._representations:
+            self._representations[graph] = SymmetryRepresentation(
+                graph, self.platform
+            )
+        return self._representations[graph]
+
+    def _orbit_key(self, graph, mapping):
+        canonical = self._representation(graph).toRepresentation(mapping)
+        return (self._only_support, tuple(int(x) for x in canonical))
+
+    def _lookup_orbit(self, key):
+        orbit = self._orbits.get(key)
+        if orbit is None and self._store is not None:
+            orbit = self._store.lookup(key)
+            if orbit is not None:
+                self._orbits.put(key, orbit)
+        return orbit
+
+    def _add_orbit(self, key, orbit):
+        orbit = _compact_orbit(orbit, len(self.platform.processors()))
+        self._orbits.put(key, orbit)
+        if self._store is not None:
+            self._store.add(key, orbit)
 
     def get_orbit_entry(self, graph, mapping):
         """Lookups the orbits, if not existed, calculates the orbit."""
-        if graph not in self._entries:
-            self._entries[graph] = {}
-        if mapping not in self._entries[graph]:
-            self._entries[graph][mapping] = OrbitLookupEntry(
-                self.platform, graph, mapping, only_support=self._only_support
+        entry = self._entries.get((graph, mapping))
+        if entry is None:
+            key = self._orbit_key(graph, mapping)
+            entry = OrbitLookupEntry(
+                self.platform,
+                graph,
+                mapping,
+                only_support=self._only_support,
+                representation=self._representation(graph),
+                orbit=self._lookup_orbit(key),
+                on_complete=functools.partial(self._add_orbit, key),
+            )
+            self._entries.put((graph, mapping), entry)
+        return entry
+
+    def precalculate(self, graph_mappings, jobs=1):
+        """Calculate the orbits of mappings in advance.
+
+        The orbits, which are neither cached in memory nor in the on-disk
+        store, are enumerated in a pool of worker processes.
+
+        Args:
+            graph_mappings (list of tuple): pairs of a graph and a mapping
+            jobs (int): the number of worker processes
+        """
+        pending = {}
+        graphs = {}
+        for graph, mapping in graph_mappings:
+            key = self._orbit_key(graph, mapping)
+            if key in pending or self._lookup_orbit(key) is not None:
+                continue
+            index = graphs.setdefault(graph, len(graphs))
+            pending[key] = (index, tuple(mapping.to_list(channels=False)))
+        if not pending:
+            return
+
+        log.debug(f"Enumerating {len(pending)} orbits (jobs: {jobs})")
+        graphs = list(graphs)
+        if jobs > 1 and len(pending) > 1:
+            # Forking a process, which already runs threads (e.g., of numba),
+            # can deadlock. The workers are therefore spawned.
+            pool = mp.get_context("spawn").Pool(
+                processes=jobs,
+                initializer=_init_orbit_worker,
+                initargs=(self.platform, graphs, self._only_support),
             )
-        return self._entries[graph][mapping]
+            try:
+                orbits = pool.map(_enumerate_orbit, pending.values())
+            finally:
+                pool.close()
+                pool.join()
+        else:
+            orbits = [
+                self._representation(graphs[index])._allEquivalent(
+                    list(vector), only_support=self._only_support
+                )
+                for index, vector in pending.values()
+            ]
+        for key, orbit in zip(pending, orbits):
+            self._add_orbit(key, orbit)
+        if self._store is not None:
+            self._store.sync()
 
     def remove_graph_orbit_entries(self, graph):
         """Remove graph's orbits entries."""
-        self._entries.pop(graph, None)
+        for key in [k for k in self._entries.keys() if k[0] == graph]:
+            self._entries.pop(key)
+        self._representations.pop(graph, None)
+
+    def close(self):
+        """Close the on-disk orbit store."""
+        if self._store is not None:
+            self._store.close()
+            self._store = None
@@ -17,29 +17,145 @@ import math
 log = logging.getLogger(__name__)
 
 
+class _StateTreeNode:
+    """A node of the k-d tree over the states of a :class:`StateMemoryTable`.
+
+    The keys of the states are tuples of the time followed by the completion
+    ratios of the applications. Each node stores the bounding box of the keys
+    and the maximum energy of all states in its subtree. Leaves store up to
+    ``LEAF_SIZE`` states and are split at the median of the widest dimension
+    when they overflow.
+    """
+
+    LEAF_SIZE = 16
+
+    __slots__ = (
+        "lower",
+        "upper",
+        "max_energy",
+        "states",
+        "axis",
+        "split",
+        "left",
+        "right",
+    )
+
+    def __init__(self, states):
+        self.states = states
+        self.axis = None
+        self.split = None
+        self.left = None
+        self.right = None
+        keys = [key for key, _, _ in states]
+        self.lower = [min(x) for x in zip(*keys)]
+        self.upper = [max(x) for x in zip(*keys)]
+        self.max_energy = max(energy for _, energy, _ in states)
+
+    def insert(self, key, energy, idx):
+        node = self
+        while True:
+            for d, x in enumerate(key):
+                if x < node.lower[d]:
+                    node.lower[d] = x
+                if x > node.upper[d]:
+                    node.upper[d] = x
+            if energy > node.max_energy:
+                node.max_energy = energy
+            if node.states is not None:
+                break
+            node = node.right if key[node.axis] >= node.split else node.left
+        node.states.append((key, energy, idx))
+        if len(node.states) > self.LEAF_SIZE:
+            node._split()
+
+    def _split(self):
+        axis = max(
+            range(len(self.lower)), key=lambda d: self.upper[d] - self.lower[d]
+        )
+        if self.upper[axis] == self.lower[axis]:
+            # all keys are equal, the leaf cannot be split
+            return
+        states = sorted(self.states, key=lambda s: s[0][axis])
+        median = len(states) // 2
+        self.axis = axis
+        self.split = states[median][0][axis]
+        self.left = _StateTreeNode(states[:median])
+        self.right = _StateTreeNode(states[median:])
+        self.states = None
+
+
 class StateMemoryTable:
+    """A table of the minimal energies to finish the jobs from given states.
+
+    A state is described by the time and the completion ratios of the jobs.
+    A stored state covers a queried state if it is not later and each job is
+    at least as far completed. The states are indexed in a k-d tree, such
+    that the lookups do not scan the whole table.
+
+    Args:
+        num_apps (int): the number of jobs
+    """
+
     def __init__(self, num_apps):
         self.__num_apps = num_apps
         self.__table = []
+        self.__tree = None
 
     def find_min_energy_from_state(self, task_comp, time, exclude_list=[]):
+        """Find the maximal energy among the stored states covering a state.
+
+        Args:
+            task_comp (list of float): the completion ratios of the jobs
+            time (float): the time
+            exclude_list (list of int): the indices of stored states to ignore
+
+        Returns:
+            float: the energy or ``None`` if no stored state covers the state
+        """
+        if self.__tree is None:
+            return None
+        exclude = set(exclude_list)
+        max_time = time + TIME_EPS
         max_energy = 0
         found = False
-        for idx, s in enumerate(self.__table):
-            if idx in exclude_list:
+        stack = [self.__tree]
+        while stack:
+            node = stack.pop()
+            if found and node.max_energy <= max_energy:
                 continue
-            if s["time"] > time + TIME_EPS:
+            if node.lower[0] > max_time:
                 continue
-            rs = True
-            for msc, tc in zip(s["task_comp"], task_comp):
-                if msc + TIME_EPS < tc:
-                    rs = False
-                    break
-            if not rs:
+            if any(
+                u + TIME_EPS < tc for u, tc in zip(node.upper[1:], task_comp)
+            ):
                 continue
-            found = True
-            if max_energy < s["min_energy"]:
-                max_energy = s["min_energy"]
+            if (
+                not exclude
+                and node.upper[0] <= max_time
+                and all(
+                    lower + TIME_EPS >= tc
+                    for lower, tc in zip(node.lower[1:], task_comp)
+                )
+            ):
+                # all states in the subtree cover the state
+                found = True
+                max_energy = max(max_energy, node.max_energy)
+                continue
+            if node.states is None:
+                stack.append(node.left)
+                stack.append(node.right)
+                continue
+            for key, energy, idx in node.states:
+                if energy <= max_energy and found:
+                    continue
+                if idx in exclude or key[0] > max_time:
+                    continue
+                if any(
+                    msc + TIME_EPS < tc for msc, tc in zip(key[1:], task_comp)
+                ):
+                    continue
+                found = True
+                max_energy = max(max_energy, energy)
         if found:
             return max_energy
         else:
@@ -60,7 +176,13 @@ class StateMemoryTable:
         s["task_comp"] = task_comp
         s["time"] = time
         s["min_energy"] = min_energy
+        key = (time, *task_comp)
+        idx = len(self.__table)
         self.__table.append(s)
+        if self.__tree is None:
+            self.__tree = _StateTreeNode([(key, min_energy, idx)])
+        else:
+            self.__tree.insert(key, min_energy, idx)
 
     def dump_str(self):
         res = "StateMemoryTable:\n"
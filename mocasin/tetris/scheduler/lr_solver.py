@@ -4,11 +4,13 @@
 # Authors: Robert Khasanov
 
 from collections import Counter
-import copy
 from enum import Flag, auto
 import logging
 import math
 import random
+import weakref
+
+import numpy as np
 
 log = logging.getLogger(__name__)
 
@@ -40,7 +42,10 @@ class LRSolver:
     The selected operating points are x_i^* = argmax_{x_i} f(x_i, lambda*)
 
     The problem is solved by decomposition into a master problem and several
-    subproblems by applying a subgradient method.
+    subproblems by applying a subgradient method. The energy, the execution
+    time and the used processors of the mappings of each job request are
+    converted to arrays once, such that each round of the subgradient method
+    evaluates all mappings of all jobs with a few array operations.
 
     Stefan Wildermann, Michael Glaß, and Jürgen Teich. 2014. Multi-objective
     distributed run-time resource management for many-cores. In Proceedings of
@@ -73,6 +78,17 @@ class LRSolver:
 
         self.__verbose = True
 
+        processor_types = platform.get_processor_types()
+        self.__processor_types = list(processor_types)
+        self.__type_index = {k: i for i, k in enumerate(self.__processor_types)}
+        self.__capacity = np.array(
+            [processor_types[k] for k in self.__processor_types], dtype=float
+        )
+        # request -> (energy, exec_time, resources) arrays of its mappings.
+        # The solver lives as long as the scheduler, so the requests are only
+        # referenced weakly.
+        self.__request_arrays = weakref.WeakKeyDictionary()
+
     @staticmethod
     def default_params():
         """Generate default solver parameters."""
@@ -142,21 +158,79 @@ class LRSolver:
             )
         return res
 
-    @staticmethod
-    def _job_min_cost(job, l):
-        """Find min_{x_i} f(x_i, lambda).
+    def _request_arrays(self, request):
+        """Get the arrays describing the mappings of a job request.
 
-        Returns min_config_name, config, f(min_config, lambda).
+        Returns:
+            A tuple of arrays (energy, exec_time, resources) with a row per
+            mapping. The columns of `resources` count the used processors of
+            each processor type of the platform.
         """
-        assert isinstance(l, tuple)
-        cratio = job.cratio
+        arrays = self.__request_arrays.get(request)
+        if arrays is None:
+            mappings = request.mappings
+            energy = np.array(
+                [m.metadata.energy for m in mappings], dtype=float
+            )
+            exec_time = np.array(
+                [m.metadata.exec_time for m in mappings], dtype=float
+            )
+            resources = np.zeros((len(mappings), len(self.__processor_types)))
+            for i, mapping in enumerate(mappings):
+                for k, v in mapping.get_used_processor_types().items():
+                    resources[i, self.__type_index[k]] = v
+            arrays = (energy, exec_time, resources)
+            self.__request_arrays[request] = arrays
+        return arrays
 
-        configs = [
-            (LRSolver.job_config_cost(job, mapping, l), mapping)
-            for mapping in job.request.mappings
-        ]
-        min_cost, min_mapping = min(configs, key=lambda x: x[0])
-        return min_mapping, min_cost
+    def _jobs_arrays(self, jobs):
+        """Stack the arrays of the remaining part of the jobs.
+
+        Returns:
+            A tuple of arrays (energy, exec_time, resources) with a row per job
+            and a column per mapping. The rows of jobs with less mappings are
+            padded with infinite energy.
+        """
+        arrays = [self._request_arrays(job.request) for job in jobs]
+        width = max((len(e) for e, _, _ in arrays), default=1)
+        energy = np.full((len(jobs), width), math.inf)
+        exec_time = np.zeros((len(jobs), width))
+        resources = np.zeros((len(jobs), width, len(self.__processor_types)))
+        for i, (job, (e, t, r)) in enumerate(zip(jobs, arrays)):
+            rratio = 1.0 - job.cratio
+            energy[i, : len(e)] = e * rratio
+            exec_time[i, : len(t)] = t * rratio
+            resources[i, : len(r)] = r
+        return energy, exec_time, resources
+
+    def __lambda_tuple(self, jobs, l_d, l_r, l_rdp):
+        """Convert the lambda arrays to the tuple (lambda_d, lambda_r,
+        lambda_rdp) accepted by :meth:`job_config_cost`."""
+        if self.__relax_d:
+            l_d = {j.request: float(v) for j, v in zip(jobs, l_d)}
+        else:
+            l_d = None
+        if self.__relax_r:
+            l_r = Counter(
+                {
+                    k: float(v)
+                    for k, v in zip(self.__processor_types, l_r)
+                    if v > 0
+                }
+            )
+        else:
+            l_r = None
+        if self.__relax_rdp:
+            l_rdp = Counter(
+                {
+                    k: float(v)
+                    for k, v in zip(self.__processor_types, l_rdp)
+                    if v > 0
+                }
+            )
+        else:
+            l_rdp = None
+        return tuple((l_d, l_r, l_rdp))
 
     def __initial_lambda(self, jobs):
         """Initiate lambda for all types of constraints.
@@ -185,8 +259,23 @@ class LRSolver:
 
     def solve(self, jobs, segment_start_time=0.0):
         """Run the solver."""
+        verbose = self.__verbose and log.isEnabledFor(logging.DEBUG)
+
         # Initial values
         l = self.__initial_lambda(jobs)
+        num_types = len(self.__processor_types)
+        l_d = np.zeros(len(jobs))
+        if self.__relax_d:
+            l_d = np.array([l[0][j.request] for j in jobs], dtype=float)
+        l_r = np.zeros(num_types)
+        l_rdp = np.zeros(num_types)
+
+        energy, exec_time, resources = self._jobs_arrays(jobs)
+        # t(x_i) * r_k(x_i)
+        rdp = resources * exec_time[:, :, np.newaxis]
+        deadlines = np.array([job.deadline for job in jobs], dtype=float)
+        finite = deadlines != math.inf
+        rows = np.arange(len(jobs))
 
         if self.__relax_rdp:
             window = max(
@@ -200,24 +289,33 @@ class LRSolver:
             # assert window != math.inf, "NYI"
 
         for t in range(1, self.__max_rounds + 1):
-            if self.__verbose:
+            if verbose:
                 log.debug("Round: {}".format(t))
-                self.__log_lambda(l)
+                self.__log_lambda(self.__lambda_tuple(jobs, l_d, l_r, l_rdp))
 
-            # Copy l
-            new_l_d, new_l_r, new_l_rdp = copy.copy(l)
+            new_l_d, new_l_r, new_l_rdp = l_d, l_r, l_rdp
             changed = False
 
+            # Application subproblems: f(x_i, lambda) of all mappings
+            costs = energy.copy()
+            if self.__relax_d:
+                costs += l_d[:, np.newaxis] * exec_time
+            if self.__relax_r:
+                costs += resources @ l_r
+            if self.__relax_rdp:
+                costs += rdp @ l_rdp
+            selected = np.argmin(costs, axis=1)
+
             # Initiate results for found job configs
-            # [(job, config_name, config)]
-            # TODO: Remove explicit config_name
-            min_configs = []
-
-            for job in jobs:
-                # Application subproblem
-                job_mapping, job_cost = LRSolver._job_min_cost(job, l)
-                min_configs.append(tuple((job, job_mapping)))
-                if self.__verbose:
+            # [(job, config)]
+            min_configs = [
+                tuple((job, job.request.mappings[s]))
+                for job, s in zip(jobs, selected)
+            ]
+            if verbose:
+                for (job, job_mapping), job_cost in zip(
+                    min_configs, costs[rows, selected]
+                ):
                     log.debug(
                         "Job {}, mapping = {}, time = {}, energy = {}"
                         " deadline = {}, f = {}".format(
@@ -229,78 +327,36 @@ class LRSolver:
                             job_cost,
                         )
                     )
-                # Calculate subgradient of delay coefficients
-                if self.__relax_d:
-                    if job.deadline == math.inf:
-                        assert False, "NYI"
-                        new_l_d[job.rid] = 0.0
-                    else:
-                        delta = (
-                            LRSolver._job_config_delay(job, job_mapping)
-                            - job.deadline
-                        )
-                        new_l_d[job.request] = max(
-                            0.0,
-                            (
-                                l[0][job.request]
-                                + delta * self.__step_size_delay(t)
-                            ),
-                        )
-                    if new_l_d[job.request] != l[0][job.request]:
-                        changed = True
+
+            # Calculate subgradient of delay coefficients
+            if self.__relax_d:
+                assert finite.all(), "NYI"
+                delta = exec_time[rows, selected] - deadlines
+                new_l_d = np.maximum(
+                    0.0, l_d + delta * self.__step_size_delay(t)
+                )
+                if (new_l_d != l_d).any():
+                    changed = True
 
             # Calculate subgradient of resource coefficients
             if self.__relax_r:
-                delta = sum(
-                    [
-                        LRSolver._job_config_resource(job, mapping)
-                        for job, mapping in min_configs
-                    ],
-                    Counter(),
-                )
-                delta.subtract(self.platform.get_processor_types())
-                # print(l[1])
-                new_l_r = (
-                    Counter(
-                        {
-                            k: l[1][k] + delta[k] * self.__step_size_resource(t)
-                            for k in self.platform.get_processor_types()
-                        }
-                    )
-                    | Counter()
+                delta = resources[rows, selected].sum(axis=0) - self.__capacity
+                new_l_r = np.maximum(
+                    0.0, l_r + delta * self.__step_size_resource(t)
                 )
-                # print(new_l_r)
-                if l[1] != new_l_r:
+                if (new_l_r != l_r).any():
                     changed = True
 
             # Calculate subgradient of rdp coefficients
             if self.__relax_rdp:
-                delta = sum(
-                    [
-                        LRSolver._job_config_rdp(job, mapping)
-                        for job, mapping in min_configs
-                        if job.deadline != math.inf
-                    ],
-                    Counter(),
-                )
-                delta.subtract(
-                    Counter(
-                        {
-                            k: v * window
-                            for k, v in self.platform.get_processor_types().items()
-                        }
-                    )
+                delta = (
+                    rdp[rows, selected][finite].sum(axis=0)
+                    - self.__capacity * window
                 )
-                new_l_rdp = (
-                    Counter(
-                        {
-                            k: l[2][k] + delta[k] * self.__step_size_rdp(t)
-                            for k in self.platform.get_processor_types()
-                        }
-                    )
-                    | Counter()
+                new_l_rdp = np.maximum(
+                    0.0, l_rdp + delta * self.__step_size_rdp(t)
                 )
-                if l[2] != new_l_rdp:
+                if (new_l_rdp != l_rdp).any():
                     changed = True
 
             if not changed:
@@ -310,8 +366,9 @@ class LRSolver:
                         " Stopping iterating."
                     )
                 break
-            l = tuple((new_l_d, new_l_r, new_l_rdp))
+            l_d, l_r, l_rdp = new_l_d, new_l_r, new_l_rdp
 
+        l = self.__lambda_tuple(jobs, l_d, l_r, l_rdp)
         log.debug("Returned the following lambda coefficients:")
         self.__log_lambda(l)
         return l, min_configs
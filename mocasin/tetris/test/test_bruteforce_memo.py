@@ -0,0 +1,70 @@
+# Copyright (C) 2026 TU Dresden
+# Licensed under the ISC license (see LICENSE.txt)
+
+import random
+
+from mocasin.tetris.job_request import JobRequestInfo
+from mocasin.tetris.job_state import Job
+from mocasin.tetris.schedule import TIME_EPS
+from mocasin.tetris.scheduler.bruteforce import BruteforceScheduler
+from mocasin.tetris.scheduler.bruteforce_memo import (
+    BruteforceMemoScheduler,
+    StateMemoryTable,
+)
+
+
+def find_min_energy_linear(states, task_comp, time, exclude_list=()):
+    energies = [
+        energy
+        for idx, (comp, t, energy) in enumerate(states)
+        if idx not in exclude_list
+        and t <= time + TIME_EPS
+        and all(msc + TIME_EPS >= tc for msc, tc in zip(comp, task_comp))
+    ]
+    return max([0] + energies) if energies else None
+
+
+def test_state_memory_table():
+    rng = random.Random(42)
+    num_apps = 3
+    table = StateMemoryTable(num_apps)
+    states = []
+
+    def random_state():
+        # a coarse grid produces states on the borders of the queries
+        comp = [rng.randrange(5) / 4 for _ in range(num_apps)]
+        return comp, rng.randrange(10) / 2
+
+    assert table.find_min_energy_from_state([0.0] * num_apps, 0.0) is None
+    for _ in range(500):
+        comp, time = random_state()
+        energy = rng.uniform(0, 100)
+        table.add_state(comp, time, energy)
+        current = find_min_energy_linear(states, comp, time)
+        if current is None or energy > current + 0.00001:
+            states.append((comp, time, energy))
+        assert table.size() == len(states)
+
+        comp, time = random_state()
+        exclude_list = rng.sample(range(len(states)), min(3, len(states)))
+        assert table.find_min_energy_from_state(
+            comp, time
+        ) == find_min_energy_linear(states, comp, time)
+        assert table.find_min_energy_from_state(
+            comp, time, exclude_list
+        ) == find_min_energy_linear(states, comp, time, exclude_list)
+
+
+def test_bruteforce_memo_scheduler(platform, graph, pareto_mappings):
+    jobs = [
+        Job.from_request(
+            JobRequestInfo(graph, pareto_mappings, arrival=0.0, deadline=d)
+        )
+        for d in [12.0, 15.0, 20.0]
+    ]
+    for job in jobs:
+        job.dispatch()
+    kwargs = {"bf_dump_steps": 1000, "dump_mem_table": False}
+    expected = BruteforceScheduler(platform, **kwargs).schedule(jobs)
+    schedule = BruteforceMemoScheduler(platform, **kwargs).schedule(jobs)
+    assert abs(schedule.energy - expected.energy) < 0.00001
@@ -0,0 +1,56 @@
+# Copyright (C) 2026 TU Dresden
+# Licensed under the ISC license (see LICENSE.txt)
+
+import gc
+import random
+
+from mocasin.tetris.job_request import JobRequestInfo
+from mocasin.tetris.job_state import Job
+from mocasin.tetris.scheduler.lr_solver import LRConstraint, LRSolver
+
+
+def test_lr_solver(platform, graph, pareto_mappings):
+    jobs = []
+    for deadline, cratio in [(10.0, 0.0), (8.0, 0.5), (12.0, 0.2)]:
+        request = JobRequestInfo(
+            graph,
+            pareto_mappings,
+            arrival=0.0,
+            deadline=deadline,
+            start_cratio=cratio,
+        )
+        jobs.append(Job.from_request(request))
+    constraints = LRConstraint.RESOURCE | LRConstraint.DELAY | LRConstraint.RDP
+
+    for rounds in range(1, 5):
+        random.seed(42)
+        solver = LRSolver(platform, constraints, rounds - 1)
+        if rounds == 1:
+            # lambda_d is initialized randomly
+            random.seed(42)
+            lambdas = solver._LRSolver__initial_lambda(jobs)
+        else:
+            lambdas, _ = solver.solve(jobs)
+
+        random.seed(42)
+        solver = LRSolver(platform, constraints, rounds)
+        _, min_configs = solver.solve(jobs)
+        # the selected mappings minimize the cost under the previous lambda
+        assert [j for j, _ in min_configs] == jobs
+        for job, mapping in min_configs:
+            costs = [
+                LRSolver.job_config_cost(job, m, lambdas)
+                for m in job.request.mappings
+            ]
+            assert LRSolver.job_config_cost(job, mapping, lambdas) == min(costs)
+
+
+def test_lr_solver_releases_requests(platform, graph, pareto_mappings):
+    request = JobRequestInfo(graph, pareto_mappings, arrival=0.0, deadline=10.0)
+    solver = LRSolver(platform, LRConstraint.RESOURCE, 1)
+    solver.solve([Job.from_request(request)])
+    arrays = solver._LRSolver__request_arrays
+    assert len(arrays) == 1
+    del request
+    gc.collect()
+    assert len(arrays) == 0
@@ -54,3 +54,86 @@ def test_orbit_support_generator(platform, graph, mapping):
     orbit_list = [x for x in orbit_entry.get_generator()]
     assert len(orbit_entry._cached_mappings) == 6
     assert len(orbit_list) == 6
+
+
+def test_orbit_cache(platform, graph, mapping, tmp_path):
+    orbit_lookup_manager = OrbitLookupManager(
+        platform, only_support=False, cache_dir=tmp_path
+    )
+    orbit_entry = orbit_lookup_manager.get_orbit_entry(graph, mapping)
+    orbit_list = [m.to_list() for m in orbit_entry.get_generator()]
+    assert len(orbit_lookup_manager._orbits) == 1
+
+    # An equivalent mapping reuses the cached orbit
+    other = orbit_entry._cached_mappings[3]
+    other_entry = orbit_lookup_manager.get_orbit_entry(graph, other)
+    assert other_entry._orbit is None
+    other_list = [m.to_list() for m in other_entry.get_generator()]
+    assert other_list[0] == other.to_list()
+    assert sorted(other_list) == sorted(orbit_list)
+    assert other_entry._cached_mappings[0].metadata is not other.metadata
+
+    # The cached orbits are kept when the graph entries are removed
+    orbit_lookup_manager.remove_graph_orbit_entries(graph)
+    orbit_entry = orbit_lookup_manager.get_orbit_entry(graph, mapping)
+    assert orbit_entry._orbit is None
+    assert [m.to_list() for m in orbit_entry.get_generator()] == orbit_list
+    orbit_lookup_manager.close()
+
+    # A new manager loads the orbit from disk
+    orbit_lookup_manager = OrbitLookupManager(
+        platform, only_support=False, cache_size=1, cache_dir=tmp_path
+    )
+    orbit_entry = orbit_lookup_manager.get_orbit_entry(graph, mapping)
+    assert orbit_entry._orbit is None
+    assert [m.to_list() for m in orbit_entry.get_generator()] == orbit_list
+    orbit_lookup_manager.close()
+
+
+def test_orbit_precalculate(platform, graph, pareto_mappings):
+    orbit_lookup_manager = OrbitLookupManager(platform, only_support=True)
+    expected = [
+        [
+            m.to_list()
+            for m in orbit_lookup_manager.get_orbit_entry(
+                graph, mapping
+            ).get_generator()
+        ]
+        for mapping in pareto_mappings
+    ]
+
+    for jobs in [1, 2]:
+        orbit_lookup_manager = OrbitLookupManager(platform, only_support=True)
+        orbit_lookup_manager.precalculate(
+            [(graph, mapping) for mapping in pareto_mappings], jobs=jobs
+        )
+        # the mappings belong to two orbits
+        assert len(orbit_lookup_manager._orbits) == 2
+        for mapping, orbit_list in zip(pareto_mappings, expected):
+            entry = orbit_lookup_manager.get_orbit_entry(graph, mapping)
+            assert entry._orbit is None
+            result = [m.to_list() for m in entry.get_generator()]
+            assert result[0] == orbit_list[0]
+            assert sorted(result) == sorted(orbit_list)
+
+
+def test_orbit_entries_bounded(platform, graph, pareto_mappings):
+    orbit_lookup_manager = OrbitLookupManager(
+        platform, only_support=True, cache_size=1
+    )
+    entries = [
+        orbit_lookup_manager.get_orbit_entry(graph, mapping)
+        for mapping in pareto_mappings
+    ]
+    for entry in entries:
+        list(entry.get_generator())
+    assert len(orbit_lookup_manager._entries) == 1
+    assert len(orbit_lookup_manager._orbits) == 1
+    # the most recent entry is reused, an evicted one is recreated
+    last, first = pareto_mappings[-1], pareto_mappings[0]
+    assert orbit_lookup_manager.get_orbit_entry(graph, last) is entries[-1]
+    entry = orbit_lookup_manager.get_orbit_entry(graph, first)
+    assert entry is not entries[0]
+    assert [m.to_list() for m in entry.get_generator()] == [
+        m.to_list() for m in entries[0].get_generator()
+    ]
@@ -11,10 +11,19 @@ logger = logging.getLogger("tgff_parser_test")
 
 
 @pytest.fixture
-def graph_dict():
+def cords_data():
     parser = Parser()
-    data = parser.parse_file("examples/tgff/e3s-0.9/auto-indust-cords.tgff", [])
-    return data[0]
+    return parser.parse_file("examples/tgff/e3s-0.9/auto-indust-cords.tgff", [])
+
+
+@pytest.fixture
+def graph_dict(cords_data):
+    return cords_data[0]
+
+
+@pytest.fixture
+def cords_processor_list(cords_data):
+    return cords_data[1]
 
 
 @pytest.fixture
@@ -0,0 +1,47 @@
+# Copyright (C) 2026 TU Dresden
+# Licensed under the ISC license (see LICENSE.txt)
+
+import pytest
+
+from mocasin.common.trace import SegmentType
+from mocasin.tgff.trace import TgffTrace
+
+
+def test_tgff_trace(graph_dict, cords_processor_list):
+    processors = {p.type: p for p in cords_processor_list}
+    for tgff_graph in graph_dict.values():
+        trace = TgffTrace(processors, tgff_graph, 3)
+        for task, task_type in tgff_graph.tasks.items():
+            segments = list(trace.get_trace(task))
+            # reads from all input channels, computes and writes to all
+            # output channels in every iteration
+            inputs = [
+                c
+                for c, props in tgff_graph.channels.items()
+                if props[1] == task
+            ]
+            outputs = [
+                c
+                for c, props in tgff_graph.channels.items()
+                if props[0] == task
+            ]
+            expected = (
+                [(SegmentType.READ_TOKEN, c) for c in inputs]
+                + [(SegmentType.COMPUTE, None)]
+                + [(SegmentType.WRITE_TOKEN, c) for c in outputs]
+            ) * 3
+            assert [
+                (s.segment_type, getattr(s, "channel", None)) for s in segments
+            ] == expected
+            compute = segments[len(inputs)]
+            assert compute.processor_cycles == {
+                t: p.get_operation(task_type) for t, p in processors.items()
+            }
+
+            # the segments of a task are created only once
+            loop = trace.get_trace_loop(task)
+            assert loop.body is trace.get_trace_loop(task).body
+            assert all(s is b for s, b in zip(segments, loop.body * 3))
+
+        with pytest.raises(RuntimeError):
+            trace.get_trace_loop("unknown")
@@ -7,6 +7,7 @@ from mocasin.common.trace import (
     DataflowTrace,
     ComputeSegment,
     ReadTokenSegment,
+    TraceLoop,
     WriteTokenSegment,
 )
 
@@ -30,6 +31,19 @@ class TgffTrace(DataflowTrace):
         self._repetitions = repetitions
         self._tgff_graph = tgff_graph
 
+        # the names of the input and output channels of each task, in the
+        # order of the channels in the graph
+        self._inputs = {}
+        self._outputs = {}
+        for channel_name, properties in tgff_graph.channels.items():
+            # properties[0] and properties[1] are the names of the channel's
+            # source and sink task
+            self._outputs.setdefault(properties[0], []).append(channel_name)
+            self._inputs.setdefault(properties[1], []).append(channel_name)
+        # the segments of a single execution of each task. Since segments are
+        # immutable, they are shared by all iterations and all traces.
+        self._bodies = {}
+
     def get_trace(self, process):
         """Get the trace for a specific task in the TGFF graph
 
@@ -40,10 +54,28 @@ class TgffTrace(DataflowTrace):
             ComputeSegment, ReadTokenSegment, or WriteTokenSegment: The next
                 segment in the process trace
         """
-        task_name = process
+        yield from self.get_trace_loop(process)
+
+    def get_trace_loop(self, process):
+        """Get the trace for a specific task compressed as a loop
+
+        Each loop iteration contains a single execution of the task.
+
+        Args:
+            process (str): Name of the task to get a trace for
+
+        Returns:
+            TraceLoop: the compressed trace
+        """
+        body = self._bodies.get(process)
+        if body is None:
+            body = self._bodies[process] = self._make_body(process)
+        return TraceLoop(body=body, repetitions=self._repetitions)
 
+    def _make_body(self, task_name):
+        """Create the segments of a single execution of a task."""
         if task_name not in self._tgff_graph.tasks:
-            raise RuntimeError(f"Unknown task! ({process})")
+            raise RuntimeError(f"Unknown task! ({task_name})")
 
         # prepare a dict of computation cycles for all processor types
         processor_cycles = {}
@@ -52,23 +84,16 @@ class TgffTrace(DataflowTrace):
                 self._tgff_graph.tasks[task_name]
             )
 
-        # iterate over all repetitions
-        for _ in range(0, self._repetitions):
-            # First, the task reads from all input channels
-            for channel_name, properties in self._tgff_graph.channels.items():
-                # properties[1] is the name of the channel's sink task
-                # FIXME: This mechanism should be simplified or the variable
-                # named property
-                if task_name == properties[1]:
-                    yield ReadTokenSegment(channel=channel_name, num_tokens=1)
-
-            # Then, it computes
-            yield ComputeSegment(processor_cycles)
-
-            # Finally, it writes to all output channels
-            for channel_name, properties in self._tgff_graph.channels.items():
-                # properties[0] is the name of the channel's source task
-                # FIXME: This mechanism should be simplified or the variable
-                # named property
-                if task_name == properties[0]:
-                    yield WriteTokenSegment(channel=channel_name, num_tokens=1)
+        # First, the task reads from all input channels
+        body = [
+            ReadTokenSegment(channel=channel_name, num_tokens=1)
+            for channel_name in self._inputs.get(task_name, ())
+        ]
+        # Then, it computes
+        body.append(ComputeSegment(processor_cycles))
+        # Finally, it writes to all output channels
+        body.extend(
+            WriteTokenSegment(channel=channel_name, num_tokens=1)
+            for channel_name in self._outputs.get(task_name, ())
+        )
+        return tuple(body)
@@ -0,0 +1,37 @@
+# Copyright (C) 2026 TU Dresden
+# Licensed under the ISC license (see LICENSE.txt)
+
+import contextlib
+import os
+import tempfile
+
+
+@contextlib.contextmanager
+def atomic_write(path, mode="wb"):
+    """Open a file for writing, which replaces `path` atomically on success.
+
+    The content is written to a temporary file in the directory of `path`,
+    which replaces `path` only after it was written completely. Thus,
+    concurrent readers never see a partially written file. If writing fails,
+    the temporary file is removed and `path` is left untouched.
+
+    Args:
+        path (str): the path of the file
+        mode (str, optional): the mode the temporary file is opened with.
+            Defaults to "wb".
+
+    Yields:
+        file: the opened temporary file
+
+    Raises:
+        OSError: if the temporary file cannot be created or written
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    try:
+        with os.fdopen(fd, mode) as f:
+            yield f
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.remove(tmp_path)
+        raise
@@ -0,0 +1,75 @@
+# Copyright (C) 2026 TU Dresden
+# Licensed under the ISC license (see LICENSE.txt)
+
+from collections import OrderedDict
+
+
+class LRUCache:
+    """A bounded mapping, which evicts the least recently used entries.
+
+    Both :meth:`get` and :meth:`put` mark an entry as recently used, while
+    membership tests and iteration do not change the order of the entries.
+
+    Args:
+        capacity (int, optional): maximum number of entries. If ``None``, the
+            cache is unbounded. Defaults to ``None``.
+    """
+
+    def __init__(self, capacity=None):
+        if capacity is not None and capacity < 1:
+            raise ValueError("The cache capacity must be at least 1")
+        self.capacity = capacity
+        self._entries = OrderedDict()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    def get(self, key, default=None):
+        """Look up an entry and mark it as recently used.
+
+        Returns:
+            the value of `key` or `default` if `key` is not cached
+        """
+        try:
+            value = self._entries[key]
+        except KeyError:
+            return default
+        self._entries.move_to_end(key)
+        return value
+
+    def put(self, key, value):
+        """Add or replace an entry and mark it as recently used.
+
+        Evicts the least recently used entries if the cache grows beyond its
+        capacity.
+
+        Returns:
+            int: the number of evicted entries
+        """
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        evicted = 0
+        if self.capacity is not None:
+            while len(self._entries) > self.capacity:
+                self._entries.popitem(last=False)
+                evicted += 1
+        return evicted
+
+    def pop(self, key, default=None):
+        """Remove an entry.
+
+        Returns:
+            the value of `key` or `default` if `key` is not cached
+        """
+        return self._entries.pop(key, default)
+
+    def keys(self):
+        """Get the keys from the least to the most recently used."""
+        return self._entries.keys()
+
+    def items(self):
+        """Get the entries from the least to the most recently used."""
+        return self._entries.items()
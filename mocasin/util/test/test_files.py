@@ -0,0 +1,21 @@
+# Copyright (C) 2026 TU Dresden
+# Licensed under the ISC license (see LICENSE.txt)
+
+import pytest
+
+from mocasin.util.files import atomic_write
+
+
+def test_atomic_write(tmpdir):
+    path = tmpdir.join("file.txt")
+    with atomic_write(str(path), "w") as f:
+        f.write("first")
+    assert path.read() == "first"
+
+    # a failed write leaves the file untouched
+    with pytest.raises(RuntimeError):
+        with atomic_write(str(path), "w") as f:
+            f.write("second")
+            raise RuntimeError()
+    assert path.read() == "first"
+    assert tmpdir.listdir() == [path]
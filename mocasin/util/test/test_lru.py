@@ -0,0 +1,34 @@
+# Copyright (C) 2026 TU Dresden
+# Licensed under the ISC license (see LICENSE.txt)
+
+import pytest
+
+from mocasin.util.lru import LRUCache
+
+
+def test_lru_cache():
+    cache = LRUCache(capacity=2)
+    assert cache.put("a", 1) == 0
+    assert cache.put("b", 2) == 0
+    # touch "a", so that "b" becomes the least recently used entry
+    assert cache.get("a") == 1
+    assert "b" in cache
+    assert cache.put("c", 3) == 1
+    assert len(cache) == 2
+    assert "b" not in cache
+    assert cache.get("b", 0) == 0
+    assert list(cache.items()) == [("a", 1), ("c", 3)]
+    assert cache.pop("a") == 1
+    assert list(cache.keys()) == ["c"]
+
+
+def test_lru_cache_unbounded():
+    cache = LRUCache()
+    for i in range(100):
+        assert cache.put(i, i) == 0
+    assert len(cache) == 100
+
+
+def test_lru_cache_capacity():
+    with pytest.raises(ValueError):
+        LRUCache(capacity=0)